@@ -0,0 +1,117 @@
+"""Benchmark audio preprocessing: streaming ffmpeg pipe vs. in-memory pydub.
+
+Generates synthetic stereo 44.1kHz recordings and runs each preprocessing path
+in a fresh subprocess, reporting wall time and the peak RSS of that process.
+
+Usage:
+    python benchmarks/audio_preprocessing.py
+    python benchmarks/audio_preprocessing.py --minutes 10 60 120 --format m4a
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+PATHS = ("pydub", "streaming")
+
+
+def generate_input(output_path: Path, minutes: int) -> None:
+    """Generate a stereo 44.1kHz test recording with ffmpeg.
+
+    Args:
+        output_path: Where to write the recording (extension picks the codec)
+        minutes: Duration in minutes
+    """
+    source = (
+        "aevalsrc=0.3*sin(2*PI*220*t)*(1+0.5*sin(2*PI*0.2*t))"
+        "|0.2*sin(2*PI*330*t)"
+        f":s=44100:d={minutes * 60}"
+    )
+    subprocess.run(
+        ["ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error", "-y",
+         "-f", "lavfi", "-i", source, "-ac", "2", str(output_path)],
+        check=True
+    )
+
+
+def run_worker(path_name: str, input_path: Path) -> None:
+    """Process one file in this process and print measurements as JSON.
+
+    Args:
+        path_name: "pydub" or "streaming"
+        input_path: Audio file to process
+    """
+    from src.audio.processor import AudioProcessor
+
+    processor = AudioProcessor(normalize=True, sample_rate=16000, streaming=path_name == "streaming")
+
+    start = time.perf_counter()
+    output_path = processor.process(input_path)
+    elapsed = time.perf_counter() - start
+
+    AudioProcessor.cleanup(output_path)
+
+    # ru_maxrss is KiB on Linux
+    print(json.dumps({
+        "wall_seconds": elapsed,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }))
+
+
+def measure(path_name: str, input_path: Path) -> dict:
+    """Run a worker subprocess and collect its measurements.
+
+    Args:
+        path_name: "pydub" or "streaming"
+        input_path: Audio file to process
+
+    Returns:
+        Measurement dict
+    """
+    result = subprocess.run(
+        [sys.executable, __file__, "--worker", path_name, str(input_path)],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--minutes", type=int, nargs="+", default=[10, 60, 120])
+    parser.add_argument("--format", default="m4a", choices=["m4a", "mp3", "wav"])
+    parser.add_argument("--paths", nargs="+", default=list(PATHS), choices=PATHS)
+    parser.add_argument("--worker", nargs=2, metavar=("PATH", "INPUT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker[0], Path(args.worker[1]))
+        return 0
+
+    print(f"{'input':>8} {'path':>10} {'wall (s)':>10} {'peak RSS (MB)':>14}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for minutes in args.minutes:
+            input_path = Path(tmp) / f"bench_{minutes}min.{args.format}"
+            generate_input(input_path, minutes)
+            for path_name in args.paths:
+                stats = measure(path_name, input_path)
+                print(
+                    f"{minutes:>5}min {path_name:>10} {stats['wall_seconds']:>10.2f} "
+                    f"{stats['peak_rss_mb']:>14.1f}"
+                )
+            input_path.unlink()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,29 +1,48 @@
 """GPT-4o mini chatbot for Q&A about transcripts."""
 
-from typing import List, Dict
+from typing import AsyncIterator, List, Dict, Optional
 
 from loguru import logger
-from openai import AsyncOpenAI
 
+from src.chat.memory import ConversationMemory
+from src.chat.retrieval import TranscriptIndex, estimate_tokens, format_timestamped_segment
 from src.utils.exceptions import APIError
 from src.utils.models import TranscriptResult, Summary
+from src.utils.openai_clients import get_openai_client
+from src.utils.provider_scheduler import estimate_request_tokens, provider_scheduler
 
 
 class Chatbot:
     """Interactive Q&A about meeting transcripts using GPT-4o mini."""
 
-    def __init__(self, api_key: str, model: str = "gpt-4o-mini"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o-mini",
+        embedding_model: Optional[str] = None,
+        memory: Optional[ConversationMemory] = None
+    ):
         """Initialize chatbot.
 
         Args:
             api_key: OpenAI API key
             model: Model name (default: gpt-4o-mini)
+            embedding_model: Embedding model for retrieval (None: lexical only)
+            memory: Conversation memory bounding the history sent per request
         """
         self.api_key = api_key
         self.model = model
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.embedding_model = embedding_model
+        self.client = get_openai_client(api_key)
         self.conversation_history: List[Dict[str, str]] = []
         self.system_prompt = ""
+        self.memory = memory or ConversationMemory()
+
+        # Retrieval mode (see set_retrieval_context)
+        self.index: Optional[TranscriptIndex] = None
+        self.summary_text = ""
+        self.retrieval_top_k = 12
+        self.retrieval_token_budget = 3000
 
     def set_context(self, transcript: TranscriptResult, summary: Summary) -> None:
         """Set the context for the chatbot.
@@ -49,6 +68,8 @@ Full Transcript:
 
 Answer questions accurately based on the transcript. If information is not in the transcript, say so clearly."""
 
+        self.index = None
+
         # Initialize conversation with system prompt
         self.conversation_history = [
             {"role": "system", "content": self.system_prompt}
@@ -56,6 +77,100 @@ Answer questions accurately based on the transcript. If information is not in th
 
         logger.debug("Chatbot context set with transcript and summary")
 
+    def set_system_prompt(self, system_prompt: str) -> None:
+        """Set a prebuilt full-context system prompt (see set_context).
+
+        Lets callers reuse the prompt across questions instead of
+        reformatting the transcript each time.
+
+        Args:
+            system_prompt: System prompt previously built by set_context
+        """
+        self.system_prompt = system_prompt
+        self.index = None
+        self.conversation_history = [
+            {"role": "system", "content": self.system_prompt}
+        ]
+
+    def set_retrieval_context(
+        self,
+        summary: Summary,
+        index: TranscriptIndex,
+        top_k: int = 12,
+        token_budget: int = 3000
+    ) -> None:
+        """Set a retrieval context: summary plus per-question excerpts.
+
+        Instead of the full transcript, each question gets the summary and
+        the ``top_k`` most relevant segments that fit in ``token_budget``.
+
+        Args:
+            summary: Meeting summary
+            index: Index over the transcript segments
+            top_k: Segments retrieved per question
+            token_budget: Maximum estimated tokens of transcript excerpts
+        """
+        self.index = index
+        self.summary_text = self._format_summary(summary)
+        self.retrieval_top_k = top_k
+        self.retrieval_token_budget = token_budget
+        self.system_prompt = self._retrieval_prompt("")
+        self.conversation_history = [
+            {"role": "system", "content": self.system_prompt}
+        ]
+
+        logger.debug(f"Chatbot retrieval context set ({len(index.segments)} indexed segments)")
+
+    async def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts with the configured embedding model.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One vector per text
+        """
+        response = await provider_scheduler.call(
+            "openai",
+            lambda: self.client.embeddings.create(model=self.embedding_model, input=texts),
+            tokens=sum(estimate_tokens(text) for text in texts),
+            key=self.api_key
+        )
+        return [item.embedding for item in response.data]
+
+    async def _prepare_question(self, user_question: str) -> None:
+        """Refresh the system prompt with excerpts for a question (retrieval mode)."""
+        if self.index is None:
+            return
+
+        # Include the previous question so follow-ups ("and who owns it?") keep their topic
+        previous = [m["content"] for m in self.conversation_history if m["role"] == "user"][-1:]
+        query = " ".join(previous + [user_question])
+
+        results = await self.index.search(
+            query,
+            self.retrieval_top_k,
+            embed=self.embed_texts if self.embedding_model else None
+        )
+        excerpts = TranscriptIndex.fit_budget(results, self.retrieval_token_budget)
+
+        self.system_prompt = self._retrieval_prompt(
+            "\n".join(format_timestamped_segment(r.segment) for r in excerpts)
+        )
+        self.conversation_history[0] = {"role": "system", "content": self.system_prompt}
+
+    def _retrieval_prompt(self, excerpts: str) -> str:
+        """Build the retrieval-mode system prompt."""
+        return f"""You are a helpful assistant analyzing a meeting transcript. Answer questions about the meeting based on the information provided.
+
+Meeting Summary:
+{self.summary_text}
+
+Relevant Transcript Excerpts ([mm:ss] is the time in the meeting):
+{excerpts or "(no matching excerpts)"}
+
+The excerpts were selected for the current question and are only part of the transcript. Answer accurately based on the summary and excerpts. If the information is not there, say so clearly."""
+
     async def chat(self, user_question: str) -> str:
         """Answer a user question about the transcript.
 
@@ -69,6 +184,8 @@ Answer questions accurately based on the transcript. If information is not in th
             APIError: If chat fails
         """
         try:
+            await self._prepare_question(user_question)
+
             # Add user question to history
             self.conversation_history.append({
                 "role": "user",
@@ -76,11 +193,17 @@ Answer questions accurately based on the transcript. If information is not in th
             })
 
             # Call GPT-4o mini
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=self.conversation_history,
-                temperature=0.7,
-                max_tokens=500
+            messages = self._request_messages()
+            response = await provider_scheduler.call(
+                "openai",
+                lambda: self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=0.7,
+                    max_tokens=500
+                ),
+                tokens=estimate_request_tokens(messages, 500),
+                key=self.api_key
             )
 
             # Extract assistant response
@@ -98,6 +221,82 @@ Answer questions accurately based on the transcript. If information is not in th
             logger.error(f"Chat failed: {e}")
             raise APIError(f"Chat error: {e}")
 
+    async def chat_stream(self, user_question: str) -> AsyncIterator[str]:
+        """Answer a user question, yielding the response as it is generated.
+
+        The assembled response is added to the conversation history once the
+        stream finishes.
+
+        Args:
+            user_question: User's question
+
+        Yields:
+            Response text deltas
+
+        Raises:
+            APIError: If chat fails
+        """
+        try:
+            await self._prepare_question(user_question)
+
+            self.conversation_history.append({
+                "role": "user",
+                "content": user_question
+            })
+
+            # Retries stop once the stream has started
+            messages = self._request_messages()
+            stream = await provider_scheduler.call(
+                "openai",
+                lambda: self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=0.7,
+                    max_tokens=500,
+                    stream=True
+                ),
+                tokens=estimate_request_tokens(messages, 500),
+                key=self.api_key
+            )
+
+            parts: List[str] = []
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    yield delta
+
+            self.conversation_history.append({
+                "role": "assistant",
+                "content": "".join(parts)
+            })
+
+        except Exception as e:
+            logger.error(f"Streaming chat failed: {e}")
+            raise APIError(f"Chat error: {e}")
+
+    def _request_messages(self) -> List[Dict[str, str]]:
+        """System prompt plus the history window allowed by memory."""
+        return self.conversation_history[:1] + self.memory.window(self.conversation_history[1:])
+
+    async def compact_memory(self) -> List[Dict[str, str]]:
+        """Fold older turns into the memory summary once enough accumulate.
+
+        Folded messages are removed from ``conversation_history``.
+
+        Returns:
+            Messages that were folded (empty if none)
+        """
+        older, recent = self.memory.split_for_compaction(self.conversation_history[1:])
+        if not older:
+            return []
+
+        await self.memory.fold(self.client, self.model, older)
+        self.conversation_history = self.conversation_history[:1] + recent
+        return older
+
     def get_conversation_history(self) -> List[Dict[str, str]]:
         """Get conversation history (excluding system prompt).
 
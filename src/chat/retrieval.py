@@ -0,0 +1,237 @@
+"""Retrieval over transcript segments for chat.
+
+Instead of sending the full transcript with every question, the chatbot can
+index the segments once and send only the ones relevant to each question.
+Ranking is lexical (Okapi BM25 over speaker + text) and, when segment
+embeddings have been computed, fused with cosine similarity using
+reciprocal rank fusion.
+"""
+
+import math
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from src.utils.models import TranscriptSegment
+
+# numpy makes vector scoring much faster, but is not required
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except (ImportError, ModuleNotFoundError):
+    NUMPY_AVAILABLE = False
+    np = None  # type: ignore
+
+
+# Batch of texts -> one embedding vector per text
+EmbedFunction = Callable[[List[str]], Awaitable[List[List[float]]]]
+
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+RRF_K = 60  # Reciprocal rank fusion damping constant
+EMBED_BATCH_SIZE = 256
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens (any script).
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        Word tokens
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate the LLM token count of a text.
+
+    Uses ~3 characters per token, which overestimates English slightly and
+    is close for Hebrew.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated token count
+    """
+    return math.ceil(len(text) / 3)
+
+
+def format_segment(segment: TranscriptSegment) -> str:
+    """Format a segment as a transcript line."""
+    return f"{segment.speaker}: {segment.text}"
+
+
+def format_timestamped_segment(segment: TranscriptSegment) -> str:
+    """Format a segment as a transcript line with its start time."""
+    minutes, seconds = divmod(int(segment.start_time), 60)
+    return f"[{minutes:02d}:{seconds:02d}] {segment.speaker}: {segment.text}"
+
+
+@dataclass
+class RetrievedSegment:
+    """A segment selected for a question."""
+    position: int  # Index in the transcript
+    segment: TranscriptSegment
+    score: float
+
+
+class TranscriptIndex:
+    """BM25 index (with optional embeddings) over a transcript's segments."""
+
+    def __init__(self, segments: Sequence[TranscriptSegment], k1: float = 1.5, b: float = 0.75):
+        """Build the lexical index.
+
+        Args:
+            segments: Transcript segments, in order
+            k1: BM25 term frequency saturation
+            b: BM25 length normalization
+        """
+        self.segments = list(segments)
+        self.k1 = k1
+        self.b = b
+
+        self._postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        self._lengths: List[int] = []
+        for position, segment in enumerate(self.segments):
+            terms = tokenize(format_segment(segment))
+            self._lengths.append(len(terms))
+            for term, count in Counter(terms).items():
+                self._postings[term].append((position, count))
+
+        doc_count = len(self.segments)
+        self._avg_length = (sum(self._lengths) / doc_count) if doc_count else 0.0
+        self._idf = {
+            term: math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for term, postings in self._postings.items()
+        }
+        self._vectors = None
+        self._norms: List[float] = []
+
+        self.transcript_tokens = sum(estimate_tokens(format_segment(s)) + 1 for s in self.segments)
+
+    @property
+    def has_embeddings(self) -> bool:
+        """Whether segment embeddings have been computed."""
+        return self._vectors is not None
+
+    async def embed(self, embed: EmbedFunction, batch_size: int = EMBED_BATCH_SIZE) -> None:
+        """Compute and store an embedding vector for every segment.
+
+        Args:
+            embed: Embedding function (texts -> vectors)
+            batch_size: Segments per embedding request
+        """
+        texts = [format_segment(s) for s in self.segments]
+        vectors: List[List[float]] = []
+        for start in range(0, len(texts), batch_size):
+            vectors.extend(await embed(texts[start:start + batch_size]))
+
+        if NUMPY_AVAILABLE:
+            matrix = np.asarray(vectors, dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            self._vectors = matrix / np.maximum(norms, 1e-12)
+        else:
+            self._vectors = vectors
+            self._norms = [math.sqrt(sum(x * x for x in v)) or 1.0 for v in vectors]
+
+        logger.debug(f"Embedded {len(vectors)} transcript segments")
+
+    def lexical_scores(self, query: str) -> Dict[int, float]:
+        """Score segments against a query with BM25.
+
+        Args:
+            query: Question text
+
+        Returns:
+            Dict mapping segment position to score (matching segments only)
+        """
+        scores: Dict[int, float] = defaultdict(float)
+        for term in set(tokenize(query)):
+            idf = self._idf.get(term)
+            if idf is None:
+                continue
+            for position, count in self._postings[term]:
+                norm = 1 - self.b + self.b * self._lengths[position] / (self._avg_length or 1.0)
+                scores[position] += idf * count * (self.k1 + 1) / (count + self.k1 * norm)
+        return scores
+
+    def vector_scores(self, query_vector: List[float]) -> List[float]:
+        """Cosine similarity of every segment to a query vector.
+
+        Args:
+            query_vector: Embedded question
+
+        Returns:
+            Similarity per segment position
+        """
+        if NUMPY_AVAILABLE:
+            query = np.asarray(query_vector, dtype=np.float32)
+            query = query / max(float(np.linalg.norm(query)), 1e-12)
+            return (self._vectors @ query).tolist()
+
+        query_norm = math.sqrt(sum(x * x for x in query_vector)) or 1.0
+        return [
+            sum(a * b for a, b in zip(vector, query_vector)) / (norm * query_norm)
+            for vector, norm in zip(self._vectors, self._norms)
+        ]
+
+    async def search(
+        self,
+        query: str,
+        top_k: int,
+        embed: Optional[EmbedFunction] = None
+    ) -> List[RetrievedSegment]:
+        """Find the segments most relevant to a query.
+
+        Args:
+            query: Question text
+            top_k: Number of segments to return
+            embed: Embedding function; used only if the index has embeddings
+
+        Returns:
+            Best segments, most relevant first
+        """
+        lexical = self.lexical_scores(query)
+        ranked = sorted(lexical, key=lexical.get, reverse=True)
+
+        if self.has_embeddings and embed is not None:
+            query_vector = (await embed([query]))[0]
+            similarity = self.vector_scores(query_vector)
+            semantic = sorted(range(len(similarity)), key=similarity.__getitem__, reverse=True)
+
+            fused: Dict[int, float] = defaultdict(float)
+            for ranking in (ranked, semantic[:max(top_k * 4, 50)]):
+                for rank, position in enumerate(ranking):
+                    fused[position] += 1.0 / (RRF_K + rank + 1)
+            scores = fused
+        else:
+            scores = lexical
+
+        best = sorted(scores, key=scores.get, reverse=True)[:top_k]
+        return [RetrievedSegment(position=p, segment=self.segments[p], score=scores[p]) for p in best]
+
+    @staticmethod
+    def fit_budget(results: List[RetrievedSegment], token_budget: int) -> List[RetrievedSegment]:
+        """Keep the most relevant results that fit a token budget, in transcript order.
+
+        Args:
+            results: Retrieved segments, most relevant first
+            token_budget: Maximum estimated tokens for the excerpts
+
+        Returns:
+            Selected segments ordered by position
+        """
+        selected = []
+        used = 0
+        for result in results:
+            cost = estimate_tokens(format_timestamped_segment(result.segment)) + 1
+            if used + cost > token_budget:
+                continue
+            selected.append(result)
+            used += cost
+        return sorted(selected, key=lambda r: r.position)
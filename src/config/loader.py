@@ -26,6 +26,8 @@ class Config(BaseModel):
     transcription_api_key: Optional[str] = None
     transcription_model: Optional[str] = "whisper-1"
     transcription_language: str = "auto"
+    transcription_chunk_duration: Optional[float] = 600.0  # Seconds per parallel chunk
+    transcription_max_concurrency: int = 4
 
     # Summarization & Chat (GPT-4o mini)
     openai_api_key: Optional[str] = None
@@ -68,6 +70,8 @@ class ConfigLoader:
             "transcription_provider": "whisper",
             "transcription_model": "whisper-1",
             "transcription_language": "auto",
+            "transcription_chunk_duration": 600.0,
+            "transcription_max_concurrency": 4,
             "openai_model": "gpt-4o-mini",
             "chat_enabled": True,
             "chat_save_history": True,
@@ -148,6 +152,10 @@ class ConfigLoader:
                 flat["transcription_model"] = trans["model"]
             if "language" in trans:
                 flat["transcription_language"] = trans["language"]
+            if "chunk_duration" in trans:
+                flat["transcription_chunk_duration"] = trans["chunk_duration"]
+            if "max_concurrency" in trans:
+                flat["transcription_max_concurrency"] = trans["max_concurrency"]
 
         # Handle summarization section
         if "summarization" in config:
@@ -134,7 +134,9 @@ async def main() -> int:
             transcriber = TranscriberFactory.create(
                 config.transcription_provider,
                 api_key,
-                config.transcription_model
+                config.transcription_model,
+                chunk_duration=config.transcription_chunk_duration,
+                max_concurrency=config.transcription_max_concurrency
             )
 
             transcript = await transcriber.transcribe(processed_audio)
@@ -1,5 +1,8 @@
 """Prompt templates for summarization."""
 
+# Bump when a prompt below changes so cached responses are not reused
+SUMMARY_PROMPT_VERSION = "1"
+
 
 SUMMARY_SYSTEM_PROMPT = """You are an AI assistant analyzing meeting transcripts. Your task is to generate a comprehensive summary with the following components:
 
@@ -40,3 +43,72 @@ Transcript:
 {transcript}
 
 Please analyze this meeting transcript and provide a comprehensive summary with overview, key points, and action items in JSON format."""
+
+
+def create_window_summary_prompt(
+    transcript: str,
+    context: str,
+    participants: list,
+    part: int,
+    total_parts: int
+) -> str:
+    """Create user prompt for summarizing one window of a long transcript.
+
+    Args:
+        transcript: Transcript excerpt (whole speaker turns)
+        context: Meeting context/topic
+        participants: List of participant names
+        part: 1-based position of the excerpt
+        total_parts: Number of excerpts in the meeting
+
+    Returns:
+        Formatted prompt
+    """
+    participants_str = ", ".join(participants)
+
+    return f"""Meeting Context: {context}
+Participants: {participants_str}
+
+This is part {part} of {total_parts} of the meeting transcript:
+{transcript}
+
+Please analyze this part of the meeting and provide its overview, key points, and action items in JSON format. Cover only what is said in this part."""
+
+
+REDUCE_SYSTEM_PROMPT = """You are an AI assistant combining partial summaries of consecutive parts of one meeting into a single summary.
+
+Produce:
+1. Overview: A concise 2-3 sentence summary of the whole meeting
+2. Key Points: The main topics and decisions across all parts, merging duplicates and keeping the most specific wording
+
+Format your response as JSON with the following structure:
+{
+    "overview": "...",
+    "key_points": ["point 1", "point 2", ...]
+}
+
+Use only information from the partial summaries."""
+
+
+def create_reduce_prompt(partial_summaries: list, context: str) -> str:
+    """Create user prompt for merging partial summaries.
+
+    Args:
+        partial_summaries: Dicts with "overview" and "key_points", in meeting order
+        context: Meeting context/topic
+
+    Returns:
+        Formatted prompt
+    """
+    parts = "\n\n".join(
+        f"Part {idx}:\nOverview: {partial.get('overview', '')}\nKey points:\n"
+        + "\n".join(f"- {point}" for point in partial.get('key_points', []))
+        for idx, partial in enumerate(partial_summaries, start=1)
+    )
+
+    return f"""Meeting Context: {context}
+
+Partial summaries, in meeting order:
+{parts}
+
+Please combine these into one overview and one deduplicated list of key points in JSON format."""
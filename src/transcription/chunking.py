@@ -0,0 +1,190 @@
+"""Silence-aware chunking of processed audio for parallel transcription."""
+
+import math
+import shutil
+import tempfile
+import wave
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from loguru import logger
+
+from src.audio.streaming import SAMPLE_WIDTH, sum_of_squares
+from src.utils.exceptions import AudioFileError
+
+
+@dataclass
+class AudioChunk:
+    """A contiguous slice of a recording."""
+    index: int
+    start_time: float
+    end_time: float
+    path: Optional[Path] = None
+
+    @property
+    def duration(self) -> float:
+        """Chunk length in seconds."""
+        return self.end_time - self.start_time
+
+
+class ChunkPlanner:
+    """Split a PCM WAV file into chunks cut at low-energy points.
+
+    Cuts are placed roughly every ``target_duration`` seconds. Around each
+    target the planner scans ``search_window`` seconds in either direction and
+    cuts at the quietest ``frame_duration`` frame, so chunk boundaries land in
+    pauses instead of mid-word. Only the search windows are read, never the
+    whole file.
+    """
+
+    def __init__(
+        self,
+        target_duration: float = 600.0,
+        search_window: float = 30.0,
+        frame_duration: float = 0.1
+    ):
+        """Initialize chunk planner.
+
+        Args:
+            target_duration: Desired chunk length in seconds
+            search_window: Seconds to search on each side of a target cut
+            frame_duration: Energy analysis frame length in seconds
+        """
+        if target_duration <= 0:
+            raise ValueError("target_duration must be positive")
+        self.target_duration = target_duration
+        self.search_window = min(search_window, target_duration / 2)
+        self.frame_duration = frame_duration
+
+    def plan(self, audio_path: Path) -> List[AudioChunk]:
+        """Plan chunk boundaries for a WAV file.
+
+        Args:
+            audio_path: Path to 16-bit PCM WAV file
+
+        Returns:
+            Chunks covering the whole file, in order
+
+        Raises:
+            AudioFileError: If the file is not 16-bit PCM WAV
+        """
+        try:
+            with wave.open(str(audio_path), 'rb') as wav_file:
+                if wav_file.getsampwidth() != SAMPLE_WIDTH:
+                    raise AudioFileError(f"Chunking requires 16-bit PCM WAV: {audio_path}")
+
+                frame_rate = wav_file.getframerate()
+                duration = wav_file.getnframes() / frame_rate
+
+                cuts = [0.0]
+                while duration - cuts[-1] > self.target_duration + self.search_window:
+                    center = cuts[-1] + self.target_duration
+                    cuts.append(self._quietest_point(wav_file, center))
+                cuts.append(duration)
+
+        except (wave.Error, EOFError) as e:
+            raise AudioFileError(f"Could not read WAV file for chunking: {e}")
+
+        chunks = [
+            AudioChunk(index=idx, start_time=start, end_time=end)
+            for idx, (start, end) in enumerate(zip(cuts, cuts[1:]))
+        ]
+        logger.debug(f"Planned {len(chunks)} chunks for {duration:.1f}s of audio")
+        return chunks
+
+    def _quietest_point(self, wav_file: wave.Wave_read, center: float) -> float:
+        """Find the lowest-energy frame near a target cut time.
+
+        Args:
+            wav_file: Open WAV reader
+            center: Target cut time in seconds
+
+        Returns:
+            Cut time in seconds (center of the quietest frame)
+        """
+        frame_rate = wav_file.getframerate()
+        channels = wav_file.getnchannels()
+        frames_per_window = max(1, int(frame_rate * self.frame_duration))
+
+        window_start = int((center - self.search_window) * frame_rate)
+        window_end = min(wav_file.getnframes(), int((center + self.search_window) * frame_rate))
+
+        wav_file.setpos(window_start)
+        best_time = center
+        best_key = (math.inf, 0.0)
+
+        position = window_start
+        while position < window_end:
+            count = min(frames_per_window, window_end - position)
+            block = wav_file.readframes(count)
+            if not block:
+                break
+
+            energy = sum_of_squares(block) / (count * channels)
+            frame_center = (position + count / 2) / frame_rate
+            # Prefer the quietest frame, then the one closest to the target
+            key = (energy, abs(frame_center - center))
+            if key < best_key:
+                best_key = key
+                best_time = frame_center
+
+            position += count
+
+        return best_time
+
+    @staticmethod
+    def export(audio_path: Path, chunks: List[AudioChunk], output_dir: Path) -> List[AudioChunk]:
+        """Write each chunk to its own WAV file.
+
+        Args:
+            audio_path: Source WAV file
+            chunks: Planned chunks
+            output_dir: Directory for chunk files
+
+        Returns:
+            The same chunks with ``path`` set
+        """
+        block_frames = 64 * 1024
+
+        with wave.open(str(audio_path), 'rb') as source:
+            frame_rate = source.getframerate()
+            for chunk in chunks:
+                chunk.path = output_dir / f"{audio_path.stem}_chunk{chunk.index:03d}.wav"
+
+                start_frame = int(round(chunk.start_time * frame_rate))
+                end_frame = int(round(chunk.end_time * frame_rate))
+                source.setpos(start_frame)
+
+                with wave.open(str(chunk.path), 'wb') as target:
+                    target.setparams(source.getparams())
+                    remaining = end_frame - start_frame
+                    while remaining > 0:
+                        block = source.readframes(min(block_frames, remaining))
+                        if not block:
+                            break
+                        target.writeframes(block)
+                        remaining -= len(block) // (source.getsampwidth() * source.getnchannels())
+
+        return chunks
+
+    @staticmethod
+    def make_workdir() -> Path:
+        """Create a private temp directory for chunk files.
+
+        Returns:
+            Path to new directory
+        """
+        base_dir = Path(tempfile.gettempdir()) / "meeting-transcriber"
+        base_dir.mkdir(exist_ok=True)
+        return Path(tempfile.mkdtemp(prefix="chunks_", dir=base_dir))
+
+    @staticmethod
+    def cleanup(workdir: Path) -> None:
+        """Remove a chunk directory.
+
+        Args:
+            workdir: Directory created by ``make_workdir``
+        """
+        shutil.rmtree(workdir, ignore_errors=True)
+        logger.debug(f"Cleaned up chunk directory: {workdir}")
@@ -1,31 +1,64 @@
 """Whisper transcription provider."""
 
+import asyncio
+import wave
+from collections import Counter
 from pathlib import Path
 from typing import List, Optional, Tuple
 
 from loguru import logger
 from openai import AsyncOpenAI
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from src.transcription.base import BaseTranscriber
-from src.utils.exceptions import APIError, APIAuthenticationError, APINetworkError, APIRateLimitError, ConfigurationError
-from src.utils.models import TranscriptResult, TranscriptSegment
+from src.transcription.chunking import AudioChunk, ChunkPlanner
+from src.utils.exceptions import (
+    APIError, APIAuthenticationError, APINetworkError, APIRateLimitError, AudioFileError, ConfigurationError
+)
+from src.utils.models import LanguageDetectionResult, TranscriptResult, TranscriptSegment
+from src.utils.openai_clients import get_openai_client
+from src.utils.provider_scheduler import ProviderScheduler, error_status, provider_scheduler
+
+
+# verbose_json reports language names; routing works with ISO 639-1 codes
+WHISPER_LANGUAGE_CODES = {
+    "arabic": "ar", "chinese": "zh", "dutch": "nl", "english": "en", "french": "fr",
+    "german": "de", "hebrew": "he", "hindi": "hi", "italian": "it", "japanese": "ja",
+    "korean": "ko", "polish": "pl", "portuguese": "pt", "russian": "ru", "spanish": "es",
+    "turkish": "tr", "ukrainian": "uk",
+}
 
 
 class WhisperTranscriber(BaseTranscriber):
     """OpenAI Whisper transcription provider."""
 
-    def __init__(self, api_key: str, model: Optional[str] = "whisper-1", language: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: str,
+        model: Optional[str] = "whisper-1",
+        language: Optional[str] = None,
+        chunk_duration: Optional[float] = 600.0,
+        max_concurrency: int = 4,
+        client: Optional[AsyncOpenAI] = None,
+        scheduler: Optional[ProviderScheduler] = None
+    ):
         """Initialize Whisper transcriber.
 
         Args:
             api_key: OpenAI API key
             model: Whisper model name (default: whisper-1)
             language: Optional language code (e.g., "en", "he"). If None, auto-detect.
+            chunk_duration: Target chunk length in seconds for long WAV files.
+                None sends every file in a single request.
+            max_concurrency: Maximum chunk requests in flight at once
+            client: OpenAI client (default: the shared client for ``api_key``)
+            scheduler: Rate limiter and retry policy (default: the shared scheduler)
         """
         super().__init__(api_key, model)
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.client = client or get_openai_client(api_key)
+        self.scheduler = scheduler or provider_scheduler
         self.language = language
+        self.chunk_duration = chunk_duration
+        self.max_concurrency = max(1, max_concurrency)
 
     async def transcribe(self, audio_path: Path) -> TranscriptResult:
         """Transcribe audio using Whisper API.
@@ -44,19 +77,16 @@ class WhisperTranscriber(BaseTranscriber):
         """
         logger.info(f"Transcribing with Whisper: {audio_path}")
 
+        chunks = await asyncio.to_thread(self._plan_chunks, audio_path)
+        if len(chunks) > 1:
+            return await self._transcribe_chunked(audio_path, chunks)
+
         try:
             transcript = await self._transcribe_with_retry(audio_path)
 
-            # Whisper returns a single text blob, not segmented by speaker
-            # For now, create a single segment. Speaker diarization will be added later.
-            segments = [
-                TranscriptSegment(
-                    speaker="Unknown",  # Will be labeled later
-                    text=transcript.text,
-                    start_time=0.0,
-                    end_time=0.0  # Whisper doesn't provide timestamps in basic mode
-                )
-            ]
+            # Same segment shape as chunked files: one chunk spanning the whole file
+            duration = float(getattr(transcript, 'duration', None) or 0.0)
+            segments = self._chunk_segments(transcript, AudioChunk(index=0, start_time=0.0, end_time=duration))
 
             result = TranscriptResult(
                 segments=segments,
@@ -67,17 +97,160 @@ class WhisperTranscriber(BaseTranscriber):
                 }
             )
 
-            logger.info(f"Transcription complete. Language: {result.language}")
+            logger.info(f"Transcription complete. {len(segments)} segments, language: {result.language}")
             return result
 
         except Exception as e:
             logger.error(f"Transcription failed: {e}")
             raise self._handle_api_error(e)
 
+    def _plan_chunks(self, audio_path: Path) -> List[AudioChunk]:
+        """Plan silence-aligned chunks for a processed WAV file.
+
+        Args:
+            audio_path: Path to audio file
+
+        Returns:
+            Planned chunks, or an empty list if the file can't be chunked
+        """
+        if not self.chunk_duration or audio_path.suffix.lower() != '.wav':
+            return []
+
+        try:
+            return ChunkPlanner(target_duration=self.chunk_duration).plan(audio_path)
+        except AudioFileError as e:
+            logger.warning(f"Could not plan chunks, transcribing in a single request: {e}")
+            return []
+
+    async def _transcribe_chunked(self, audio_path: Path, chunks: List[AudioChunk]) -> TranscriptResult:
+        """Transcribe chunks concurrently and stitch them into one result.
+
+        Args:
+            audio_path: Path to processed WAV file
+            chunks: Planned chunks covering the file
+
+        Returns:
+            TranscriptResult with segment times relative to the full file
+
+        Raises:
+            APIError: If any chunk fails after retries
+        """
+        logger.info(f"Transcribing {len(chunks)} chunks with concurrency {self.max_concurrency}")
+
+        try:
+            responses = await self._transcribe_slices(audio_path, chunks)
+        except Exception as e:
+            logger.error(f"Chunked transcription failed: {e}")
+            raise self._handle_api_error(e)
+
+        segments = [
+            segment
+            for response, chunk in zip(responses, chunks)
+            for segment in self._chunk_segments(response, chunk)
+        ]
+        languages = Counter(
+            getattr(response, 'language', None) for response in responses if getattr(response, 'language', None)
+        )
+
+        result = TranscriptResult(
+            segments=segments,
+            language=languages.most_common(1)[0][0] if languages else 'unknown',
+            metadata={
+                'model': self.model,
+                'provider': 'whisper',
+                'chunks': len(chunks),
+                'duration': chunks[-1].end_time
+            }
+        )
+
+        logger.info(f"Transcription complete. {len(segments)} segments, language: {result.language}")
+        return result
+
+    async def _transcribe_slices(
+        self,
+        audio_path: Path,
+        chunks: List[AudioChunk],
+        detect_only: bool = False
+    ) -> list:
+        """Export slices of a WAV file and transcribe them concurrently.
+
+        Args:
+            audio_path: Path to processed WAV file
+            chunks: Slices to transcribe
+            detect_only: Let Whisper detect the language of each slice
+
+        Returns:
+            Whisper responses in chunk order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def transcribe_slice(chunk: AudioChunk):
+            async with semaphore:
+                return await self._transcribe_with_retry(chunk.path, detect_only=detect_only)
+
+        workdir = ChunkPlanner.make_workdir()
+        try:
+            await asyncio.to_thread(ChunkPlanner.export, audio_path, chunks, workdir)
+
+            tasks = [asyncio.create_task(transcribe_slice(chunk)) for chunk in chunks]
+            try:
+                return await asyncio.gather(*tasks)
+            except Exception:
+                for task in tasks:
+                    task.cancel()
+                raise
+
+        finally:
+            ChunkPlanner.cleanup(workdir)
+
+    def _chunk_segments(self, response, chunk: AudioChunk) -> List[TranscriptSegment]:
+        """Convert a chunk response into segments offset to the chunk start.
+
+        Args:
+            response: Whisper verbose_json response for the chunk
+            chunk: Chunk the response belongs to
+
+        Returns:
+            Segments with absolute timestamps
+        """
+        segments = []
+        for raw in getattr(response, 'segments', None) or []:
+            text = (self._field(raw, 'text') or '').strip()
+            if not text:
+                continue
+            segments.append(
+                TranscriptSegment(
+                    speaker="Unknown",  # Will be labeled later
+                    text=text,
+                    start_time=chunk.start_time + float(self._field(raw, 'start') or 0.0),
+                    end_time=chunk.start_time + float(self._field(raw, 'end') or 0.0)
+                )
+            )
+
+        # No segment-level timestamps: fall back to one segment spanning the chunk
+        if not segments and response.text and response.text.strip():
+            segments.append(
+                TranscriptSegment(
+                    speaker="Unknown",
+                    text=response.text.strip(),
+                    start_time=chunk.start_time,
+                    end_time=chunk.end_time
+                )
+            )
+
+        return segments
+
+    @staticmethod
+    def _field(raw, name: str):
+        """Read a field from a response segment (dict or object)."""
+        if isinstance(raw, dict):
+            return raw.get(name)
+        return getattr(raw, name, None)
+
     async def detect_language(self, audio_path: Path) -> Tuple[str, float]:
         """Detect the dominant language in an audio file.
 
-        Uses Whisper's built-in language detection which analyzes the audio.
+        Samples short excerpts (see ``detect_language_from_excerpts``).
 
         Args:
             audio_path: Path to audio file
@@ -88,32 +261,192 @@ class WhisperTranscriber(BaseTranscriber):
         Raises:
             APIError: If detection fails
         """
-        logger.info(f"Detecting language for: {audio_path}")
+        result = await self.detect_language_from_excerpts(audio_path)
+        return result.language, result.confidence
+
+    async def detect_language_from_excerpts(
+        self,
+        audio_path: Path,
+        excerpt_duration: float = 30.0,
+        excerpt_count: int = 3
+    ) -> LanguageDetectionResult:
+        """Detect language from a few short excerpts spread across the file.
+
+        Each excerpt is transcribed with language auto-detection and votes for
+        its language, weighted by how likely it is to contain speech.
+        Confidence is the winning weight divided by the number of excerpts, so
+        silent or disagreeing excerpts lower it.
+
+        Recordings no longer than ``excerpt_duration * excerpt_count`` (and
+        files that aren't PCM WAV) are sent whole; the result then carries the
+        full transcript so callers can reuse it instead of transcribing again.
 
-        try:
-            # Transcribe a small portion to detect language
-            # Whisper automatically detects language during transcription
-            transcript = await self._transcribe_with_retry(audio_path, detect_only=True)
+        Args:
+            audio_path: Path to processed audio file
+            excerpt_duration: Length of each excerpt in seconds
+            excerpt_count: Number of excerpts to sample
+
+        Returns:
+            LanguageDetectionResult
+
+        Raises:
+            APIError: If detection fails
+        """
+        logger.info(f"Detecting language for: {audio_path}")
 
-            detected_language = getattr(transcript, 'language', 'unknown')
-            # Whisper doesn't return confidence, so we use 1.0 as default
-            confidence = 1.0
+        excerpts = self._plan_excerpts(audio_path, excerpt_duration, max(1, excerpt_count))
 
-            logger.info(f"Detected language: {detected_language} (confidence: {confidence})")
-            return detected_language, confidence
+        try:
+            if len(excerpts) <= 1:
+                response = await self._transcribe_with_retry(audio_path, detect_only=True)
+                result = self._whole_file_detection(response, excerpts[0] if excerpts else None)
+            else:
+                responses = await self._transcribe_slices(audio_path, excerpts, detect_only=True)
+                result = self._vote_language(responses)
 
         except Exception as e:
             logger.error(f"Language detection failed: {e}")
             raise self._handle_api_error(e)
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type(APINetworkError),
-        reraise=True
-    )
+        logger.info(
+            f"Detected language: {result.language} (confidence: {result.confidence:.2f}, "
+            f"excerpts: {result.excerpts})"
+        )
+        return result
+
+    def _plan_excerpts(self, audio_path: Path, excerpt_duration: float, excerpt_count: int) -> List[AudioChunk]:
+        """Place evenly spaced excerpts across a WAV file.
+
+        Args:
+            audio_path: Path to audio file
+            excerpt_duration: Length of each excerpt in seconds
+            excerpt_count: Number of excerpts
+
+        Returns:
+            Excerpts; a single excerpt spanning the file if it is short, or an
+            empty list if the file isn't a readable PCM WAV
+        """
+        if audio_path.suffix.lower() != '.wav':
+            return []
+
+        try:
+            with wave.open(str(audio_path), 'rb') as wav_file:
+                duration = wav_file.getnframes() / wav_file.getframerate()
+        except (wave.Error, EOFError) as e:
+            logger.warning(f"Could not read WAV for excerpts, detecting on the whole file: {e}")
+            return []
+
+        if duration <= excerpt_duration * excerpt_count:
+            return [AudioChunk(index=0, start_time=0.0, end_time=duration)]
+
+        stride = duration / excerpt_count
+        excerpts = []
+        for idx in range(excerpt_count):
+            center = (idx + 0.5) * stride
+            excerpts.append(
+                AudioChunk(
+                    index=idx,
+                    start_time=center - excerpt_duration / 2,
+                    end_time=center + excerpt_duration / 2
+                )
+            )
+        return excerpts
+
+    def _whole_file_detection(self, response, span: Optional[AudioChunk]) -> LanguageDetectionResult:
+        """Build a detection result (with transcript) from a whole-file response.
+
+        Args:
+            response: Whisper verbose_json response for the whole file
+            span: Chunk spanning the file, if its duration is known
+
+        Returns:
+            LanguageDetectionResult with ``transcript`` set
+        """
+        if span is None:
+            span = AudioChunk(index=0, start_time=0.0, end_time=float(getattr(response, 'duration', 0.0) or 0.0))
+
+        raw_language = getattr(response, 'language', None) or 'unknown'
+        transcript = TranscriptResult(
+            segments=self._chunk_segments(response, span),
+            language=raw_language,
+            metadata={
+                'model': self.model,
+                'provider': 'whisper',
+                'duration': span.end_time
+            }
+        )
+
+        language = self._language_code(raw_language)
+        return LanguageDetectionResult(
+            language=language,
+            confidence=self._speech_score(response) if language != 'unknown' else 0.0,
+            excerpts=1,
+            transcript=transcript
+        )
+
+    def _vote_language(self, responses: list) -> LanguageDetectionResult:
+        """Combine per-excerpt detections by speech-weighted majority vote.
+
+        Args:
+            responses: Whisper responses, one per excerpt
+
+        Returns:
+            LanguageDetectionResult without transcript
+        """
+        votes: Counter = Counter()
+        for response in responses:
+            language = self._language_code(getattr(response, 'language', None))
+            if language != 'unknown':
+                votes[language] += self._speech_score(response)
+
+        if not votes:
+            return LanguageDetectionResult(language='unknown', confidence=0.0, excerpts=len(responses))
+
+        language, weight = votes.most_common(1)[0]
+        return LanguageDetectionResult(
+            language=language,
+            confidence=weight / len(responses),
+            excerpts=len(responses)
+        )
+
+    def _speech_score(self, response) -> float:
+        """Estimate how likely a response is to contain real speech.
+
+        Args:
+            response: Whisper verbose_json response
+
+        Returns:
+            Score between 0.0 (silence) and 1.0
+        """
+        if not (getattr(response, 'text', None) or '').strip():
+            return 0.0
+
+        probabilities = [
+            float(self._field(raw, 'no_speech_prob'))
+            for raw in getattr(response, 'segments', None) or []
+            if self._field(raw, 'no_speech_prob') is not None
+        ]
+        if not probabilities:
+            return 1.0
+        return max(0.0, 1.0 - sum(probabilities) / len(probabilities))
+
+    @staticmethod
+    def _language_code(language: Optional[str]) -> str:
+        """Map a Whisper language name to an ISO 639-1 code.
+
+        Args:
+            language: Language name or code from the response
+
+        Returns:
+            Lowercase code, the name itself if unmapped, or "unknown"
+        """
+        if not language:
+            return 'unknown'
+        language = language.strip().lower()
+        return WHISPER_LANGUAGE_CODES.get(language, language)
+
     async def _transcribe_with_retry(self, audio_path: Path, detect_only: bool = False):
-        """Transcribe with retry logic.
+        """Transcribe through the provider scheduler (rate limits, retries with backoff).
 
         Args:
             audio_path: Path to audio file
@@ -125,7 +458,8 @@ class WhisperTranscriber(BaseTranscriber):
         Raises:
             APIError: If transcription fails after retries
         """
-        try:
+        async def transcribe_file():
+            # Reopened on every attempt, since a failed upload consumes the file
             with open(audio_path, 'rb') as audio_file:
                 # Build kwargs
                 kwargs = {
@@ -138,8 +472,10 @@ class WhisperTranscriber(BaseTranscriber):
                 if self.language and not detect_only:
                     kwargs["language"] = self.language
 
-                transcript = await self.client.audio.transcriptions.create(**kwargs)
-            return transcript
+                return await self.client.audio.transcriptions.create(**kwargs)
+
+        try:
+            return await self.scheduler.call("openai", transcribe_file, key=self.api_key)
 
         except Exception as e:
             raise self._handle_api_error(e)
@@ -147,12 +483,24 @@ class WhisperTranscriber(BaseTranscriber):
     def _handle_api_error(self, error: Exception) -> APIError:
         """Convert OpenAI errors to our custom exceptions.
 
+        Errors that are already an APIError (mapped by ``_transcribe_with_retry``)
+        are returned unchanged so they are not wrapped twice.
+
         Args:
             error: Original exception
 
         Returns:
             Custom APIError
         """
+        if isinstance(error, APIError):
+            return error
+
+        status = error_status(error)
+        if status in (401, 403):
+            return APIAuthenticationError(f"OpenAI API authentication failed: {error}")
+        if status == 429:
+            return APIRateLimitError(f"OpenAI API rate limit exceeded: {error}")
+
         error_str = str(error).lower()
 
         if 'authentication' in error_str or 'api key' in error_str or 'unauthorized' in error_str:
@@ -22,6 +22,15 @@ class TranscriptResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class LanguageDetectionResult:
+    """Language detected from a recording."""
+    language: str
+    confidence: float
+    excerpts: int = 1
+    transcript: Optional[TranscriptResult] = None  # Set when the whole recording was transcribed
+
+
 @dataclass
 class ActionItem:
     """An action item extracted from the meeting."""
@@ -1,8 +1,11 @@
 """Chat endpoints for Q&A about meetings."""
 
+import json
+from dataclasses import dataclass
 from typing import List
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status
 from fastapi.responses import StreamingResponse, JSONResponse
+from starlette.background import BackgroundTask
 from loguru import logger
 
 from app.db import db
@@ -14,138 +17,108 @@ from app.schemas.chat import (
     ChatStreamResponse
 )
 from app.services.chat import chat_service
-from lib.utils.models import TranscriptResult, TranscriptSegment, Summary as SummaryModel, ActionItem
+from app.services.chat_context import ChatContext, chat_context_cache
+from app.services.chat_memory import chat_memory_service
+from lib.chat.memory import ConversationMemory
 
 router = APIRouter()
 
 
-@router.post("/chat")
-async def chat(message_request: ChatMessageCreate):
-    """Send a chat message about a meeting session.
+@dataclass
+class ChatInputs:
+    """Everything the chat service needs for one question."""
+    session_id: str
+    chat_context: ChatContext
+    conversation_history: List[dict]  # Messages not yet folded into the memory summary
+    memory: ConversationMemory
+
+
+async def _load_chat_inputs(session_id: str, api_key: str) -> ChatInputs:
+    """Load a session's chat context and chat memory.
+
+    The transcript, summary and prompt come from the chat context cache;
+    only the running chat summary and the messages after it are read on
+    every question.
 
     Args:
-        message_request: Chat message request
+        session_id: Session ID
+        api_key: OpenAI API key
 
     Returns:
-        Assistant's response
+        Chat inputs
+
+    Raises:
+        HTTPException: If the session is missing or not transcribed yet
     """
-    try:
-        # Get session with transcript and summary
-        session = await db.session.find_unique(
-            where={"id": message_request.sessionId},
-            include={
-                "transcript": {
-                    "include": {
-                        "segments": True
-                    }
-                },
-                "summary": {
-                    "include": {
-                        "actionItems": True
-                    }
-                },
-                "chatMessages": {
-                    "order_by": {
-                        "createdAt": "asc"
-                    }
-                }
-            }
-        )
+    chat_context = await chat_context_cache.get(session_id, api_key)
 
-        if not session:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Session not found"
-            )
+    memory_state = await chat_memory_service.load(session_id)
 
-        if not session.transcript or not session.summary:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Session transcription not complete"
-            )
+    return ChatInputs(
+        session_id=session_id,
+        chat_context=chat_context,
+        conversation_history=memory_state.messages,
+        memory=chat_memory_service.memory(memory_state.summary)
+    )
 
-        # Convert database models to service models
-        transcript = TranscriptResult(
-            segments=[
-                TranscriptSegment(
-                    speaker=seg.speakerName or seg.speakerId,
-                    text=seg.text,
-                    start_time=seg.startTime,
-                    end_time=seg.endTime
-                )
-                for seg in sorted(session.transcript.segments, key=lambda x: x.order)
-            ],
-            language=session.transcript.language,
-            metadata={}
-        )
 
-        # Extract unique participants from transcript
-        participants = list(set([
-            seg.speakerName or seg.speakerId
-            for seg in session.transcript.segments
-        ]))
-
-        summary = SummaryModel(
-            overview=session.summary.overview,
-            key_points=session.summary.keyPoints,
-            action_items=[
-                ActionItem(
-                    description=item.description,
-                    assignee=item.assignee,
-                    deadline=item.deadline
-                )
-                for item in session.summary.actionItems
-            ],
-            participants=participants
-        )
+async def _save_exchange(session_id: str, question: str, answer: str):
+    """Persist a question and its answer.
 
-        # Get conversation history
-        conversation_history = [
-            {
-                "role": msg.role,
-                "content": msg.content
-            }
-            for msg in session.chatMessages
-        ]
+    Returns:
+        The saved assistant message
+    """
+    await db.chatmessage.create(
+        data={
+            "sessionId": session_id,
+            "role": "user",
+            "content": question
+        }
+    )
+    return await db.chatmessage.create(
+        data={
+            "sessionId": session_id,
+            "role": "assistant",
+            "content": answer
+        }
+    )
+
+
+@router.post("/chat")
+async def chat(message_request: ChatMessageCreate, background_tasks: BackgroundTasks):
+    """Send a chat message about a meeting session.
 
+    Args:
+        message_request: Chat message request
+        background_tasks: Runs chat memory compaction after the response
+
+    Returns:
+        Assistant's response
+    """
+    try:
         # TODO: Get API key from user settings (for now use environment variable)
         api_key = settings.OPENAI_API_KEY or settings.SECRET_KEY
 
+        inputs = await _load_chat_inputs(message_request.sessionId, api_key)
+
         # Get chat response
         response = await chat_service.chat(
             user_question=message_request.message,
-            transcript=transcript,
-            summary=summary,
-            context=session.context,
-            participants=participants,
+            chat_context=inputs.chat_context,
             api_key=api_key,
             model=settings.DEFAULT_CHAT_MODEL,
-            conversation_history=conversation_history
+            conversation_history=inputs.conversation_history,
+            memory=inputs.memory
         )
 
-        # Save user message
-        await db.chatmessage.create(
-            data={
-                "sessionId": session.id,
-                "role": "user",
-                "content": message_request.message
-            }
-        )
+        assistant_message = await _save_exchange(inputs.session_id, message_request.message, response)
+        background_tasks.add_task(chat_memory_service.compact, inputs.session_id, api_key)
 
-        # Save assistant response
-        assistant_message = await db.chatmessage.create(
-            data={
-                "sessionId": session.id,
-                "role": "assistant",
-                "content": response
-            }
-        )
-
-        logger.info(f"Chat message processed for session {session.id}")
+        logger.info(f"Chat message processed for session {inputs.session_id}")
 
         return ChatMessageResponse(
             id=assistant_message.id,
-            sessionId=session.id,
+            sessionId=inputs.session_id,
             role="assistant",
             content=response,
             createdAt=assistant_message.createdAt
@@ -161,6 +134,75 @@ async def chat(message_request: ChatMessageCreate):
         )
 
 
+@router.post("/chat/stream")
+async def chat_stream(message_request: ChatMessageCreate):
+    """Send a chat message and stream the answer as Server-Sent Events.
+
+    Emits a ``token`` event (ChatStreamResponse) for each piece of text as
+    the model generates it. Once the answer is complete, both messages are
+    saved and a ``message`` event carries the saved assistant message
+    (ChatMessageResponse). Failures mid-stream end with an ``error`` event.
+
+    Args:
+        message_request: Chat message request
+
+    Returns:
+        text/event-stream response
+    """
+    # TODO: Get API key from user settings (for now use environment variable)
+    api_key = settings.OPENAI_API_KEY or settings.SECRET_KEY
+
+    try:
+        inputs = await _load_chat_inputs(message_request.sessionId, api_key)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Chat failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Chat failed: {str(e)}"
+        )
+
+    async def event_stream():
+        parts: List[str] = []
+        try:
+            async for delta in chat_service.chat_stream(
+                user_question=message_request.message,
+                chat_context=inputs.chat_context,
+                api_key=api_key,
+                model=settings.DEFAULT_CHAT_MODEL,
+                conversation_history=inputs.conversation_history,
+                memory=inputs.memory
+            ):
+                parts.append(delta)
+                token = ChatStreamResponse(role="assistant", content=delta, done=False)
+                yield f"event: token\ndata: {token.model_dump_json()}\n\n"
+
+            response = "".join(parts)
+            assistant_message = await _save_exchange(inputs.session_id, message_request.message, response)
+            logger.info(f"Streamed chat message processed for session {inputs.session_id}")
+
+            message = ChatMessageResponse(
+                id=assistant_message.id,
+                sessionId=inputs.session_id,
+                role="assistant",
+                content=response,
+                createdAt=assistant_message.createdAt
+            )
+            yield f"event: message\ndata: {message.model_dump_json()}\n\n"
+
+        except Exception as e:
+            logger.error(f"Streaming chat failed: {e}")
+            yield f"event: error\ndata: {json.dumps({'detail': f'Chat failed: {str(e)}'})}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        background=BackgroundTask(chat_memory_service.compact, inputs.session_id, api_key)
+    )
+
+
 @router.get("/sessions/{session_id}/chat", response_model=ChatHistoryResponse)
 async def get_chat_history(session_id: str):
     """Get chat history for a session.
@@ -240,6 +282,7 @@ async def clear_chat_history(session_id: str):
         await db.chatmessage.delete_many(
             where={"sessionId": session_id}
         )
+        await chat_memory_service.reset(session_id)
 
         logger.info(f"Cleared chat history for session {session_id}")
 
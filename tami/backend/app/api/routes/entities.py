@@ -7,6 +7,7 @@ from loguru import logger
 
 from app.db import db
 from app.core.auth import get_current_user_id
+from app.services.suggestions import suggestion_service
 
 
 router = APIRouter()
@@ -350,6 +351,7 @@ async def delete_entity(
 
         # Delete entity (mentions cascade)
         await db.entity.delete(where={"id": entity_id})
+        suggestion_service.invalidate(user_id)
 
         return {"message": "Entity deleted successfully"}
 
@@ -1,5 +1,6 @@
 """Recording endpoints for live audio capture."""
 
+import asyncio
 import uuid
 import subprocess
 from pathlib import Path
@@ -186,8 +187,9 @@ async def stop_recording(recording_id: str) -> JSONResponse:
             for chunk in chunk_files:
                 f.write(f"file '{chunk.absolute()}'\n")  # Use absolute path
 
-        # Run ffmpeg to merge and convert to WAV
-        result = subprocess.run(
+        # Run ffmpeg to merge and convert to WAV (in a thread so the event loop stays free)
+        result = await asyncio.to_thread(
+            subprocess.run,
             [
                 'ffmpeg',
                 '-y',  # Overwrite output file
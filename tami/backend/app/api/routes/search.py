@@ -6,6 +6,8 @@ from pydantic import BaseModel
 from loguru import logger
 
 from app.db import db
+from app.services.search import search_service
+from app.services.suggestions import suggestion_service
 
 
 router = APIRouter()
@@ -22,6 +24,8 @@ class SessionSearchResult(BaseModel):
     rank: float = 0.0
     matchType: str = "session"  # "session" or "transcript"
     highlightedText: Optional[str] = None
+    segmentId: Optional[str] = None  # Best-matching transcript segment
+    segmentStartTime: Optional[float] = None
 
 
 class EntitySearchResult(BaseModel):
@@ -70,7 +74,8 @@ async def global_search(
 ):
     """Global search across sessions and entities.
 
-    Uses PostgreSQL full-text search for sessions and text matching for entities.
+    Uses PostgreSQL full-text search (websearch syntax) for sessions and
+    their transcripts, and text matching for entities.
 
     Args:
         user_id: User ID
@@ -90,31 +95,11 @@ async def global_search(
     total_entities = 0
 
     try:
-        # Search sessions using FTS
+        # Search sessions and transcripts in one ranked FTS query
         if "sessions" in types:
-            # Use raw SQL for FTS query
-            search_query = " | ".join(q.split())  # OR search for multiple terms
-
-            # Search in sessions (title, context) and transcript segments
-            session_results = await db.query_raw(
-                f'''
-                SELECT DISTINCT ON (s.id)
-                    s.id,
-                    s.title,
-                    s.context,
-                    s.status,
-                    s."createdAt",
-                    ts_rank(s."searchVector", to_tsquery('simple', $1)) as rank
-                FROM "Session" s
-                WHERE s."userId" = $2
-                  AND s."searchVector" @@ to_tsquery('simple', $1)
-                ORDER BY s.id, rank DESC
-                LIMIT $3
-                ''',
-                search_query, user_id, limit
-            )
+            rows = await search_service.search_sessions(user_id, q, limit)
 
-            for row in session_results:
+            for row in rows:
                 sessions.append(SessionSearchResult(
                     id=row['id'],
                     title=row['title'],
@@ -122,50 +107,12 @@ async def global_search(
                     status=row['status'],
                     createdAt=row['createdAt'].isoformat() if row['createdAt'] else '',
                     rank=float(row['rank']) if row['rank'] else 0.0,
-                    matchType="session"
+                    matchType=row['match_type'],
+                    highlightedText=row['matched_text'][:200] if row['matched_text'] else None,
+                    segmentId=row['segment_id'],
+                    segmentStartTime=row['matched_start_time']
                 ))
-
-            # Also search in transcript segments
-            segment_results = await db.query_raw(
-                f'''
-                SELECT DISTINCT ON (s.id)
-                    s.id as session_id,
-                    s.title,
-                    s.context,
-                    s.status,
-                    s."createdAt",
-                    ts."text" as matched_text,
-                    ts_rank(ts."searchVector", to_tsquery('simple', $1)) as rank
-                FROM "TranscriptSegment" ts
-                JOIN "Transcript" t ON ts."transcriptId" = t.id
-                JOIN "Session" s ON t."sessionId" = s.id
-                WHERE s."userId" = $2
-                  AND ts."searchVector" @@ to_tsquery('simple', $1)
-                ORDER BY s.id, rank DESC
-                LIMIT $3
-                ''',
-                search_query, user_id, limit
-            )
-
-            # Merge segment results (avoid duplicates)
-            seen_ids = {s.id for s in sessions}
-            for row in segment_results:
-                if row['session_id'] not in seen_ids:
-                    sessions.append(SessionSearchResult(
-                        id=row['session_id'],
-                        title=row['title'],
-                        context=row['context'],
-                        status=row['status'],
-                        createdAt=row['createdAt'].isoformat() if row['createdAt'] else '',
-                        rank=float(row['rank']) if row['rank'] else 0.0,
-                        matchType="transcript",
-                        highlightedText=row['matched_text'][:200] if row['matched_text'] else None
-                    ))
-                    seen_ids.add(row['session_id'])
-
-            # Sort by rank and limit
-            sessions = sorted(sessions, key=lambda x: x.rank, reverse=True)[:limit]
-            total_sessions = len(sessions)
+            total_sessions = int(rows[0]['total']) if rows else 0
 
         # Search entities
         if "entities" in types:
@@ -244,29 +191,7 @@ async def search_in_session(
         if not transcript:
             return SessionSearchResponse(segments=[], total=0)
 
-        # Search using FTS
-        search_query = " | ".join(q.split())
-
-        segment_results = await db.query_raw(
-            f'''
-            SELECT
-                ts.id,
-                ts."transcriptId",
-                ts."speakerId",
-                ts."speakerName",
-                ts.text,
-                ts."startTime",
-                ts."endTime",
-                ts."order",
-                ts_rank(ts."searchVector", to_tsquery('simple', $1)) as rank
-            FROM "TranscriptSegment" ts
-            WHERE ts."transcriptId" = $2
-              AND ts."searchVector" @@ to_tsquery('simple', $1)
-            ORDER BY ts."order"
-            LIMIT $3
-            ''',
-            search_query, transcript.id, limit
-        )
+        segment_results = await search_service.search_segments(transcript.id, q, limit)
 
         segments = [
             TranscriptSearchResult(
@@ -305,7 +230,8 @@ async def get_search_suggestions(
 ):
     """Get search suggestions based on partial query.
 
-    Returns suggestions from entities and session titles.
+    Returns entities starting with the query (most mentioned first), then
+    session titles containing it.
 
     Args:
         user_id: User ID
@@ -316,42 +242,8 @@ async def get_search_suggestions(
         List of suggestions
     """
     try:
-        suggestions = []
-
-        # Get matching entities
-        entities = await db.entity.find_many(
-            where={
-                "userId": user_id,
-                "value": {"startsWith": q, "mode": "insensitive"}
-            },
-            order={"mentionCount": "desc"},
-            take=limit
-        )
-
-        for e in entities:
-            suggestions.append({
-                "text": e.value,
-                "type": "entity",
-                "entityType": e.type
-            })
-
-        # Get matching session titles
-        sessions = await db.session.find_many(
-            where={
-                "userId": user_id,
-                "title": {"contains": q, "mode": "insensitive"}
-            },
-            take=limit - len(suggestions) if len(suggestions) < limit else 0
-        )
-
-        for s in sessions:
-            if s.title:
-                suggestions.append({
-                    "text": s.title,
-                    "type": "session"
-                })
-
-        return {"suggestions": suggestions[:limit]}
+        suggestions = await suggestion_service.suggest(user_id, q, limit)
+        return {"suggestions": [s.to_dict() for s in suggestions]}
 
     except Exception as e:
         logger.error(f"Search suggestions failed: {e}")
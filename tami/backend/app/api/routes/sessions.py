@@ -1,6 +1,8 @@
 """Session management endpoints."""
 
-from typing import Optional
+import base64
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
 from pathlib import Path
 from fastapi import APIRouter, HTTPException, status, Query, Depends
 from fastapi.responses import JSONResponse, FileResponse
@@ -8,6 +10,7 @@ from loguru import logger
 
 from app.db import db
 from app.core.auth import get_current_user
+from app.core.config import settings
 from app.schemas.session import (
     SessionResponse,
     SessionListResponse,
@@ -17,24 +20,54 @@ from app.schemas.session import (
 from app.schemas.transcription import (
     ActionItemUpdate,
     ActionItemCreate,
-    SummaryUpdate
+    SummaryUpdate,
+    TranscriptSegmentPage,
+    TranscriptSegmentResponse
 )
+from app.services.chat_context import bump_content_version, chat_context_cache
+from app.services.session_counts import session_count_service
+from app.services.suggestions import suggestion_service
 
 router = APIRouter()
 
 
+def _encode_cursor(session) -> str:
+    """Encode a session's (createdAt, id) as an opaque page cursor."""
+    raw = f"{session.createdAt.isoformat()}|{session.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a page cursor into (createdAt, id)."""
+    try:
+        created_at, session_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), session_id
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
 @router.get("/sessions", response_model=SessionListResponse)
 async def list_sessions(
     current_user: dict = Depends(get_current_user),
     page: int = Query(1, ge=1),
-    page_size: int = Query(20, ge=1, le=100)
+    page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="nextCursor from the previous page")
 ):
-    """List all sessions for the authenticated user.
+    """List all sessions for the authenticated user, newest first.
+
+    With ``cursor`` the page is read by keyset on (createdAt, id) through
+    the (userId, createdAt, id) index, so every page costs the same however
+    long the history is. ``page`` is kept for older clients and still uses
+    an offset. The total comes from the cached per-user session count.
 
     Args:
         current_user: Authenticated user from JWT token
-        page: Page number
+        page: Page number (ignored when cursor is given)
         page_size: Items per page
+        cursor: Cursor returned with the previous page
 
     Returns:
         List of sessions with pagination
@@ -42,17 +75,27 @@ async def list_sessions(
     try:
         # Build where clause - only show user's own sessions
         where = {"userId": current_user["id"]}
+        skip = (page - 1) * page_size
+
+        if cursor:
+            created_at, session_id = _decode_cursor(cursor)
+            where["OR"] = [
+                {"createdAt": {"lt": created_at}},
+                {"createdAt": created_at, "id": {"lt": session_id}}
+            ]
+            skip = 0
 
-        # Get total count
-        total = await db.session.count(where=where)
+        total = await session_count_service.get(current_user["id"])
 
-        # Get sessions
+        # Fetch one extra row to know whether another page exists
         sessions = await db.session.find_many(
             where=where,
-            skip=(page - 1) * page_size,
-            take=page_size,
-            order={"createdAt": "desc"}
+            skip=skip,
+            take=page_size + 1,
+            order=[{"createdAt": "desc"}, {"id": "desc"}]
         )
+        has_more = len(sessions) > page_size
+        sessions = sessions[:page_size]
 
         return SessionListResponse(
             sessions=[
@@ -72,9 +115,12 @@ async def list_sessions(
             ],
             total=total,
             page=page,
-            pageSize=page_size
+            pageSize=page_size,
+            nextCursor=_encode_cursor(sessions[-1]) if has_more else None
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"List sessions failed: {e}")
         raise HTTPException(
@@ -138,6 +184,91 @@ async def get_session(
         )
 
 
+@router.get("/sessions/{session_id}/segments", response_model=TranscriptSegmentPage)
+async def list_segments(
+    session_id: str,
+    current_user: dict = Depends(get_current_user),
+    cursor: Optional[int] = Query(None, ge=-1, description="nextCursor from the previous page"),
+    limit: int = Query(200, ge=1, le=1000),
+    start_time: Optional[float] = Query(None, alias="startTime", ge=0),
+    end_time: Optional[float] = Query(None, alias="endTime", ge=0)
+):
+    """Page through a session's transcript segments in order.
+
+    Pages are keyed on the segment order (``order > cursor``), which walks
+    the (transcriptId, order) index instead of skipping rows. A time window
+    keeps only segments overlapping [startTime, endTime].
+
+    Args:
+        session_id: Session ID
+        current_user: Authenticated user from JWT token
+        cursor: Order of the last segment already received
+        limit: Segments per page
+        start_time: Window start in seconds
+        end_time: Window end in seconds
+
+    Returns:
+        Segments and the cursor for the next page
+    """
+    try:
+        session = await db.session.find_unique(
+            where={"id": session_id},
+            include={"transcript": True}
+        )
+
+        if not session or session.userId != current_user["id"]:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Session not found"
+            )
+
+        if not session.transcript:
+            return TranscriptSegmentPage(segments=[])
+
+        where = {"transcriptId": session.transcript.id}
+        if cursor is not None:
+            where["order"] = {"gt": cursor}
+        if start_time is not None:
+            where["endTime"] = {"gte": start_time}
+        if end_time is not None:
+            where["startTime"] = {"lte": end_time}
+
+        # Fetch one extra row to know whether another page exists
+        segments = await db.transcriptsegment.find_many(
+            where=where,
+            order={"order": "asc"},
+            take=limit + 1
+        )
+        has_more = len(segments) > limit
+        segments = segments[:limit]
+
+        return TranscriptSegmentPage(
+            segments=[
+                TranscriptSegmentResponse(
+                    id=seg.id,
+                    transcriptId=seg.transcriptId,
+                    speakerId=seg.speakerId,
+                    speakerName=seg.speakerName,
+                    text=seg.text,
+                    startTime=seg.startTime,
+                    endTime=seg.endTime,
+                    order=seg.order
+                )
+                for seg in segments
+            ],
+            nextCursor=segments[-1].order if has_more else None
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"List segments failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"List segments failed: {str(e)}"
+        )
+
+
 @router.patch("/sessions/{session_id}", response_model=SessionResponse)
 async def update_session(
     session_id: str,
@@ -189,6 +320,8 @@ async def update_session(
             where={"id": session_id},
             data=updates
         )
+        if "title" in updates:
+            suggestion_service.invalidate(session.userId)
 
         logger.info(f"Session {session_id} updated")
 
@@ -257,6 +390,8 @@ async def update_speakers(session_id: str, speaker_update: SpeakerUpdate):
                 }
             )
 
+        await bump_content_version(session_id)
+
         logger.info(f"Updated speakers for session {session_id}")
 
         return JSONResponse(
@@ -317,6 +452,8 @@ async def update_summary(session_id: str, update: SummaryUpdate):
             data=update_data
         )
 
+        await bump_content_version(session_id)
+
         logger.info(f"Updated summary for session {session_id}")
 
         return JSONResponse(
@@ -374,6 +511,8 @@ async def create_action_item(session_id: str, action_item: ActionItemCreate):
             }
         )
 
+        await bump_content_version(session_id)
+
         logger.info(f"Created action item for session {session_id}")
 
         return JSONResponse(
@@ -443,6 +582,8 @@ async def update_action_item(
             data=update_data
         )
 
+        await bump_content_version(session_id)
+
         logger.info(f"Updated action item {action_item_id}")
 
         return JSONResponse(
@@ -495,6 +636,8 @@ async def delete_action_item(session_id: str, action_item_id: str):
             where={"id": action_item_id}
         )
 
+        await bump_content_version(session_id)
+
         logger.info(f"Deleted action item {action_item_id}")
 
         return JSONResponse(
@@ -546,9 +689,13 @@ async def delete_session(
             )
 
         # Delete session (cascades to transcript, summary, chat messages)
-        await db.session.delete(
-            where={"id": session_id}
-        )
+        async with db.tx(timeout=timedelta(seconds=settings.DB_TRANSACTION_TIMEOUT)) as tx:
+            await tx.session.delete(
+                where={"id": session_id}
+            )
+            await session_count_service.adjust(session.userId, -1, client=tx)
+        suggestion_service.invalidate(session.userId)
+        chat_context_cache.invalidate(session_id)
 
         logger.info(f"Deleted session {session_id}")
 
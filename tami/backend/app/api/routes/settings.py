@@ -157,12 +157,16 @@ async def test_connection(request: TestConnectionRequest):
         if request.provider.lower() == "whisper":
             # Lazy import for WhisperTranscriber (only needed for audio transcription)
             from src.transcription.whisper import WhisperTranscriber
+            from lib.utils.openai_clients import get_openai_client
 
             transcriber = WhisperTranscriber(
                 api_key=request.apiKey,
-                model=request.model or "whisper-1"
+                model=request.model or "whisper-1",
+                client=get_openai_client(request.apiKey)
             )
             transcriber.validate_config()
+            # One cheap authenticated request to check the key actually works
+            await transcriber.client.models.list()
             return TestConnectionResponse(
                 success=True,
                 message="Whisper API connection successful"
@@ -1,6 +1,6 @@
 """Tag management endpoints."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from fastapi import APIRouter, HTTPException, status, Query
 from pydantic import BaseModel
 from loguru import logger
@@ -56,6 +56,49 @@ class SessionTagResponse(BaseModel):
     createdAt: str
 
 
+async def _user_tag_session_counts(user_id: str) -> Dict[str, int]:
+    """Count sessions per tag for all of a user's tags in one aggregate.
+
+    Args:
+        user_id: User ID
+
+    Returns:
+        Dict mapping tag ID to session count (tags without sessions omitted)
+    """
+    rows = await db.query_raw(
+        '''
+        SELECT st."tagId", COUNT(*)::int AS count
+        FROM "SessionTag" st
+        JOIN "Tag" t ON t.id = st."tagId"
+        WHERE t."userId" = $1
+        GROUP BY st."tagId"
+        ''',
+        user_id
+    )
+    return {row["tagId"]: row["count"] for row in rows}
+
+
+async def _session_tag_session_counts(session_id: str) -> Dict[str, int]:
+    """Count sessions per tag for the tags on one session.
+
+    Args:
+        session_id: Session ID
+
+    Returns:
+        Dict mapping tag ID to session count
+    """
+    rows = await db.query_raw(
+        '''
+        SELECT st."tagId", COUNT(*)::int AS count
+        FROM "SessionTag" st
+        WHERE st."tagId" IN (SELECT "tagId" FROM "SessionTag" WHERE "sessionId" = $1)
+        GROUP BY st."tagId"
+        ''',
+        session_id
+    )
+    return {row["tagId"]: row["count"] for row in rows}
+
+
 @router.get("/tags", response_model=TagListResponse)
 async def list_tags(
     user_id: str = Query(..., alias="userId", description="User ID"),
@@ -82,12 +125,11 @@ async def list_tags(
         if source:
             where["source"] = source
 
-        # Get tags with session count
         tags = await db.tag.find_many(
             where=where,
-            include={"sessions": True},
             order={"name": "asc"}
         )
+        session_counts = await _user_tag_session_counts(user_id)
 
         return TagListResponse(
             tags=[
@@ -99,7 +141,7 @@ async def list_tags(
                     source=t.source,
                     isVisible=t.isVisible,
                     createdAt=t.createdAt.isoformat(),
-                    sessionCount=len(t.sessions) if t.sessions else 0
+                    sessionCount=session_counts.get(t.id, 0)
                 )
                 for t in tags
             ],
@@ -195,8 +237,7 @@ async def update_tag(
     try:
         # Get existing tag
         tag = await db.tag.find_unique(
-            where={"id": tag_id},
-            include={"sessions": True}
+            where={"id": tag_id}
         )
 
         if not tag:
@@ -211,6 +252,8 @@ async def update_tag(
                 detail="Not authorized to update this tag"
             )
 
+        session_count = await db.sessiontag.count(where={"tagId": tag_id})
+
         # Build update data
         update_data = {}
         if tag_update.name is not None:
@@ -245,14 +288,13 @@ async def update_tag(
                 source=tag.source,
                 isVisible=tag.isVisible,
                 createdAt=tag.createdAt.isoformat(),
-                sessionCount=len(tag.sessions) if tag.sessions else 0
+                sessionCount=session_count
             )
 
         # Update tag
         updated = await db.tag.update(
             where={"id": tag_id},
-            data=update_data,
-            include={"sessions": True}
+            data=update_data
         )
 
         return TagResponse(
@@ -263,7 +305,7 @@ async def update_tag(
             source=updated.source,
             isVisible=updated.isVisible,
             createdAt=updated.createdAt.isoformat(),
-            sessionCount=len(updated.sessions) if updated.sessions else 0
+            sessionCount=session_count
         )
 
     except HTTPException:
@@ -491,6 +533,7 @@ async def get_session_tags(
             where={"sessionId": session_id},
             include={"tag": True}
         )
+        session_counts = await _session_tag_session_counts(session_id)
 
         tags = []
         for st in session_tags:
@@ -505,7 +548,7 @@ async def get_session_tags(
                     source=st.tag.source,
                     isVisible=st.tag.isVisible,
                     createdAt=st.tag.createdAt.isoformat(),
-                    sessionCount=0  # Not calculating here for performance
+                    sessionCount=session_counts.get(st.tag.id, 0)
                 )
             )
 
@@ -1,10 +1,9 @@
 """Transcription endpoints."""
 
-import asyncio
-from pathlib import Path
-from typing import Optional
-from fastapi import APIRouter, HTTPException, status, BackgroundTasks
-from fastapi.responses import JSONResponse
+import json
+from datetime import timedelta
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 from loguru import logger
 
 from app.db import db
@@ -17,339 +16,22 @@ from app.schemas.transcription import (
     TranscriptSegmentResponse,
     ActionItemResponse
 )
-# Lazy import transcription_service only when needed (for audio files)
-# This allows text imports to work without the src/ dependencies
-from app.services.summarization import summarization_service
-from app.services.refinement import get_refinement_service
-from app.services.entity_extraction import get_entity_extraction_service
-from app.services.billing import billing_service
+from app.services.job_queue import JobAlreadyActiveError, job_queue
+from app.services.session_counts import session_count_service
+from app.services.status_stream import get_status_snapshot, status_broadcaster
 
 router = APIRouter()
 
 
-async def process_transcription(
-    session_id: str,
-    audio_path: Path,
-    context: str,
-    participants: Optional[list[str]],
-    provider: str,
-    model: str,
-    summary_model: str,
-    api_key: str,
-    auto_detect_language: bool = True
-):
-    """Background task to process transcription.
-
-    Args:
-        session_id: Session ID
-        audio_path: Path to audio file
-        context: Meeting context
-        participants: List of participants
-        provider: Transcription provider
-        model: Transcription model
-        summary_model: Model for summarization
-        api_key: API key
-        auto_detect_language: Enable automatic language detection and routing
-    """
-    detected_language = None
-
-    try:
-        # Update session status to processing
-        await db.session.update(
-            where={"id": session_id},
-            data={"status": "processing"}
-        )
-
-        logger.info(f"Processing transcription for session {session_id}")
-
-        # Determine file type (audio or text import)
-        file_ext = audio_path.suffix.lower()
-        is_text_import = file_ext == ".txt"
-
-        if is_text_import:
-            # Text import: parse transcript file directly
-            logger.info(f"Processing text import for session {session_id}")
-            from app.services.transcript_parser import transcript_parser
-
-            transcript_result = transcript_parser.parse_text_file(audio_path)
-            detected_language = "he"  # Default to Hebrew for text imports
-
-            # Update session with detected language
-            await db.session.update(
-                where={"id": session_id},
-                data={"detectedLanguage": detected_language}
-            )
-
-            # Set OpenAI key for summarization (used later in the function)
-            openai_key = settings.OPENAI_API_KEY or api_key
-
-            logger.info(f"Text import complete. {len(transcript_result.segments)} segments parsed")
-
-        # Check if we should use automatic language detection and routing
-        elif auto_detect_language and provider == "auto":
-            logger.info("Using automatic language detection and ASR routing")
-
-            # Import transcription service (lazy import for audio files only)
-            from app.services.transcription import transcription_service
-
-            # Use auto-routing: detect language and route to appropriate provider
-            openai_key = settings.OPENAI_API_KEY or api_key
-            ivrit_key = settings.IVRIT_API_KEY
-            ivrit_endpoint = settings.IVRIT_ENDPOINT_ID
-
-            transcript_result, detected_language = await transcription_service.transcribe_with_auto_routing(
-                audio_path=audio_path,
-                openai_api_key=openai_key,
-                ivrit_api_key=ivrit_key,
-                ivrit_endpoint_id=ivrit_endpoint,
-                participants=participants
-            )
-
-            # Update session with detected language
-            await db.session.update(
-                where={"id": session_id},
-                data={"detectedLanguage": detected_language}
-            )
-
-            logger.info(f"Auto-routing complete. Detected language: {detected_language}")
-
-        else:
-            # Use explicitly specified provider
-            logger.info(f"Using explicit provider: {provider}")
-
-            # Import transcription service (lazy import for audio files only)
-            from app.services.transcription import transcription_service
-
-            # Get endpoint_id from settings if using Ivrit provider
-            endpoint_id = settings.IVRIT_ENDPOINT_ID if provider.lower() == "ivrit" else None
-
-            transcript_result = await transcription_service.transcribe_audio(
-                audio_path=audio_path,
-                provider=provider,
-                model=model,
-                api_key=api_key,
-                participants=participants,
-                endpoint_id=endpoint_id
-            )
-
-            detected_language = transcript_result.language
-
-        # Refine transcript using GPT-4o (post-processing with context)
-        # Only run if enabled - this feature is experimental and can corrupt output
-        if settings.ENABLE_TRANSCRIPT_REFINEMENT:
-            openai_key = settings.OPENAI_API_KEY
-            if openai_key:
-                refinement_service = get_refinement_service()
-                transcript_result = await refinement_service.refine_transcript(
-                    transcript=transcript_result,
-                    context=context,
-                    api_key=openai_key,
-                    model="gpt-4o"
-                )
-                logger.info(f"Transcript refined for session {session_id}")
-            else:
-                logger.warning("Refinement enabled but no OpenAI API key - skipping")
-        else:
-            logger.info("Transcript refinement disabled, using original transcript")
-
-        # Create transcript in database
-        transcript_record = await db.transcript.create(
-            data={
-                "sessionId": session_id,
-                "language": transcript_result.language,
-                "duration": transcript_result.metadata.get("duration") if transcript_result.metadata else None
-            }
-        )
-
-        # Create transcript segments
-        for idx, segment in enumerate(transcript_result.segments):
-            await db.transcriptsegment.create(
-                data={
-                    "transcriptId": transcript_record.id,
-                    "speakerId": segment.speaker.lower().replace(" ", "_") if segment.speaker else f"speaker_{(idx % 10) + 1}",
-                    "speakerName": segment.speaker if segment.speaker and segment.speaker != "Unknown" else None,
-                    "text": segment.text,
-                    "startTime": segment.start_time,
-                    "endTime": segment.end_time,
-                    "order": idx
-                }
-            )
-
-        logger.info(f"Transcript saved for session {session_id}")
-
-        # Generate summary
-        # Always use OpenAI API key for summarization, regardless of transcription provider
-        summary_result = await summarization_service.generate_summary(
-            transcript=transcript_result,
-            context=context,
-            participants=participants or [],
-            api_key=openai_key,
-            model=summary_model
-        )
-
-        # Create summary in database
-        summary_record = await db.summary.create(
-            data={
-                "sessionId": session_id,
-                "overview": summary_result.overview,
-                "keyPoints": summary_result.key_points
-            }
-        )
-
-        # Create action items
-        for action in summary_result.action_items:
-            await db.actionitem.create(
-                data={
-                    "summaryId": summary_record.id,
-                    "description": action.description,
-                    "assignee": action.assignee,
-                    "deadline": action.deadline
-                }
-            )
-
-        logger.info(f"Summary saved for session {session_id}")
-
-        # Extract entities from transcript
-        try:
-            # Get user ID from session
-            session_data = await db.session.find_unique(where={"id": session_id})
-            user_id = session_data.userId if session_data else None
-
-            if user_id:
-                # Build full transcript text
-                transcript_text = " ".join([seg.text for seg in transcript_result.segments])
-
-                # Extract entities
-                entity_service = get_entity_extraction_service(openai_key)
-                extracted_entities = await entity_service.extract_and_deduplicate(
-                    transcript_text=transcript_text,
-                    context=context
-                )
-
-                # Save entities and create mentions
-                for entity_type, entities in extracted_entities.items():
-                    for entity in entities:
-                        # Upsert entity (create or update mention count)
-                        existing = await db.entity.find_first(
-                            where={
-                                "userId": user_id,
-                                "type": entity_type,
-                                "normalizedValue": entity.normalized_form
-                            }
-                        )
-
-                        if existing:
-                            # Update existing entity
-                            entity_record = await db.entity.update(
-                                where={"id": existing.id},
-                                data={"mentionCount": existing.mentionCount + 1}
-                            )
-                        else:
-                            # Create new entity
-                            entity_record = await db.entity.create(
-                                data={
-                                    "userId": user_id,
-                                    "type": entity_type,
-                                    "value": entity.entity,
-                                    "normalizedValue": entity.normalized_form
-                                }
-                            )
-
-                        # Create mention
-                        await db.entitymention.create(
-                            data={
-                                "entityId": entity_record.id,
-                                "sessionId": session_id,
-                                "context": entity.context
-                            }
-                        )
-
-                        # Create auto-tags for person, organization, project entities
-                        if entity_type in ["person", "organization", "project"]:
-                            tag_source = f"auto:{entity_type}"
-                            tag_name = entity.entity[:50]  # Limit tag name length
-
-                            # Upsert auto-tag
-                            existing_tag = await db.tag.find_first(
-                                where={"userId": user_id, "name": tag_name}
-                            )
-
-                            if not existing_tag:
-                                new_tag = await db.tag.create(
-                                    data={
-                                        "userId": user_id,
-                                        "name": tag_name,
-                                        "source": tag_source,
-                                        "isVisible": False,  # Auto-tags are hidden by default
-                                        "color": "#9CA3AF"  # Gray for auto-tags
-                                    }
-                                )
-                                tag_id = new_tag.id
-                            else:
-                                tag_id = existing_tag.id
-
-                            # Link tag to session (if not already linked)
-                            existing_session_tag = await db.sessiontag.find_first(
-                                where={"sessionId": session_id, "tagId": tag_id}
-                            )
-                            if not existing_session_tag:
-                                await db.sessiontag.create(
-                                    data={
-                                        "sessionId": session_id,
-                                        "tagId": tag_id
-                                    }
-                                )
-
-                logger.info(f"Entities extracted and saved for session {session_id}")
-
-        except Exception as entity_error:
-            # Entity extraction failure shouldn't fail the whole transcription
-            logger.error(f"Entity extraction failed for session {session_id}: {entity_error}")
-
-        # Update session status to completed
-        await db.session.update(
-            where={"id": session_id},
-            data={"status": "completed"}
-        )
-
-        # Record usage for billing
-        try:
-            session_data = await db.session.find_unique(where={"id": session_id})
-            if session_data:
-                duration_minutes = (transcript_result.metadata.get("duration", 0) / 60.0) if transcript_result.metadata else 0.0
-                if duration_minutes > 0:
-                    await billing_service.record_usage(
-                        user_id=session_data.userId,
-                        session_id=session_id,
-                        duration_minutes=duration_minutes
-                    )
-                    logger.info(f"Recorded {duration_minutes:.2f} minutes of usage for session {session_id}")
-        except Exception as billing_error:
-            # Billing failure shouldn't fail the transcription
-            logger.error(f"Failed to record usage for session {session_id}: {billing_error}")
-
-        logger.info(f"Transcription completed for session {session_id}")
-
-    except Exception as e:
-        logger.error(f"Transcription failed for session {session_id}: {e}")
-
-        # Update session status to failed
-        await db.session.update(
-            where={"id": session_id},
-            data={"status": "failed"}
-        )
-
-
 @router.post("/transcribe", response_model=TranscriptionStatusResponse)
-async def transcribe(
-    request: TranscriptionRequest,
-    background_tasks: BackgroundTasks
-):
+async def transcribe(request: TranscriptionRequest):
     """Start transcription process.
 
+    Creates the session and enqueues a durable transcription job; a job
+    worker picks it up.
+
     Args:
         request: Transcription request
-        background_tasks: FastAPI background tasks
 
     Returns:
         Session ID and initial status
@@ -387,39 +69,39 @@ async def transcribe(
         audio_path = audio_files[0]
 
         # Create session in database
-        session = await db.session.create(
-            data={
-                "audioFileName": audio_path.name,
-                "audioFileUrl": str(audio_path),
-                "context": request.context,
-                "status": "pending",
-                "userId": request.userId
-            }
-        )
+        async with db.tx(timeout=timedelta(seconds=settings.DB_TRANSACTION_TIMEOUT)) as tx:
+            session = await tx.session.create(
+                data={
+                    "audioFileName": audio_path.name,
+                    "audioFileUrl": str(audio_path),
+                    "context": request.context,
+                    "status": "pending",
+                    "userId": request.userId
+                }
+            )
+            await session_count_service.adjust(request.userId, 1, client=tx)
 
         logger.info(f"Created session {session.id} for transcription")
 
-        # Get API key based on provider
-        # TODO: Get API key from user settings in database
-        # For now, use the API key from environment variable based on provider
-        if request.transcriptionProvider.lower() == "ivrit":
-            api_key = settings.IVRIT_API_KEY or settings.SECRET_KEY
-        else:
-            api_key = settings.OPENAI_API_KEY or settings.SECRET_KEY
-
-        # Start background transcription
-        background_tasks.add_task(
-            process_transcription,
-            session_id=session.id,
-            audio_path=audio_path,
-            context=request.context,
-            participants=request.participants,
-            provider=request.transcriptionProvider,
-            model=request.transcriptionModel,
-            summary_model=request.summaryModel,
-            api_key=api_key,
-            auto_detect_language=request.autoDetectLanguage
-        )
+        # Queue transcription for a job worker
+        try:
+            await job_queue.enqueue(
+                kind="transcription",
+                session_id=session.id,
+                payload={
+                    "session_id": session.id,
+                    "audio_path": str(audio_path),
+                    "context": request.context,
+                    "participants": request.participants,
+                    "provider": request.transcriptionProvider,
+                    "model": request.transcriptionModel,
+                    "summary_model": request.summaryModel,
+                    "auto_detect_language": request.autoDetectLanguage
+                }
+            )
+        except Exception:
+            await db.session.update(where={"id": session.id}, data={"status": "failed"})
+            raise
 
         return TranscriptionStatusResponse(
             sessionId=session.id,
@@ -436,26 +118,104 @@ async def transcribe(
         )
 
 
+@router.post("/transcribe/{session_id}/retry", response_model=TranscriptionStatusResponse)
+async def retry_transcription(session_id: str):
+    """Retry a failed transcription.
+
+    Refused while the session still has a queued or running transcription
+    job (e.g. the worker's own retry). The new job resumes from the first
+    pipeline stage without a checkpoint, so completed stages (e.g. ASR) are
+    not repeated.
+
+    Args:
+        session_id: Session ID
+
+    Returns:
+        Session ID and new status
+    """
+    try:
+        session = await db.session.find_unique(where={"id": session_id})
+
+        if not session:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Session not found"
+            )
+
+        if session.status != "failed":
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Only failed sessions can be retried (status: {session.status})"
+            )
+
+        payload = await job_queue.latest_payload(session_id, kind="transcription")
+        if payload is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="No transcription job found for session"
+            )
+
+        try:
+            await job_queue.enqueue(kind="transcription", session_id=session_id, payload=payload)
+        except JobAlreadyActiveError:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="A transcription job is already queued or running for this session"
+            )
+
+        # Leave the status alone if the new job already started
+        await db.session.update_many(
+            where={"id": session_id, "status": "failed"},
+            data={"status": "pending"}
+        )
+
+        return TranscriptionStatusResponse(sessionId=session_id, status="pending")
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to retry transcription for session {session_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retry transcription: {str(e)}"
+        )
+
+
 @router.get("/transcribe/{session_id}/status", response_model=TranscriptionStatusResponse)
-async def get_transcription_status(session_id: str):
+async def get_transcription_status(
+    session_id: str,
+    lightweight: bool = Query(False, description="Return status and progress only, without transcript or summary"),
+    include_segments: bool = Query(True, alias="includeSegments", description="Include transcript segments (page them via /sessions/{id}/segments otherwise)")
+):
     """Get transcription status.
 
     Args:
         session_id: Session ID
+        lightweight: Skip loading segments, summary and action items
+        include_segments: Load transcript segments with the transcript
 
     Returns:
         Status and results if completed
     """
     try:
+        if lightweight:
+            snapshot = await get_status_snapshot(session_id)
+            if not snapshot:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Session not found"
+                )
+            return TranscriptionStatusResponse(**snapshot)
+
         # Get session
         session = await db.session.find_unique(
             where={"id": session_id},
             include={
                 "transcript": {
                     "include": {
-                        "segments": True
+                        "segments": {"order_by": {"order": "asc"}}
                     }
-                },
+                } if include_segments else True,
                 "summary": {
                     "include": {
                         "actionItems": True
@@ -497,7 +257,7 @@ async def get_transcription_status(session_id: str):
                         endTime=seg.endTime,
                         order=seg.order
                     )
-                    for seg in sorted(session.transcript.segments, key=lambda x: x.order)
+                    for seg in session.transcript.segments or []
                 ]
             )
 
@@ -531,3 +291,46 @@ async def get_transcription_status(session_id: str):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Get status failed: {str(e)}"
         )
+
+
+@router.get("/transcribe/{session_id}/events")
+async def stream_transcription_status(session_id: str, request: Request):
+    """Stream status changes as Server-Sent Events.
+
+    Sends a ``status`` event (lightweight status payload) on every status or
+    stage change and closes after the session completes or fails. Idle
+    periods are filled with keep-alive comments.
+
+    Args:
+        session_id: Session ID
+        request: Incoming request (used to detect client disconnects)
+
+    Returns:
+        text/event-stream response
+    """
+    if not await get_status_snapshot(session_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Session not found"
+        )
+
+    async def event_stream():
+        updates = status_broadcaster.subscribe(session_id, heartbeat=settings.STATUS_STREAM_HEARTBEAT)
+        try:
+            async for snapshot in updates:
+                if await request.is_disconnected():
+                    break
+                if snapshot is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: status\ndata: {json.dumps(snapshot)}\n\n"
+            else:
+                yield "event: end\ndata: {}\n\n"
+        finally:
+            await updates.aclose()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -1,11 +1,19 @@
 """FastAPI application entry point."""
 
+import asyncio
+import sys
+from typing import Optional
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
 
 from app.core.config import settings
 from app.db import connect_db, disconnect_db
+from app.services.audio_executor import audio_executor
+from app.services.job_worker import JobWorker
+from app.services.openai_clients import configure_openai_clients, openai_clients
+from app.services.provider_scheduler import configure_provider_scheduler, provider_scheduler
 from app.api.routes import upload, transcribe, sessions, chat, record, entities, tags, search
 from app.api.routes import settings as settings_router
 # Billing disabled for early users - uncomment when ready:
@@ -18,6 +26,14 @@ app = FastAPI(
     debug=settings.DEBUG,
 )
 
+# In-process job worker (see JOB_RUN_IN_PROCESS)
+job_worker: Optional[JobWorker] = None
+job_worker_task: Optional[asyncio.Task] = None
+
+# Seconds to let running jobs finish on shutdown; unfinished jobs are retried
+# by another worker once their lease expires
+JOB_SHUTDOWN_GRACE_SECONDS = 30
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -42,12 +58,30 @@ async def startup_event():
         logger.error(f"Failed to connect to database: {e}")
         logger.warning("Server starting without database connection")
 
+    # Pool settings for the shared OpenAI clients, rate limits for provider calls
+    configure_openai_clients()
+    configure_provider_scheduler()
+
+    # Start in-process job worker
+    if settings.JOB_RUN_IN_PROCESS:
+        global job_worker, job_worker_task
+        job_worker = JobWorker()
+        job_worker_task = asyncio.create_task(job_worker.run())
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Run on application shutdown."""
     logger.info(f"Shutting down {settings.APP_NAME}")
 
+    # Stop in-process job worker
+    if job_worker and job_worker_task:
+        job_worker.stop()
+        done, _ = await asyncio.wait({job_worker_task}, timeout=JOB_SHUTDOWN_GRACE_SECONDS)
+        if not done:
+            logger.warning("Jobs still running at shutdown; they will be retried after their lease expires")
+            job_worker_task.cancel()
+
     # Disconnect from database
     try:
         await disconnect_db()
@@ -55,6 +89,17 @@ async def shutdown_event():
     except Exception as e:
         logger.error(f"Failed to disconnect from database: {e}")
 
+    # Close pooled OpenAI connections
+    await openai_clients.aclose()
+
+    # Stop audio workers
+    audio_executor.shutdown(wait=False, cancel_futures=True)
+
+    # Remove processed audio cached by this process (only loaded for audio jobs)
+    if "app.services.transcription" in sys.modules:
+        from app.services.transcription import transcription_service
+        transcription_service.audio_cache.clear()
+
 
 @app.get("/")
 async def root():
@@ -69,7 +114,12 @@ async def root():
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy"}
+    return {
+        "status": "healthy",
+        "audio_workers": audio_executor.stats(),
+        "openai_clients": openai_clients.stats(),
+        "providers": provider_scheduler.stats()
+    }
 
 
 # Include API routers
@@ -51,3 +51,4 @@ class SessionListResponse(BaseModel):
     total: int
     page: int
     pageSize: int
+    nextCursor: Optional[str] = None  # Pass as ``cursor`` for the next page; None on the last page
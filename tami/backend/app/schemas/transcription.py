@@ -1,6 +1,6 @@
 """Pydantic schemas for transcription."""
 
-from typing import Optional, List
+from typing import Dict, Optional, List
 from pydantic import BaseModel
 
 
@@ -23,6 +23,12 @@ class TranscriptSegmentResponse(TranscriptSegmentBase):
         from_attributes = True
 
 
+class TranscriptSegmentPage(BaseModel):
+    """Schema for one page of transcript segments."""
+    segments: List[TranscriptSegmentResponse]
+    nextCursor: Optional[int] = None  # Pass as ``cursor`` to get the next page; None on the last page
+
+
 class TranscriptBase(BaseModel):
     """Base transcript schema."""
     language: str
@@ -111,6 +117,9 @@ class TranscriptionStatusResponse(BaseModel):
     audioFileName: Optional[str] = None
     audioFileUrl: Optional[str] = None
     detectedLanguage: Optional[str] = None  # Detected language code
+    stage: Optional[str] = None  # Pipeline stage running now
+    progress: Optional[float] = None  # Fraction of pipeline stages completed
+    stageTimings: Optional[Dict[str, float]] = None  # Seconds per completed stage
     transcript: Optional[TranscriptResponse] = None
     summary: Optional[SummaryResponse] = None
     error: Optional[str] = None
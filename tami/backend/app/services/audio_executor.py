@@ -0,0 +1,127 @@
+"""Process pool for CPU-bound audio preprocessing."""
+
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from loguru import logger
+
+from app.core.config import settings
+
+
+class AudioExecutor(Executor):
+    """Bounded process pool that keeps audio decoding off the event loop.
+
+    Wraps a ``ProcessPoolExecutor`` to track jobs in flight, so the queue
+    depth (jobs waiting for a free worker) can be reported. The pool is
+    started on first use, so importing this module (or handling text
+    imports) never forks worker processes.
+
+    If a worker process dies (e.g. killed for memory while decoding), the
+    pool is broken: the jobs it held fail with ``BrokenProcessPool`` and the
+    pool is replaced, so later jobs run on fresh workers.
+    """
+
+    def __init__(self, max_workers: int):
+        """Initialize audio executor.
+
+        Args:
+            max_workers: Number of worker processes
+        """
+        self.max_workers = max(1, max_workers)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._submitted = 0
+        self._completed = 0
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        """Submit a picklable callable to the pool.
+
+        Args:
+            fn: Module-level function
+            *args: Picklable positional arguments
+            **kwargs: Picklable keyword arguments
+
+        Returns:
+            Future for the result
+        """
+        with self._lock:
+            if self._pool is None:
+                self._pool = self._start_pool()
+            try:
+                future = self._pool.submit(fn, *args, **kwargs)
+            except BrokenProcessPool:
+                # Broke before its failed jobs reported back; replace it now
+                self._replace_pool(self._pool)
+                self._pool = self._start_pool()
+                future = self._pool.submit(fn, *args, **kwargs)
+            pool = self._pool
+            self._in_flight += 1
+            self._submitted += 1
+            queue_depth = max(0, self._in_flight - self.max_workers)
+
+        if queue_depth:
+            logger.info(f"Audio job queued behind {queue_depth} others")
+
+        future.add_done_callback(lambda done: self._on_done(done, pool))
+        return future
+
+    def _on_done(self, future: Future, pool: ProcessPoolExecutor) -> None:
+        """Update counters when a job finishes; replace the pool if it broke."""
+        broken = not future.cancelled() and isinstance(future.exception(), BrokenProcessPool)
+        with self._lock:
+            self._in_flight -= 1
+            self._completed += 1
+            if broken and self._pool is pool:
+                self._replace_pool(pool)
+
+    def _start_pool(self) -> ProcessPoolExecutor:
+        """Create the worker pool. Caller must hold the lock."""
+        logger.info(f"Starting audio process pool with {self.max_workers} workers")
+        return ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def _replace_pool(self, pool: ProcessPoolExecutor) -> None:
+        """Drop a broken pool; the next submit starts a new one. Caller must hold the lock."""
+        logger.error("Audio worker process died; restarting the audio process pool")
+        if self._pool is pool:
+            self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def queue_depth(self) -> int:
+        """Jobs waiting for a free worker."""
+        with self._lock:
+            return max(0, self._in_flight - self.max_workers)
+
+    def stats(self) -> dict:
+        """Get executor metrics.
+
+        Returns:
+            Dict with pool size, busy workers, queue depth and job counters
+        """
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "busy": min(self._in_flight, self.max_workers),
+                "queue_depth": max(0, self._in_flight - self.max_workers),
+                "submitted": self._submitted,
+                "completed": self._completed,
+            }
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Stop worker processes.
+
+        Args:
+            wait: Wait for running jobs to finish
+            cancel_futures: Cancel jobs that haven't started
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+# Singleton instance
+audio_executor = AudioExecutor(settings.AUDIO_WORKER_PROCESSES)
@@ -127,6 +127,9 @@ class BillingService:
     ) -> dict:
         """Record usage for a transcription.
 
+        Idempotent per session: a retried job that already recorded usage
+        does not bill the session again.
+
         Args:
             user_id: User ID
             session_id: Session ID
@@ -142,6 +145,11 @@ class BillingService:
             logger.error(f"User not found for usage recording: {user_id}")
             return {}
 
+        existing = await db.usagelog.find_first(where={"sessionId": session_id})
+        if existing:
+            logger.info(f"Usage already recorded for session {session_id}, skipping")
+            return await self.get_user_subscription_status(user_id)
+
         # Create usage log
         await db.usagelog.create(
             data={
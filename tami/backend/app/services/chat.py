@@ -2,41 +2,46 @@
 
 import sys
 from pathlib import Path
-from typing import List, AsyncGenerator
+from typing import List, AsyncGenerator, Optional
 from loguru import logger
 
 # Add parent directory to path to import from meeting-transcriber
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent.parent.parent))
 
 from lib.chat.chatbot import Chatbot
-from lib.utils.models import TranscriptResult, Summary
+from lib.chat.memory import ConversationMemory
+from app.core.config import settings
+from app.services.chat_context import ChatContext
 
 
 class ChatService:
-    """Service for interactive Q&A about meetings."""
+    """Service for interactive Q&A about meetings.
+
+    Short transcripts are sent to the model in full. Longer ones (over
+    CHAT_FULL_TRANSCRIPT_MAX_TOKENS) are indexed once per session and each
+    question only carries the summary plus the most relevant segments.
+    Both the full-transcript prompt and the index come prebuilt from the
+    session's ChatContext (see app.services.chat_context).
+    """
 
     async def chat(
         self,
         user_question: str,
-        transcript: TranscriptResult,
-        summary: Summary,
-        context: str,
-        participants: List[str],
+        chat_context: ChatContext,
         api_key: str,
         model: str = "gpt-4o-mini",
-        conversation_history: List[dict] = None
+        conversation_history: List[dict] = None,
+        memory: Optional[ConversationMemory] = None
     ) -> str:
         """Chat with the meeting transcript.
 
         Args:
             user_question: User's question
-            transcript: Transcript result
-            summary: Meeting summary
-            context: Meeting context
-            participants: List of participants
+            chat_context: Session's prebuilt chat context
             api_key: OpenAI API key
             model: Model to use for chat
-            conversation_history: Previous conversation messages
+            conversation_history: Messages not yet folded into the memory summary
+            memory: Conversation memory (summary of older turns, history budget)
 
         Returns:
             Assistant's response
@@ -44,21 +49,7 @@ class ChatService:
         logger.info(f"Processing chat question with {model}")
 
         try:
-            # Create chatbot with only api_key and model
-            chatbot = Chatbot(
-                api_key=api_key,
-                model=model
-            )
-
-            # Set context with transcript and summary
-            chatbot.set_context(
-                transcript=transcript,
-                summary=summary
-            )
-
-            # Restore conversation history if provided
-            if conversation_history:
-                chatbot.conversation_history = conversation_history
+            chatbot = self._create_chatbot(chat_context, api_key, model, conversation_history, memory)
 
             response = await chatbot.chat(user_question)
             logger.info("Chat response generated")
@@ -71,61 +62,69 @@ class ChatService:
     async def chat_stream(
         self,
         user_question: str,
-        transcript: TranscriptResult,
-        summary: Summary,
-        context: str,
-        participants: List[str],
+        chat_context: ChatContext,
         api_key: str,
         model: str = "gpt-4o-mini",
-        conversation_history: List[dict] = None
+        conversation_history: List[dict] = None,
+        memory: Optional[ConversationMemory] = None
     ) -> AsyncGenerator[str, None]:
         """Chat with streaming response.
 
         Args:
             user_question: User's question
-            transcript: Transcript result
-            summary: Meeting summary
-            context: Meeting context
-            participants: List of participants
+            chat_context: Session's prebuilt chat context
             api_key: OpenAI API key
             model: Model to use for chat
-            conversation_history: Previous conversation messages
+            conversation_history: Messages not yet folded into the memory summary
+            memory: Conversation memory (summary of older turns, history budget)
 
         Yields:
-            Chunks of the assistant's response
+            Response text as the model generates it
         """
         logger.info(f"Processing streaming chat question with {model}")
 
         try:
-            # Create chatbot with only api_key and model
-            chatbot = Chatbot(
-                api_key=api_key,
-                model=model
-            )
-
-            # Set context with transcript and summary
-            chatbot.set_context(
-                transcript=transcript,
-                summary=summary
-            )
+            chatbot = self._create_chatbot(chat_context, api_key, model, conversation_history, memory)
 
-            # Restore conversation history if provided
-            if conversation_history:
-                chatbot.conversation_history = conversation_history
-
-            # For now, return the full response
-            # TODO: Implement true streaming when chatbot supports it
-            response = await chatbot.chat(user_question)
-
-            # Yield in chunks to simulate streaming
-            chunk_size = 50
-            for i in range(0, len(response), chunk_size):
-                yield response[i:i+chunk_size]
+            async for delta in chatbot.chat_stream(user_question):
+                yield delta
 
         except Exception as e:
             logger.error(f"Streaming chat failed: {e}")
             raise
 
+    @staticmethod
+    def _create_chatbot(
+        chat_context: ChatContext,
+        api_key: str,
+        model: str,
+        conversation_history: Optional[List[dict]],
+        memory: Optional[ConversationMemory]
+    ) -> Chatbot:
+        """Create a chatbot with full-transcript or retrieval context and history."""
+        chatbot = Chatbot(
+            api_key=api_key,
+            model=model,
+            embedding_model=settings.CHAT_EMBEDDING_MODEL,
+            memory=memory
+        )
+
+        if chat_context.uses_retrieval:
+            chatbot.set_retrieval_context(
+                summary=chat_context.summary,
+                index=chat_context.index,
+                top_k=settings.CHAT_RETRIEVAL_TOP_K,
+                token_budget=settings.CHAT_RETRIEVAL_TOKEN_BUDGET
+            )
+        else:
+            chatbot.set_system_prompt(chat_context.system_prompt)
+
+        # Restore conversation history after the system prompt
+        if conversation_history:
+            chatbot.conversation_history.extend(conversation_history)
+
+        return chatbot
+
 
 # Singleton instance
 chat_service = ChatService()
@@ -0,0 +1,251 @@
+"""Per-session chat context cache.
+
+Building a session's chat context means loading every segment, the summary
+and action items, converting them to service models and formatting the
+system prompt (or indexing the transcript for retrieval). The result only
+changes when the session content does, so it is cached per session and
+tagged with ``Session.contentVersion``. Each chat request reads just that
+counter; a follow-up question on an unchanged session skips the reload.
+
+Every edit to segments (speaker names), the summary or action items, and
+every pipeline persist, must call ``bump_content_version``. The version
+lives in the database, so API processes other than the editing one also
+notice the change. The cache is an LRU bounded by an approximate memory
+size (CHAT_CONTEXT_CACHE_MAX_BYTES).
+"""
+
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from fastapi import HTTPException, status
+from loguru import logger
+
+from app.db import db
+from app.core.config import settings
+from lib.chat.chatbot import Chatbot
+from lib.chat.retrieval import TranscriptIndex
+from lib.utils.models import TranscriptResult, TranscriptSegment, Summary, ActionItem
+
+
+@dataclass
+class ChatContext:
+    """Prebuilt chat inputs for one version of a session's content."""
+    session_id: str
+    version: int
+    context: str
+    transcript: TranscriptResult
+    summary: Summary
+    participants: List[str]
+    system_prompt: str  # Full-transcript prompt; unused in retrieval mode
+    index: Optional[TranscriptIndex] = None  # Set when the transcript is long enough for retrieval
+    size_bytes: int = 0
+
+    @property
+    def uses_retrieval(self) -> bool:
+        """Whether questions get retrieved excerpts instead of the full transcript."""
+        return self.index is not None
+
+
+async def bump_content_version(session_id: str, client: Optional[Any] = None) -> None:
+    """Mark a session's chat-relevant content as changed.
+
+    Args:
+        session_id: Session ID
+        client: Transaction to run in (default: the shared client)
+    """
+    await (client or db).execute_raw(
+        'UPDATE "Session" SET "contentVersion" = "contentVersion" + 1 WHERE id = $1',
+        session_id
+    )
+    chat_context_cache.invalidate(session_id)
+
+
+class ChatContextCache:
+    """LRU of chat contexts, bounded by approximate memory use."""
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        """Initialize cache.
+
+        Args:
+            max_bytes: Approximate memory cap (default: CHAT_CONTEXT_CACHE_MAX_BYTES)
+        """
+        self.max_bytes = max_bytes or settings.CHAT_CONTEXT_CACHE_MAX_BYTES
+        self._entries: "OrderedDict[str, ChatContext]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, session_id: str, api_key: str) -> ChatContext:
+        """Get a session's chat context, rebuilding it if the content changed.
+
+        Args:
+            session_id: Session ID
+            api_key: OpenAI API key (used to embed segments for retrieval)
+
+        Returns:
+            Chat context
+
+        Raises:
+            HTTPException: If the session is missing or not transcribed yet
+        """
+        row = await db.query_first('SELECT "contentVersion" FROM "Session" WHERE id = $1', session_id)
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Session not found"
+            )
+
+        cached = self._entries.get(session_id)
+        if cached and cached.version == row["contentVersion"]:
+            self._entries.move_to_end(session_id)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        chat_context = await self._build(session_id, row["contentVersion"], api_key)
+        self._store(chat_context)
+        return chat_context
+
+    def invalidate(self, session_id: str) -> None:
+        """Drop a session's cached context.
+
+        Args:
+            session_id: Session ID
+        """
+        entry = self._entries.pop(session_id, None)
+        if entry:
+            self._bytes -= entry.size_bytes
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache statistics."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+    def _store(self, chat_context: ChatContext) -> None:
+        """Insert a context and evict least recently used ones over the cap."""
+        self.invalidate(chat_context.session_id)
+        if chat_context.size_bytes > self.max_bytes:
+            return
+
+        self._entries[chat_context.session_id] = chat_context
+        self._bytes += chat_context.size_bytes
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size_bytes
+
+    async def _build(self, session_id: str, version: int, api_key: str) -> ChatContext:
+        """Load a session's content and build its chat context."""
+        session = await db.session.find_unique(
+            where={"id": session_id},
+            include={
+                "transcript": {
+                    "include": {
+                        "segments": {"order_by": {"order": "asc"}}
+                    }
+                },
+                "summary": {
+                    "include": {
+                        "actionItems": True
+                    }
+                }
+            }
+        )
+
+        if not session:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Session not found"
+            )
+
+        if not session.transcript or not session.summary:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Session transcription not complete"
+            )
+
+        # Convert database models to service models
+        transcript = TranscriptResult(
+            segments=[
+                TranscriptSegment(
+                    speaker=seg.speakerName or seg.speakerId,
+                    text=seg.text,
+                    start_time=seg.startTime,
+                    end_time=seg.endTime
+                )
+                for seg in session.transcript.segments
+            ],
+            language=session.transcript.language,
+            metadata={}
+        )
+
+        # Extract unique participants from transcript
+        participants = list(set(seg.speaker for seg in transcript.segments))
+
+        summary = Summary(
+            overview=session.summary.overview,
+            key_points=session.summary.keyPoints,
+            action_items=[
+                ActionItem(
+                    description=item.description,
+                    assignee=item.assignee,
+                    deadline=item.deadline
+                )
+                for item in session.summary.actionItems
+            ],
+            participants=participants
+        )
+
+        chatbot = Chatbot(
+            api_key=api_key,
+            model=settings.DEFAULT_CHAT_MODEL,
+            embedding_model=settings.CHAT_EMBEDDING_MODEL
+        )
+
+        index = None
+        system_prompt = ""
+        if settings.CHAT_RETRIEVAL_ENABLED:
+            index = TranscriptIndex(transcript.segments)
+            if index.transcript_tokens <= settings.CHAT_FULL_TRANSCRIPT_MAX_TOKENS:
+                index = None
+            elif settings.CHAT_EMBEDDING_MODEL:
+                try:
+                    await index.embed(chatbot.embed_texts)
+                except Exception as e:
+                    # Lexical retrieval still works without vectors
+                    logger.warning(f"Segment embedding failed for session {session_id}: {e}")
+
+        if index is None:
+            chatbot.set_context(transcript=transcript, summary=summary)
+            system_prompt = chatbot.system_prompt
+
+        # Approximate footprint: segment strings dominate; the index roughly doubles them
+        text_bytes = sum(sys.getsizeof(s.text) + sys.getsizeof(s.speaker) for s in transcript.segments)
+        size_bytes = text_bytes * (3 if index is not None else 1) + sys.getsizeof(system_prompt)
+
+        logger.info(
+            f"Built chat context for session {session_id} (version {version}, "
+            f"{len(transcript.segments)} segments, {'retrieval' if index else 'full transcript'})"
+        )
+
+        return ChatContext(
+            session_id=session_id,
+            version=version,
+            context=session.context,
+            transcript=transcript,
+            summary=summary,
+            participants=participants,
+            system_prompt=system_prompt,
+            index=index,
+            size_bytes=size_bytes
+        )
+
+
+# Singleton instance
+chat_context_cache = ChatContextCache()
@@ -0,0 +1,154 @@
+"""Bounded chat memory stored with the session.
+
+Chat requests send the messages not yet summarized, within
+CHAT_HISTORY_TOKEN_BUDGET. All but the newest CHAT_MEMORY_RECENT_TURNS turns
+are folded into ``Session.chatSummary``, and ``Session.chatSummaryUntil``
+marks the last message the summary covers, so each request loads only the
+messages after it. Folding runs after a
+response has been sent, once CHAT_MEMORY_COMPACT_BATCH_TURNS extra turns
+have piled up, which keeps the per-turn cost flat in long conversations.
+All chat messages are still kept for the history endpoint.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Set
+
+from loguru import logger
+
+from app.db import db
+from app.core.config import settings
+from lib.chat.memory import ConversationMemory
+from lib.utils.openai_clients import get_openai_client
+
+# Messages after the summary cutoff, ordered with a tie-breaker on id. A
+# cutoff message that no longer exists (chat cleared) counts as no cutoff.
+UNSUMMARIZED_MESSAGES_SQL = '''
+SELECT m.id, m.role, m.content
+FROM "ChatMessage" m
+WHERE m."sessionId" = $1
+  AND NOT EXISTS (
+      SELECT 1 FROM "ChatMessage" c
+      WHERE c.id = $2::text AND (m."createdAt", m.id) <= (c."createdAt", c.id)
+  )
+ORDER BY m."createdAt", m.id
+'''
+
+
+@dataclass
+class ChatMemoryState:
+    """A session's running summary and the messages it does not cover."""
+    summary: str
+    until_id: Optional[str]
+    messages: List[dict] = field(default_factory=list)  # role/content dicts, oldest first
+    message_ids: List[str] = field(default_factory=list)
+
+
+class ChatMemoryService:
+    """Load and compact per-session chat memory."""
+
+    def __init__(self):
+        """Initialize chat memory service."""
+        self._compacting: Set[str] = set()
+
+    @staticmethod
+    def memory(summary: str = "") -> ConversationMemory:
+        """Create a conversation memory configured from settings.
+
+        Args:
+            summary: Running summary of earlier turns
+
+        Returns:
+            Conversation memory
+        """
+        return ConversationMemory(
+            recent_turns=settings.CHAT_MEMORY_RECENT_TURNS,
+            token_budget=settings.CHAT_HISTORY_TOKEN_BUDGET,
+            compact_batch_turns=settings.CHAT_MEMORY_COMPACT_BATCH_TURNS,
+            summary_max_tokens=settings.CHAT_MEMORY_SUMMARY_MAX_TOKENS,
+            summary=summary
+        )
+
+    async def load(self, session_id: str) -> ChatMemoryState:
+        """Load a session's chat summary and unsummarized messages.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Chat memory state
+        """
+        row = await db.query_first(
+            'SELECT "chatSummary", "chatSummaryUntil" FROM "Session" WHERE id = $1',
+            session_id
+        )
+        summary = (row or {}).get("chatSummary") or ""
+        until_id = (row or {}).get("chatSummaryUntil")
+
+        rows = await db.query_raw(UNSUMMARIZED_MESSAGES_SQL, session_id, until_id)
+        return ChatMemoryState(
+            summary=summary,
+            until_id=until_id,
+            messages=[{"role": r["role"], "content": r["content"]} for r in rows],
+            message_ids=[r["id"] for r in rows]
+        )
+
+    async def compact(self, session_id: str, api_key: str) -> None:
+        """Fold older messages into the session's summary if enough have accumulated.
+
+        Safe to run as a background task: failures are logged, and a
+        concurrent compaction of the same session is skipped.
+
+        Args:
+            session_id: Session ID
+            api_key: OpenAI API key
+        """
+        if session_id in self._compacting:
+            return
+        self._compacting.add(session_id)
+
+        try:
+            state = await self.load(session_id)
+            memory = self.memory(state.summary)
+            older, _ = memory.split_for_compaction(state.messages)
+            if not older:
+                return
+
+            await memory.fold(get_openai_client(api_key), settings.DEFAULT_CHAT_MODEL, older)
+
+            # Only advance from the cutoff we read, in case another process got
+            # there first, and only if the chat wasn't cleared while folding
+            updated = await db.execute_raw(
+                '''
+                UPDATE "Session" SET "chatSummary" = $2, "chatSummaryUntil" = $3
+                WHERE id = $1 AND "chatSummaryUntil" IS NOT DISTINCT FROM $4::text
+                  AND EXISTS (SELECT 1 FROM "ChatMessage" WHERE id = $3)
+                ''',
+                session_id,
+                memory.summary,
+                state.message_ids[len(older) - 1],
+                state.until_id
+            )
+            if updated:
+                logger.info(f"Folded {len(older)} chat messages into the summary for session {session_id}")
+
+        except Exception as e:
+            logger.warning(f"Chat memory compaction failed for session {session_id}: {e}")
+
+        finally:
+            self._compacting.discard(session_id)
+
+    @staticmethod
+    async def reset(session_id: str) -> None:
+        """Clear a session's running summary (e.g. after its chat is cleared).
+
+        Args:
+            session_id: Session ID
+        """
+        await db.execute_raw(
+            'UPDATE "Session" SET "chatSummary" = NULL, "chatSummaryUntil" = NULL WHERE id = $1',
+            session_id
+        )
+
+
+# Singleton instance
+chat_memory_service = ChatMemoryService()
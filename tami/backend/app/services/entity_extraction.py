@@ -1,11 +1,25 @@
-"""Entity extraction service using GPT-4o-mini."""
+"""Entity extraction service using GPT-4o-mini.
 
+Long transcripts are split into overlapping windows of about
+ENTITY_EXTRACTION_WINDOW_TOKENS tokens, which are extracted concurrently
+(at most ENTITY_EXTRACTION_MAX_CONCURRENCY requests in flight) and merged
+by ``extract_and_deduplicate``, so the whole meeting is covered.
+"""
+
+import asyncio
 import json
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel
 from loguru import logger
-from openai import AsyncOpenAI
 
+from app.core.config import settings
+from app.services.llm_cache import get_llm_cache
+from lib.utils.llm_cache import LLMCache, cached_completion
+from lib.utils.openai_clients import get_openai_client
+
+
+# Bump when the extraction prompt changes so cached responses are not reused
+EXTRACTION_PROMPT_VERSION = "1"
 
 # Default entity types to extract
 DEFAULT_ENTITY_TYPES = [
@@ -34,6 +48,49 @@ ENTITY_TYPE_DESCRIPTIONS = {
 }
 
 
+CHARS_PER_TOKEN = 3  # Rough estimate, close for Hebrew (see lib.chat.retrieval.estimate_tokens)
+
+
+def split_into_windows(text: str, window_tokens: int, overlap_tokens: int) -> List[str]:
+    """Split text into overlapping windows on word boundaries.
+
+    Consecutive windows share about ``overlap_tokens`` tokens so entities
+    mentioned across a boundary are seen whole by at least one window.
+
+    Args:
+        text: Text to split
+        window_tokens: Maximum estimated tokens per window
+        overlap_tokens: Estimated tokens repeated from the previous window
+
+    Returns:
+        Windows in text order (a single window for short text)
+    """
+    words = text.split()
+    costs = [(len(word) + 1) / CHARS_PER_TOKEN for word in words]
+
+    windows: List[str] = []
+    start = 0
+    while start < len(words):
+        end = start
+        size = 0.0
+        while end < len(words) and (end == start or size + costs[end] <= window_tokens):
+            size += costs[end]
+            end += 1
+        windows.append(" ".join(words[start:end]))
+        if end >= len(words):
+            break
+
+        # Step back so the next window starts with the tail of this one
+        next_start = end
+        overlap = 0.0
+        while next_start > start + 1 and overlap + costs[next_start - 1] <= overlap_tokens:
+            next_start -= 1
+            overlap += costs[next_start]
+        start = next_start
+
+    return windows
+
+
 class EntityMetadata(BaseModel):
     """Metadata for an extracted entity."""
     currency: Optional[str] = None  # For price entities
@@ -54,15 +111,31 @@ class ExtractedEntity(BaseModel):
 class EntityExtractionService:
     """Service for extracting entities from transcripts using GPT-4o-mini."""
 
-    def __init__(self, api_key: str, model: str = "gpt-4o-mini"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o-mini",
+        window_tokens: Optional[int] = None,
+        overlap_tokens: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        cache: Optional[LLMCache] = None
+    ):
         """Initialize entity extraction service.
 
         Args:
             api_key: OpenAI API key
             model: Model to use for extraction (default: gpt-4o-mini)
+            window_tokens: Tokens per extraction window (default: ENTITY_EXTRACTION_WINDOW_TOKENS)
+            overlap_tokens: Tokens shared by adjacent windows (default: ENTITY_EXTRACTION_OVERLAP_TOKENS)
+            max_concurrency: Window requests in flight (default: ENTITY_EXTRACTION_MAX_CONCURRENCY)
+            cache: LLM response cache (None: always call the API)
         """
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.client = get_openai_client(api_key)
         self.model = model
+        self.window_tokens = window_tokens or settings.ENTITY_EXTRACTION_WINDOW_TOKENS
+        self.overlap_tokens = settings.ENTITY_EXTRACTION_OVERLAP_TOKENS if overlap_tokens is None else overlap_tokens
+        self.max_concurrency = max_concurrency or settings.ENTITY_EXTRACTION_MAX_CONCURRENCY
+        self.cache = cache
 
     def _build_extraction_prompt(
         self,
@@ -134,29 +207,70 @@ Return ONLY the JSON array, no other text."""
     ) -> List[ExtractedEntity]:
         """Extract entities from transcript text.
 
+        The text is split into overlapping windows that are extracted
+        concurrently. Entities seen in several windows are returned once per
+        window; use ``extract_and_deduplicate`` to merge them.
+
         Args:
             transcript_text: The full transcript text
             context: Meeting context for better extraction
             entity_types: Types of entities to extract (default: all types)
 
         Returns:
-            List of extracted entities
+            List of extracted entities, in transcript order
+
+        Raises:
+            Exception: If the completion request for any window fails
         """
         if entity_types is None:
             entity_types = DEFAULT_ENTITY_TYPES
 
-        logger.info(f"Extracting entities of types: {entity_types}")
+        windows = split_into_windows(transcript_text, self.window_tokens, self.overlap_tokens)
+        logger.info(f"Extracting entities of types: {entity_types} from {len(windows)} window(s)")
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def extract_window(text: str) -> List[ExtractedEntity]:
+            async with semaphore:
+                return await self._extract_window(text, context, entity_types)
+
+        results = await asyncio.gather(*(extract_window(text) for text in windows))
+        entities = [entity for window_entities in results for entity in window_entities]
+
+        logger.info(f"Extracted {len(entities)} entities")
+        return entities
 
-        # Truncate very long transcripts to avoid token limits
-        max_chars = 15000  # Approximately 4k tokens
-        if len(transcript_text) > max_chars:
-            logger.warning(f"Transcript too long ({len(transcript_text)} chars), truncating")
-            transcript_text = transcript_text[:max_chars] + "..."
+    async def _extract_window(
+        self,
+        text: str,
+        context: str,
+        entity_types: List[str]
+    ) -> List[ExtractedEntity]:
+        """Extract entities from one window.
+
+        A response that isn't valid JSON yields no entities and malformed
+        entities are skipped; API errors propagate.
+
+        Args:
+            text: Window text
+            context: Meeting context
+            entity_types: Types of entities to extract
 
-        prompt = self._build_extraction_prompt(transcript_text, context, entity_types)
+        Returns:
+            Entities found in the window
+
+        Raises:
+            Exception: If the completion request fails
+        """
+        prompt = self._build_extraction_prompt(text, context, entity_types)
 
         try:
-            response = await self.client.chat.completions.create(
+            content = await cached_completion(
+                self.client,
+                self.cache,
+                "entities",
+                EXTRACTION_PROMPT_VERSION,
+                validate=self._parse_response,
                 model=self.model,
                 messages=[
                     {
@@ -169,45 +283,47 @@ Return ONLY the JSON array, no other text."""
                 temperature=0.1,  # Low temperature for consistent extraction
                 max_tokens=4000
             )
-
-            content = response.choices[0].message.content.strip()
-
-            # Parse JSON response
-            # Handle potential markdown code blocks
-            if content.startswith("```"):
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:]
-                content = content.strip()
-
-            entities_data = json.loads(content)
-
-            # Convert to ExtractedEntity objects
-            entities = []
-            for entity_dict in entities_data:
-                try:
-                    metadata = EntityMetadata(**entity_dict.get("metadata", {}))
-                    entity = ExtractedEntity(
-                        entity=entity_dict["entity"],
-                        type=entity_dict["type"],
-                        normalized_form=entity_dict.get("normalized_form", entity_dict["entity"].lower().strip()),
-                        context=entity_dict.get("context"),
-                        metadata=metadata
-                    )
-                    entities.append(entity)
-                except Exception as e:
-                    logger.warning(f"Failed to parse entity: {entity_dict}, error: {e}")
-                    continue
-
-            logger.info(f"Extracted {len(entities)} entities")
-            return entities
-
+            entities_data = self._parse_response(content)
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse entity extraction response: {e}")
             return []
-        except Exception as e:
-            logger.error(f"Entity extraction failed: {e}")
-            return []
+
+        # Convert to ExtractedEntity objects
+        entities = []
+        for entity_dict in entities_data:
+            try:
+                metadata = EntityMetadata(**entity_dict.get("metadata", {}))
+                entity = ExtractedEntity(
+                    entity=entity_dict["entity"],
+                    type=entity_dict["type"],
+                    normalized_form=entity_dict.get("normalized_form", entity_dict["entity"].lower().strip()),
+                    context=entity_dict.get("context"),
+                    metadata=metadata
+                )
+                entities.append(entity)
+            except Exception as e:
+                logger.warning(f"Failed to parse entity: {entity_dict}, error: {e}")
+                continue
+
+        return entities
+
+    @staticmethod
+    def _parse_response(content: str) -> List[Dict[str, Any]]:
+        """Parse the JSON array of entities from a response.
+
+        Raises:
+            json.JSONDecodeError: If the response is not valid JSON
+        """
+        content = content.strip()
+
+        # Handle potential markdown code blocks
+        if content.startswith("```"):
+            content = content.split("```")[1]
+            if content.startswith("json"):
+                content = content[4:]
+            content = content.strip()
+
+        return json.loads(content)
 
     async def extract_and_deduplicate(
         self,
@@ -256,4 +372,4 @@ def get_entity_extraction_service(api_key: str, model: str = "gpt-4o-mini") -> E
     Returns:
         EntityExtractionService instance
     """
-    return EntityExtractionService(api_key, model)
+    return EntityExtractionService(api_key, model, cache=get_llm_cache())
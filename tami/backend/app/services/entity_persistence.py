@@ -0,0 +1,152 @@
+"""Set-based persistence of extracted entities, mentions and auto-tags.
+
+All rows for a session are sent as one JSON document per statement and
+expanded with ``jsonb_to_recordset``, so the number of queries stays the same
+however many entities were extracted. Upserts rely on the unique constraints
+``Entity(userId, type, normalizedValue)`` and ``Tag(userId, name)``.
+"""
+
+import json
+import uuid
+from datetime import timedelta
+from typing import Dict, List
+
+from loguru import logger
+
+from app.db import db
+from app.core.config import settings
+from app.services.entity_extraction import ExtractedEntity
+from app.services.suggestions import suggestion_service
+
+
+# Entity types that also get a hidden auto-tag on the session
+AUTO_TAG_ENTITY_TYPES = {"person", "organization", "project"}
+AUTO_TAG_COLOR = "#9CA3AF"  # Gray for auto-tags
+MAX_TAG_NAME_LENGTH = 50
+
+
+class EntityPersistenceService:
+    """Write a session's extracted entities in a few set-based statements."""
+
+    async def save_session_entities(
+        self,
+        session_id: str,
+        user_id: str,
+        extracted_entities: Dict[str, List[ExtractedEntity]]
+    ) -> Dict[str, int]:
+        """Upsert entities, add mentions and link auto-tags for a session.
+
+        Existing entities get their mention count bumped; existing tags
+        (manual or auto) are reused as-is. The session's earlier mentions are
+        replaced rather than added to, and entities it already mentioned are
+        not counted again, so a retried analyzer can run this safely.
+
+        Args:
+            session_id: Session ID
+            user_id: Owner of the session
+            extracted_entities: Entities grouped by type
+
+        Returns:
+            Dict with entity and tag counts
+        """
+        entity_rows = []
+        tag_rows: Dict[str, dict] = {}
+        seen = set()
+
+        for entity_type, entities in extracted_entities.items():
+            for entity in entities:
+                key = (entity_type, entity.normalized_form)
+                if key in seen:
+                    continue
+                seen.add(key)
+
+                entity_rows.append({
+                    "id": uuid.uuid4().hex,
+                    "mention_id": uuid.uuid4().hex,
+                    "type": entity_type,
+                    "value": entity.entity,
+                    "normalizedValue": entity.normalized_form,
+                    "context": entity.context
+                })
+
+                # Create auto-tags for person, organization, project entities
+                if entity_type in AUTO_TAG_ENTITY_TYPES:
+                    tag_name = entity.entity[:MAX_TAG_NAME_LENGTH]
+                    tag_rows.setdefault(tag_name, {
+                        "id": uuid.uuid4().hex,
+                        "link_id": uuid.uuid4().hex,
+                        "name": tag_name,
+                        "source": f"auto:{entity_type}"
+                    })
+
+        if not entity_rows:
+            return {"entities": 0, "tags": 0}
+
+        async with db.tx(timeout=timedelta(seconds=settings.DB_TRANSACTION_TIMEOUT)) as tx:
+            await tx.execute_raw(
+                '''
+                WITH input AS (
+                    SELECT * FROM jsonb_to_recordset($3::jsonb)
+                        AS e(id text, mention_id text, type text, value text, "normalizedValue" text, context text)
+                ),
+                previous AS (
+                    DELETE FROM "EntityMention" WHERE "sessionId" = $2
+                    RETURNING "entityId"
+                ),
+                upserted AS (
+                    INSERT INTO "Entity" (id, "userId", type, value, "normalizedValue",
+                                          "firstSeenAt", "lastSeenAt", "mentionCount")
+                    SELECT id, $1, type, value, "normalizedValue", CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, 1
+                    FROM input
+                    ON CONFLICT ("userId", type, "normalizedValue")
+                    DO UPDATE SET "mentionCount" = "Entity"."mentionCount" + CASE
+                                      WHEN "Entity".id IN (SELECT "entityId" FROM previous) THEN 0
+                                      ELSE 1
+                                  END,
+                                  "lastSeenAt" = CURRENT_TIMESTAMP
+                    RETURNING id, type, "normalizedValue"
+                )
+                INSERT INTO "EntityMention" (id, "entityId", "sessionId", context, "createdAt")
+                SELECT i.mention_id, u.id, $2, i.context, CURRENT_TIMESTAMP
+                FROM input i
+                JOIN upserted u ON u.type = i.type AND u."normalizedValue" = i."normalizedValue"
+                ''',
+                user_id,
+                session_id,
+                json.dumps(entity_rows)
+            )
+
+            if tag_rows:
+                # The no-op DO UPDATE makes RETURNING include tags that already existed
+                await tx.execute_raw(
+                    '''
+                    WITH input AS (
+                        SELECT * FROM jsonb_to_recordset($4::jsonb)
+                            AS t(id text, link_id text, name text, source text)
+                    ),
+                    tags AS (
+                        INSERT INTO "Tag" (id, "userId", name, color, source, "isVisible", "createdAt")
+                        SELECT id, $1, name, $3, source, false, CURRENT_TIMESTAMP
+                        FROM input
+                        ON CONFLICT ("userId", name) DO UPDATE SET name = EXCLUDED.name
+                        RETURNING id, name
+                    )
+                    INSERT INTO "SessionTag" (id, "sessionId", "tagId", "createdAt")
+                    SELECT i.link_id, $2, t.id, CURRENT_TIMESTAMP
+                    FROM input i
+                    JOIN tags t ON t.name = i.name
+                    ON CONFLICT ("sessionId", "tagId") DO NOTHING
+                    ''',
+                    user_id,
+                    session_id,
+                    AUTO_TAG_COLOR,
+                    json.dumps(list(tag_rows.values()))
+                )
+
+        suggestion_service.invalidate(user_id)
+        logger.info(f"Saved {len(entity_rows)} entities and {len(tag_rows)} auto-tags for session {session_id}")
+        return {"entities": len(entity_rows), "tags": len(tag_rows)}
+
+
+# Singleton instance
+entity_persistence_service = EntityPersistenceService()
@@ -0,0 +1,297 @@
+"""Durable job queue backed by the Postgres "Job" table.
+
+Jobs are claimed with ``FOR UPDATE SKIP LOCKED`` so any number of workers
+(in the API process or separate ``python -m app.worker`` processes) can poll
+the same table without handing out a job twice. A claim takes a time-limited
+lease; workers extend it while a job runs, and a job whose lease expires
+(worker crashed or was restarted) becomes claimable again. A session has at
+most one queued or running job of each kind; ``enqueue`` checks this under
+a per-session advisory lock.
+
+The generated Prisma client predates the Job model, so all access goes
+through raw SQL.
+"""
+
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from app.db import db
+from app.core.config import settings
+
+
+class JobAlreadyActiveError(Exception):
+    """Raised when a session already has a queued or running job of a kind."""
+    pass
+
+
+@dataclass
+class Job:
+    """A claimed job."""
+    id: str
+    kind: str
+    session_id: Optional[str]
+    payload: Dict[str, Any]
+    attempts: int
+    max_attempts: int
+
+
+class JobQueue:
+    """Enqueue, claim and settle background jobs."""
+
+    async def enqueue(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        session_id: Optional[str] = None,
+        max_attempts: Optional[int] = None
+    ) -> str:
+        """Add a job to the queue.
+
+        Args:
+            kind: Handler name (e.g. "transcription")
+            payload: JSON-serializable job arguments (never secrets)
+            session_id: Session the job belongs to, if any
+            max_attempts: Attempts before the job is failed (default: JOB_MAX_ATTEMPTS)
+
+        Returns:
+            Job ID
+
+        Raises:
+            JobAlreadyActiveError: If the session already has a queued or running job of this kind
+        """
+        job_id = uuid.uuid4().hex
+        async with db.tx(timeout=timedelta(seconds=settings.DB_TRANSACTION_TIMEOUT)) as tx:
+            if session_id is not None:
+                # Serialize enqueues for this session and kind until commit
+                await tx.query_raw(
+                    'SELECT 1 AS locked FROM pg_advisory_xact_lock(hashtext($1))',
+                    f"job:{kind}:{session_id}"
+                )
+                active = await tx.query_first(
+                    '''
+                    SELECT id FROM "Job"
+                    WHERE "sessionId" = $1 AND kind = $2 AND status IN ('queued', 'running')
+                    LIMIT 1
+                    ''',
+                    session_id,
+                    kind
+                )
+                if active:
+                    raise JobAlreadyActiveError(
+                        f"Session {session_id} already has an active {kind} job ({active['id']})"
+                    )
+
+            await tx.execute_raw(
+                '''
+                INSERT INTO "Job" (id, kind, "sessionId", payload, status, attempts, "maxAttempts",
+                                   "runAt", "createdAt", "updatedAt")
+                VALUES ($1, $2, $3, $4::jsonb, 'queued', 0, $5,
+                        CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+                ''',
+                job_id,
+                kind,
+                session_id,
+                json.dumps(payload),
+                max_attempts or settings.JOB_MAX_ATTEMPTS
+            )
+        logger.info(f"Enqueued {kind} job {job_id} (session {session_id})")
+        return job_id
+
+    async def claim(self, worker_id: str, limit: int) -> List[Job]:
+        """Lease up to ``limit`` runnable jobs.
+
+        Runnable means queued and due, or running with an expired lease and
+        attempts left.
+
+        Args:
+            worker_id: Identifier of the claiming worker
+            limit: Maximum number of jobs to claim
+
+        Returns:
+            Claimed jobs (attempt counter already incremented)
+        """
+        rows = await db.query_raw(
+            '''
+            WITH candidates AS (
+                SELECT id FROM "Job"
+                WHERE (status = 'queued' AND "runAt" <= CURRENT_TIMESTAMP)
+                   OR (status = 'running' AND "leaseExpiresAt" < CURRENT_TIMESTAMP
+                       AND attempts < "maxAttempts")
+                ORDER BY "runAt"
+                LIMIT $2
+                FOR UPDATE SKIP LOCKED
+            )
+            UPDATE "Job" j
+            SET status = 'running',
+                attempts = j.attempts + 1,
+                "leaseOwner" = $1,
+                "leaseExpiresAt" = CURRENT_TIMESTAMP + ($3::int * INTERVAL '1 second'),
+                "updatedAt" = CURRENT_TIMESTAMP
+            FROM candidates c
+            WHERE j.id = c.id
+            RETURNING j.id, j.kind, j."sessionId", j.payload, j.attempts, j."maxAttempts"
+            ''',
+            worker_id,
+            limit,
+            settings.JOB_LEASE_SECONDS
+        )
+
+        jobs = []
+        for row in rows:
+            payload = row["payload"]
+            if isinstance(payload, str):
+                payload = json.loads(payload)
+            jobs.append(
+                Job(
+                    id=row["id"],
+                    kind=row["kind"],
+                    session_id=row["sessionId"],
+                    payload=payload or {},
+                    attempts=row["attempts"],
+                    max_attempts=row["maxAttempts"]
+                )
+            )
+        return jobs
+
+    async def extend_lease(self, job_id: str, worker_id: str) -> bool:
+        """Renew a running job's lease.
+
+        Args:
+            job_id: Job ID
+            worker_id: Worker holding the lease
+
+        Returns:
+            False if the lease was lost to another worker
+        """
+        count = await db.execute_raw(
+            '''
+            UPDATE "Job"
+            SET "leaseExpiresAt" = CURRENT_TIMESTAMP + ($3::int * INTERVAL '1 second'),
+                "updatedAt" = CURRENT_TIMESTAMP
+            WHERE id = $1 AND "leaseOwner" = $2 AND status = 'running'
+            ''',
+            job_id,
+            worker_id,
+            settings.JOB_LEASE_SECONDS
+        )
+        return count > 0
+
+    async def complete(self, job_id: str, worker_id: str) -> None:
+        """Mark a job as completed.
+
+        Args:
+            job_id: Job ID
+            worker_id: Worker holding the lease
+        """
+        await db.execute_raw(
+            '''
+            UPDATE "Job"
+            SET status = 'completed', "leaseOwner" = NULL, "leaseExpiresAt" = NULL,
+                "updatedAt" = CURRENT_TIMESTAMP
+            WHERE id = $1 AND "leaseOwner" = $2
+            ''',
+            job_id,
+            worker_id
+        )
+
+    async def fail(self, job: Job, worker_id: str, error: str) -> bool:
+        """Record a failed attempt, scheduling a retry if attempts remain.
+
+        Retries back off exponentially from JOB_RETRY_BACKOFF_SECONDS.
+
+        Args:
+            job: Claimed job
+            worker_id: Worker holding the lease
+            error: Error message
+
+        Returns:
+            True if the job will be retried
+        """
+        retry = job.attempts < job.max_attempts
+        delay = settings.JOB_RETRY_BACKOFF_SECONDS * (2 ** (job.attempts - 1)) if retry else 0
+
+        await db.execute_raw(
+            '''
+            UPDATE "Job"
+            SET status = $3,
+                "runAt" = CURRENT_TIMESTAMP + ($4::int * INTERVAL '1 second'),
+                "lastError" = $5,
+                "leaseOwner" = NULL,
+                "leaseExpiresAt" = NULL,
+                "updatedAt" = CURRENT_TIMESTAMP
+            WHERE id = $1 AND "leaseOwner" = $2
+            ''',
+            job.id,
+            worker_id,
+            'queued' if retry else 'failed',
+            int(delay),
+            error[:2000]
+        )
+        return retry
+
+    async def fail_abandoned(self) -> List[Optional[str]]:
+        """Fail running jobs whose lease expired with no attempts left.
+
+        Returns:
+            Session IDs of the failed jobs
+        """
+        rows = await db.query_raw(
+            '''
+            UPDATE "Job"
+            SET status = 'failed',
+                "lastError" = COALESCE("lastError", 'Lease expired on final attempt'),
+                "leaseOwner" = NULL,
+                "leaseExpiresAt" = NULL,
+                "updatedAt" = CURRENT_TIMESTAMP
+            WHERE status = 'running'
+              AND "leaseExpiresAt" < CURRENT_TIMESTAMP
+              AND attempts >= "maxAttempts"
+            RETURNING id, "sessionId"
+            '''
+        )
+        for row in rows:
+            logger.warning(f"Job {row['id']} abandoned on its final attempt, marked failed")
+        return [row["sessionId"] for row in rows]
+
+    async def latest_payload(self, session_id: str, kind: str) -> Optional[Dict[str, Any]]:
+        """Get the payload of a session's most recent job of a kind.
+
+        Args:
+            session_id: Session ID
+            kind: Job kind
+
+        Returns:
+            Payload dict, or None if the session has no such job
+        """
+        row = await db.query_first(
+            '''
+            SELECT payload FROM "Job"
+            WHERE "sessionId" = $1 AND kind = $2
+            ORDER BY "createdAt" DESC
+            LIMIT 1
+            ''',
+            session_id,
+            kind
+        )
+        if not row:
+            return None
+        payload = row["payload"]
+        return json.loads(payload) if isinstance(payload, str) else payload
+
+    async def stats(self) -> Dict[str, int]:
+        """Count jobs by status.
+
+        Returns:
+            Dict mapping status to job count
+        """
+        rows = await db.query_raw('SELECT status, COUNT(*)::int AS count FROM "Job" GROUP BY status')
+        return {row["status"]: row["count"] for row in rows}
+
+
+# Singleton instance
+job_queue = JobQueue()
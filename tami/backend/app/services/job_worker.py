@@ -0,0 +1,170 @@
+"""Worker loop that claims and runs jobs from the durable queue."""
+
+import asyncio
+import os
+import socket
+import uuid
+from typing import Awaitable, Callable, Dict, Optional, Set
+
+from loguru import logger
+
+from app.db import db
+from app.core.config import settings
+from app.services.job_queue import Job, job_queue
+
+
+async def handle_transcription(job: Job) -> None:
+    """Run the transcription pipeline for a job.
+
+    Args:
+        job: Claimed transcription job
+    """
+    # Lazy import: the pipeline pulls in the LLM services
+    from app.services.pipeline import run_transcription_job
+
+    await run_transcription_job(job.payload)
+
+
+# Job kind -> handler. Handlers raise to signal a failed attempt.
+JOB_HANDLERS: Dict[str, Callable[[Job], Awaitable[None]]] = {
+    "transcription": handle_transcription,
+}
+
+
+class JobWorker:
+    """Claim jobs and run up to ``concurrency`` of them at once."""
+
+    def __init__(
+        self,
+        concurrency: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        worker_id: Optional[str] = None
+    ):
+        """Initialize job worker.
+
+        Args:
+            concurrency: Jobs run at once (default: JOB_WORKER_CONCURRENCY)
+            poll_interval: Seconds between polls when idle (default: JOB_POLL_INTERVAL)
+            worker_id: Lease owner name (default: host, pid and a random suffix)
+        """
+        self.concurrency = max(1, concurrency or settings.JOB_WORKER_CONCURRENCY)
+        self.poll_interval = poll_interval or settings.JOB_POLL_INTERVAL
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self._active: Set[asyncio.Task] = set()
+        self._stopping = asyncio.Event()
+
+    async def run(self) -> None:
+        """Poll for jobs until ``stop`` is called, then drain running jobs."""
+        logger.info(f"Job worker {self.worker_id} started (concurrency {self.concurrency})")
+
+        while not self._stopping.is_set():
+            try:
+                await self._reap_abandoned()
+
+                free_slots = self.concurrency - len(self._active)
+                jobs = await job_queue.claim(self.worker_id, free_slots) if free_slots > 0 else []
+                for job in jobs:
+                    task = asyncio.create_task(self._execute(job))
+                    self._active.add(task)
+                    task.add_done_callback(self._active.discard)
+
+            except Exception as e:
+                logger.error(f"Job worker poll failed: {e}")
+                jobs = []
+
+            # Poll again right away if we filled every free slot
+            if jobs and len(self._active) < self.concurrency:
+                continue
+            await self._wait_for_capacity()
+
+        if self._active:
+            logger.info(f"Job worker {self.worker_id} waiting for {len(self._active)} running jobs")
+            await asyncio.gather(*self._active, return_exceptions=True)
+        logger.info(f"Job worker {self.worker_id} stopped")
+
+    def stop(self) -> None:
+        """Stop claiming new jobs. Running jobs finish; ``run`` then returns."""
+        self._stopping.set()
+
+    async def _wait_for_capacity(self) -> None:
+        """Sleep until the poll interval passes, a job finishes, or we stop."""
+        waiters = [asyncio.create_task(self._stopping.wait())]
+        if len(self._active) >= self.concurrency:
+            waiters.extend(self._active)
+
+        await asyncio.wait(waiters, timeout=self.poll_interval, return_when=asyncio.FIRST_COMPLETED)
+        waiters[0].cancel()
+
+    async def _execute(self, job: Job) -> None:
+        """Run a claimed job and settle it.
+
+        The handler runs in its own task so the heartbeat can cancel it if
+        the lease is lost; the job then belongs to whichever worker claims it
+        next, and this worker leaves it alone.
+
+        Args:
+            job: Claimed job
+        """
+        logger.info(f"Running {job.kind} job {job.id} (attempt {job.attempts}/{job.max_attempts})")
+        work = asyncio.create_task(self._run_handler(job))
+        lease_lost = asyncio.Event()
+        heartbeat = asyncio.create_task(self._heartbeat(job, work, lease_lost))
+
+        try:
+            await work
+            await job_queue.complete(job.id, self.worker_id)
+            logger.info(f"Job {job.id} completed")
+
+        except asyncio.CancelledError:
+            if not lease_lost.is_set():
+                work.cancel()
+                raise
+            logger.warning(f"Job {job.id} cancelled after losing its lease")
+
+        except Exception as e:
+            retry = await job_queue.fail(job, self.worker_id, str(e))
+            if retry:
+                logger.warning(f"Job {job.id} failed, will retry: {e}")
+            else:
+                logger.error(f"Job {job.id} failed permanently: {e}")
+            await self._set_session_status(job.session_id, "pending" if retry else "failed")
+
+        finally:
+            heartbeat.cancel()
+
+    @staticmethod
+    async def _run_handler(job: Job) -> None:
+        """Run the handler registered for the job's kind."""
+        handler = JOB_HANDLERS.get(job.kind)
+        if handler is None:
+            raise ValueError(f"No handler for job kind: {job.kind}")
+        await handler(job)
+
+    async def _heartbeat(self, job: Job, work: asyncio.Task, lease_lost: asyncio.Event) -> None:
+        """Extend the job's lease while it runs; cancel the job if the lease is lost."""
+        interval = max(1.0, settings.JOB_LEASE_SECONDS / 3)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if not await job_queue.extend_lease(job.id, self.worker_id):
+                    logger.warning(f"Lost lease on job {job.id}, cancelling it")
+                    lease_lost.set()
+                    work.cancel()
+                    return
+            except Exception as e:
+                logger.error(f"Failed to extend lease on job {job.id}: {e}")
+
+    async def _reap_abandoned(self) -> None:
+        """Fail jobs abandoned on their last attempt and their sessions."""
+        for session_id in await job_queue.fail_abandoned():
+            await self._set_session_status(session_id, "failed")
+
+    @staticmethod
+    async def _set_session_status(session_id: Optional[str], status: str) -> None:
+        """Update a job's session status, ignoring deleted sessions."""
+        if not session_id:
+            return
+        try:
+            await db.session.update_many(where={"id": session_id}, data={"status": status})
+        except Exception as e:
+            logger.error(f"Failed to set session {session_id} status to {status}: {e}")
@@ -4,6 +4,8 @@ from pathlib import Path
 from typing import Optional, Tuple
 from loguru import logger
 
+from lib.utils.openai_clients import get_openai_client
+from lib.utils.provider_scheduler import provider_scheduler
 from src.transcription.whisper import WhisperTranscriber
 
 
@@ -42,7 +44,11 @@ class LanguageDetectionService:
         """
         logger.info(f"Detecting language for audio: {audio_path}")
 
-        transcriber = WhisperTranscriber(api_key=self.openai_api_key)
+        transcriber = WhisperTranscriber(
+            api_key=self.openai_api_key,
+            client=get_openai_client(self.openai_api_key),
+            scheduler=provider_scheduler
+        )
         language, confidence = await transcriber.detect_language(audio_path)
 
         logger.info(f"Detected language: {language} with confidence: {confidence}")
@@ -0,0 +1,134 @@
+"""Shared LLM response cache for the backend.
+
+Summaries, entity extraction and refinement go through one ``LLMCache``
+(see lib.utils.llm_cache), so re-running a session or importing a duplicate
+transcript reuses earlier responses. LLM_CACHE_BACKEND selects the storage:
+
+- ``memory``: per-process LRU
+- ``disk``: files under LLM_CACHE_DIR, shared by processes on one host
+- ``postgres``: the LLMCacheEntry table, shared by every API process and worker
+- ``none``: caching disabled
+
+LLM_CACHE_DETERMINISTIC runs cached calls at temperature 0 with a fixed seed.
+"""
+
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+
+from app.db import db
+from app.core.config import settings
+from lib.utils.llm_cache import CacheBackend, DiskCacheBackend, LLMCache, MemoryCacheBackend
+
+
+class PostgresCacheBackend(CacheBackend):
+    """LLM cache entries in the LLMCacheEntry table.
+
+    Expired entries are skipped on read. Every ``evict_every`` writes, expired
+    rows are deleted, then least recently used rows until the table is under
+    ``max_bytes``.
+    """
+
+    def __init__(self, max_bytes: int, evict_every: int = 50):
+        """Initialize Postgres backend.
+
+        Args:
+            max_bytes: Size budget for cached values
+            evict_every: Writes between eviction passes
+        """
+        self.max_bytes = max_bytes
+        self.evict_every = evict_every
+        self._writes_since_evict = 0
+
+    async def get(self, key: str) -> Optional[str]:
+        rows = await db.query_raw(
+            '''
+            UPDATE "LLMCacheEntry" SET "lastUsedAt" = CURRENT_TIMESTAMP
+            WHERE key = $1 AND ("expiresAt" IS NULL OR "expiresAt" > CURRENT_TIMESTAMP)
+            RETURNING value
+            ''',
+            key
+        )
+        return rows[0]["value"] if rows else None
+
+    async def set(self, key: str, value: str, ttl: Optional[float]) -> None:
+        await db.execute_raw(
+            '''
+            INSERT INTO "LLMCacheEntry" (key, value, "sizeBytes", "createdAt", "lastUsedAt", "expiresAt")
+            VALUES ($1, $2, $3, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP,
+                    CASE WHEN $4::float8 IS NULL THEN NULL
+                         ELSE CURRENT_TIMESTAMP + make_interval(secs => $4::float8) END)
+            ON CONFLICT (key) DO UPDATE
+            SET value = EXCLUDED.value, "sizeBytes" = EXCLUDED."sizeBytes",
+                "lastUsedAt" = EXCLUDED."lastUsedAt", "expiresAt" = EXCLUDED."expiresAt"
+            ''',
+            key,
+            value,
+            len(value.encode("utf-8")),
+            ttl
+        )
+
+        self._writes_since_evict += 1
+        if self._writes_since_evict >= self.evict_every:
+            self._writes_since_evict = 0
+            await self.evict()
+
+    async def delete(self, key: str) -> None:
+        await db.execute_raw('DELETE FROM "LLMCacheEntry" WHERE key = $1', key)
+
+    async def evict(self) -> None:
+        """Delete expired entries, then least recently used ones over budget."""
+        await db.execute_raw('DELETE FROM "LLMCacheEntry" WHERE "expiresAt" <= CURRENT_TIMESTAMP')
+        deleted = await db.execute_raw(
+            '''
+            DELETE FROM "LLMCacheEntry" WHERE key IN (
+                SELECT key FROM (
+                    SELECT key, SUM("sizeBytes") OVER (ORDER BY "lastUsedAt" DESC, key) AS running
+                    FROM "LLMCacheEntry"
+                ) ranked
+                WHERE running > $1
+            )
+            ''',
+            self.max_bytes
+        )
+        if deleted:
+            logger.debug(f"Evicted {deleted} LLM cache entries over budget")
+
+
+def _create_llm_cache() -> Optional[LLMCache]:
+    """Build the configured cache, or None when caching is disabled."""
+    backend_name = settings.LLM_CACHE_BACKEND.lower()
+    if backend_name == "none":
+        return None
+
+    if backend_name == "memory":
+        backend: CacheBackend = MemoryCacheBackend(max_bytes=settings.LLM_CACHE_MAX_BYTES)
+    elif backend_name == "disk":
+        directory = Path(settings.LLM_CACHE_DIR) if settings.LLM_CACHE_DIR else None
+        backend = DiskCacheBackend(directory=directory, max_bytes=settings.LLM_CACHE_MAX_BYTES)
+    elif backend_name == "postgres":
+        backend = PostgresCacheBackend(max_bytes=settings.LLM_CACHE_MAX_BYTES)
+    else:
+        raise ValueError(f"Unknown LLM_CACHE_BACKEND: {settings.LLM_CACHE_BACKEND}")
+
+    logger.info(f"LLM response cache: {backend_name} (deterministic={settings.LLM_CACHE_DETERMINISTIC})")
+    return LLMCache(
+        backend=backend,
+        ttl=settings.LLM_CACHE_TTL or None,
+        deterministic=settings.LLM_CACHE_DETERMINISTIC
+    )
+
+
+# Singleton instance
+_llm_cache: Optional[LLMCache] = None
+_llm_cache_created = False
+
+
+def get_llm_cache() -> Optional[LLMCache]:
+    """Get or create the shared LLM cache (None when disabled)."""
+    global _llm_cache, _llm_cache_created
+    if not _llm_cache_created:
+        _llm_cache = _create_llm_cache()
+        _llm_cache_created = True
+    return _llm_cache
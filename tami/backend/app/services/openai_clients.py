@@ -0,0 +1,29 @@
+"""Shared OpenAI clients for the backend.
+
+Every service gets its client from ``lib.utils.openai_clients``, so all
+requests made with one API key share a keep-alive (HTTP/2 when available)
+connection pool. Pool limits and how many clients are kept come from the
+OPENAI_* settings; the API and the standalone worker call
+``configure_openai_clients`` at startup and ``openai_clients.aclose()`` on
+shutdown.
+"""
+
+from app.core.config import settings
+from lib.utils.openai_clients import OpenAIClientRegistry, openai_clients
+
+
+def configure_openai_clients() -> OpenAIClientRegistry:
+    """Apply the OPENAI_* pool settings to the shared registry.
+
+    Returns:
+        The shared client registry
+    """
+    openai_clients.configure(
+        max_connections=settings.OPENAI_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.OPENAI_KEEPALIVE_EXPIRY,
+        http2=settings.OPENAI_HTTP2,
+        max_clients=settings.OPENAI_MAX_CLIENTS,
+        idle_client_ttl=settings.OPENAI_CLIENT_IDLE_TTL
+    )
+    return openai_clients
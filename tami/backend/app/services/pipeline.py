@@ -0,0 +1,594 @@
+"""Checkpointed transcription pipeline.
+
+The pipeline runs as a fixed sequence of stages. Each completed stage stores
+its output in the PipelineCheckpoint table, so a retried or resumed job
+restores finished stages from their checkpoints and restarts at the first
+incomplete one instead of repeating the ASR call. The running stage and
+stage durations are recorded on the session (``Session.currentStage`` and
+``Session.stageTimings``, seconds per stage).
+
+Post-transcription analysis is a single fan-out stage: independent
+analyzers (summary, entities) run concurrently, each under its own timeout.
+Every analyzer is checkpointed on its own, so a failure in one neither
+discards nor blocks the others. Only a failed required analyzer (the
+summary, which persist needs) fails the stage; a retry then reruns just
+that analyzer.
+
+Checkpoints are deleted once the session completes. The generated Prisma
+client predates the checkpoint table and timing column, so both are
+accessed with raw SQL.
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from loguru import logger
+
+from app.db import db
+from app.core.config import settings
+from app.services.summarization import summarization_service
+from app.services.refinement import get_refinement_service
+from app.services.entity_extraction import get_entity_extraction_service
+from app.services.entity_persistence import entity_persistence_service
+from app.services.billing import billing_service
+from app.services.chat_context import bump_content_version
+from lib.utils.models import ActionItem, Summary, TranscriptResult, TranscriptSegment
+
+
+@dataclass
+class PipelineContext:
+    """Inputs for one transcription run plus the state stages build up."""
+    session_id: str
+    audio_path: Path
+    context: str
+    participants: Optional[List[str]]
+    provider: str
+    model: str
+    summary_model: str
+    api_key: str
+    auto_detect_language: bool = True
+    state: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def openai_key(self) -> str:
+        """OpenAI key for LLM stages, regardless of transcription provider."""
+        return settings.OPENAI_API_KEY or self.api_key
+
+    @property
+    def transcript(self) -> TranscriptResult:
+        """Current transcript (from the transcribe or refine stage)."""
+        return transcript_from_dict(self.state["transcript"])
+
+
+@dataclass
+class Analyzer:
+    """An independent analysis run by the fan-out ``analyze`` stage."""
+    name: str
+    run: Callable[[PipelineContext], Awaitable[Dict[str, Any]]]
+    timeout: float  # Seconds before the analyzer is cancelled
+    required: bool = False  # A failed required analyzer fails the stage
+
+    @property
+    def checkpoint_name(self) -> str:
+        """Checkpoint (and stage timing) key for this analyzer."""
+        return f"analyze.{self.name}"
+
+
+def transcript_to_dict(transcript: TranscriptResult) -> Dict[str, Any]:
+    """Serialize a transcript for a checkpoint."""
+    return asdict(transcript)
+
+
+def transcript_from_dict(data: Dict[str, Any]) -> TranscriptResult:
+    """Rebuild a transcript from a checkpoint."""
+    return TranscriptResult(
+        segments=[TranscriptSegment(**segment) for segment in data["segments"]],
+        language=data["language"],
+        metadata=data.get("metadata") or {}
+    )
+
+
+def build_segment_rows(transcript_id: str, segments: List[TranscriptSegment]) -> List[Dict[str, Any]]:
+    """Build TranscriptSegment rows for a bulk insert.
+
+    Args:
+        transcript_id: Parent transcript ID
+        segments: Segments in transcript order
+
+    Returns:
+        Row dicts for ``create_many``
+    """
+    return [
+        {
+            "transcriptId": transcript_id,
+            "speakerId": segment.speaker.lower().replace(" ", "_") if segment.speaker else f"speaker_{(idx % 10) + 1}",
+            "speakerName": segment.speaker if segment.speaker and segment.speaker != "Unknown" else None,
+            "text": segment.text,
+            "startTime": segment.start_time,
+            "endTime": segment.end_time,
+            "order": idx
+        }
+        for idx, segment in enumerate(segments)
+    ]
+
+
+def summary_to_dict(summary: Summary) -> Dict[str, Any]:
+    """Serialize a summary for a checkpoint."""
+    return asdict(summary)
+
+
+def summary_from_dict(data: Dict[str, Any]) -> Summary:
+    """Rebuild a summary from a checkpoint."""
+    return Summary(
+        overview=data["overview"],
+        key_points=data["key_points"],
+        action_items=[ActionItem(**item) for item in data["action_items"]],
+        participants=data.get("participants") or []
+    )
+
+
+class TranscriptionPipeline:
+    """Run transcription stages in order, resuming from checkpoints."""
+
+    def __init__(self):
+        """Initialize pipeline."""
+        # Stage name -> coroutine returning the stage output (merged into state)
+        self.stages: List[tuple[str, Callable[[PipelineContext], Awaitable[Dict[str, Any]]]]] = [
+            ("transcribe", self._transcribe),
+            ("refine", self._refine),
+            ("analyze", self._analyze),
+            ("persist", self._persist),
+            ("billing", self._record_billing),
+        ]
+
+        # Run concurrently by the analyze stage
+        self.analyzers: List[Analyzer] = [
+            Analyzer("summary", self._summarize, settings.ANALYSIS_SUMMARY_TIMEOUT, required=True),
+            Analyzer("entities", self._extract_entities, settings.ANALYSIS_ENTITIES_TIMEOUT),
+        ]
+
+    @property
+    def stage_names(self) -> List[str]:
+        """Stage names in execution order."""
+        return [name for name, _ in self.stages]
+
+    def progress(self, status: str, stage: Optional[str]) -> float:
+        """Estimate progress from session status and current stage.
+
+        Args:
+            status: Session status
+            stage: Stage currently running, if any
+
+        Returns:
+            Fraction of stages completed (0.0 - 1.0)
+        """
+        if status == "completed":
+            return 1.0
+        names = self.stage_names
+        if stage in names:
+            return round(names.index(stage) / len(names), 3)
+        return 0.0
+
+    async def run(self, ctx: PipelineContext) -> None:
+        """Run every incomplete stage and mark the session completed.
+
+        Args:
+            ctx: Pipeline context
+
+        Raises:
+            Exception: Whatever the failing stage raised. The session status is
+                left to the job worker, which marks it failed only once no
+                retries remain.
+        """
+        try:
+            await db.session.update(
+                where={"id": ctx.session_id},
+                data={"status": "processing"}
+            )
+
+            checkpoints = await self._load_checkpoints(ctx.session_id)
+            if checkpoints:
+                logger.info(f"Resuming session {ctx.session_id} after stages: {', '.join(checkpoints)}")
+
+            for name, stage in self.stages:
+                if name in checkpoints:
+                    ctx.state.update(checkpoints[name])
+                    continue
+
+                logger.info(f"Session {ctx.session_id}: running stage '{name}'")
+                await self._set_current_stage(ctx.session_id, name)
+                started = time.perf_counter()
+                output = await stage(ctx)
+                duration = time.perf_counter() - started
+
+                ctx.state.update(output)
+                await self._save_checkpoint(ctx.session_id, name, output, duration)
+                logger.info(f"Session {ctx.session_id}: stage '{name}' finished in {duration:.2f}s")
+
+            # Update session status to completed
+            await db.session.update(
+                where={"id": ctx.session_id},
+                data={"status": "completed"}
+            )
+            await self._clear_checkpoints(ctx.session_id)
+            await self._set_current_stage(ctx.session_id, None)
+
+            logger.info(f"Transcription completed for session {ctx.session_id}")
+
+        except Exception as e:
+            logger.error(f"Transcription failed for session {ctx.session_id}: {e}")
+
+            # Let the job worker retry or give up (and set the session status)
+            raise
+
+    # Stages
+
+    async def _transcribe(self, ctx: PipelineContext) -> Dict[str, Any]:
+        """Transcribe audio (or parse a text import)."""
+        # Determine file type (audio or text import)
+        is_text_import = ctx.audio_path.suffix.lower() == ".txt"
+
+        if is_text_import:
+            # Text import: parse transcript file directly
+            logger.info(f"Processing text import for session {ctx.session_id}")
+            from app.services.transcript_parser import transcript_parser
+
+            transcript_result = transcript_parser.parse_text_file(ctx.audio_path)
+            detected_language = "he"  # Default to Hebrew for text imports
+
+            logger.info(f"Text import complete. {len(transcript_result.segments)} segments parsed")
+
+        # Check if we should use automatic language detection and routing
+        elif ctx.auto_detect_language and ctx.provider == "auto":
+            logger.info("Using automatic language detection and ASR routing")
+
+            # Import transcription service (lazy import for audio files only)
+            from app.services.transcription import transcription_service
+
+            # Use auto-routing: detect language and route to appropriate provider
+            transcript_result, detected_language = await transcription_service.transcribe_with_auto_routing(
+                audio_path=ctx.audio_path,
+                openai_api_key=ctx.openai_key,
+                ivrit_api_key=settings.IVRIT_API_KEY,
+                ivrit_endpoint_id=settings.IVRIT_ENDPOINT_ID,
+                participants=ctx.participants
+            )
+
+            logger.info(f"Auto-routing complete. Detected language: {detected_language}")
+
+        else:
+            # Use explicitly specified provider
+            logger.info(f"Using explicit provider: {ctx.provider}")
+
+            # Import transcription service (lazy import for audio files only)
+            from app.services.transcription import transcription_service
+
+            # Get endpoint_id from settings if using Ivrit provider
+            endpoint_id = settings.IVRIT_ENDPOINT_ID if ctx.provider.lower() == "ivrit" else None
+
+            transcript_result = await transcription_service.transcribe_audio(
+                audio_path=ctx.audio_path,
+                provider=ctx.provider,
+                model=ctx.model,
+                api_key=ctx.api_key,
+                participants=ctx.participants,
+                endpoint_id=endpoint_id
+            )
+
+            detected_language = transcript_result.language
+
+        # Update session with detected language
+        await db.session.update(
+            where={"id": ctx.session_id},
+            data={"detectedLanguage": detected_language}
+        )
+
+        return {
+            "transcript": transcript_to_dict(transcript_result),
+            "detected_language": detected_language
+        }
+
+    async def _refine(self, ctx: PipelineContext) -> Dict[str, Any]:
+        """Refine transcript using GPT-4o (post-processing with context).
+
+        Only runs if enabled - this feature is experimental and can corrupt output.
+        """
+        if not settings.ENABLE_TRANSCRIPT_REFINEMENT:
+            logger.info("Transcript refinement disabled, using original transcript")
+            return {}
+
+        openai_key = settings.OPENAI_API_KEY
+        if not openai_key:
+            logger.warning("Refinement enabled but no OpenAI API key - skipping")
+            return {}
+
+        refinement_service = get_refinement_service()
+        transcript_result = await refinement_service.refine_transcript(
+            transcript=ctx.transcript,
+            context=ctx.context,
+            api_key=openai_key,
+            model="gpt-4o"
+        )
+        logger.info(f"Transcript refined for session {ctx.session_id}")
+        return {"transcript": transcript_to_dict(transcript_result)}
+
+    async def _analyze(self, ctx: PipelineContext) -> Dict[str, Any]:
+        """Run the analyzers concurrently, skipping ones checkpointed earlier.
+
+        Raises:
+            Exception: The error of the first failed required analyzer
+        """
+        checkpoints = await self._load_checkpoints(ctx.session_id)
+
+        output: Dict[str, Any] = {}
+        pending = []
+        for analyzer in self.analyzers:
+            if analyzer.checkpoint_name in checkpoints:
+                output.update(checkpoints[analyzer.checkpoint_name])
+            else:
+                pending.append(analyzer)
+
+        results = await asyncio.gather(*(self._run_analyzer(ctx, analyzer) for analyzer in pending))
+
+        required_error: Optional[Exception] = None
+        for analyzer, (result, error) in zip(pending, results):
+            if error is None:
+                output.update(result)
+            elif analyzer.required:
+                required_error = required_error or error
+            else:
+                output[f"{analyzer.name}_error"] = str(error)
+
+        if required_error is not None:
+            raise required_error
+        return output
+
+    async def _run_analyzer(
+        self,
+        ctx: PipelineContext,
+        analyzer: Analyzer
+    ) -> tuple[Dict[str, Any], Optional[Exception]]:
+        """Run one analyzer under its timeout and checkpoint its output.
+
+        Returns:
+            (output, None) on success, ({}, error) on failure or timeout
+        """
+        started = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(analyzer.run(ctx), timeout=analyzer.timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Session {ctx.session_id}: analyzer '{analyzer.name}' timed out after {analyzer.timeout:g}s")
+            return {}, TimeoutError(f"Analyzer '{analyzer.name}' timed out after {analyzer.timeout:g}s")
+        except Exception as e:
+            logger.error(f"Session {ctx.session_id}: analyzer '{analyzer.name}' failed: {e}")
+            return {}, e
+
+        duration = time.perf_counter() - started
+        await self._save_checkpoint(ctx.session_id, analyzer.checkpoint_name, result, duration)
+        logger.info(f"Session {ctx.session_id}: analyzer '{analyzer.name}' finished in {duration:.2f}s")
+        return result, None
+
+    async def _summarize(self, ctx: PipelineContext) -> Dict[str, Any]:
+        """Generate summary."""
+        summary_result = await summarization_service.generate_summary(
+            transcript=ctx.transcript,
+            context=ctx.context,
+            participants=ctx.participants or [],
+            api_key=ctx.openai_key,
+            model=ctx.summary_model
+        )
+        return {"summary": summary_to_dict(summary_result)}
+
+    async def _persist(self, ctx: PipelineContext) -> Dict[str, Any]:
+        """Save transcript, segments, summary and action items atomically.
+
+        Rows from an earlier attempt that got this far are replaced.
+        """
+        transcript_result = ctx.transcript
+        summary_result = summary_from_dict(ctx.state["summary"])
+
+        async with db.tx(timeout=timedelta(seconds=settings.DB_TRANSACTION_TIMEOUT)) as tx:
+            await tx.transcript.delete_many(where={"sessionId": ctx.session_id})
+            await tx.summary.delete_many(where={"sessionId": ctx.session_id})
+
+            # Create transcript in database
+            transcript_record = await tx.transcript.create(
+                data={
+                    "sessionId": ctx.session_id,
+                    "language": transcript_result.language,
+                    "duration": transcript_result.metadata.get("duration") if transcript_result.metadata else None
+                }
+            )
+
+            # Create transcript segments in one statement
+            if transcript_result.segments:
+                await tx.transcriptsegment.create_many(
+                    data=build_segment_rows(transcript_record.id, transcript_result.segments)
+                )
+
+            # Create summary in database
+            summary_record = await tx.summary.create(
+                data={
+                    "sessionId": ctx.session_id,
+                    "overview": summary_result.overview,
+                    "keyPoints": summary_result.key_points
+                }
+            )
+
+            # Create action items in one statement
+            if summary_result.action_items:
+                await tx.actionitem.create_many(
+                    data=[
+                        {
+                            "summaryId": summary_record.id,
+                            "description": action.description,
+                            "assignee": action.assignee,
+                            "deadline": action.deadline
+                        }
+                        for action in summary_result.action_items
+                    ]
+                )
+
+            await bump_content_version(ctx.session_id, tx)
+
+        logger.info(
+            f"Transcript ({len(transcript_result.segments)} segments) and summary "
+            f"({len(summary_result.action_items)} action items) saved for session {ctx.session_id}"
+        )
+        return {"transcript_id": transcript_record.id, "summary_id": summary_record.id}
+
+    async def _extract_entities(self, ctx: PipelineContext) -> Dict[str, Any]:
+        """Extract and save entities and auto-tags (optional analyzer)."""
+        # Get user ID from session
+        session_data = await db.session.find_unique(where={"id": ctx.session_id})
+        user_id = session_data.userId if session_data else None
+
+        if not user_id:
+            return {}
+
+        # Build full transcript text
+        transcript_text = " ".join([seg.text for seg in ctx.transcript.segments])
+
+        # Extract entities
+        entity_service = get_entity_extraction_service(ctx.openai_key)
+        extracted_entities = await entity_service.extract_and_deduplicate(
+            transcript_text=transcript_text,
+            context=ctx.context
+        )
+
+        counts = await entity_persistence_service.save_session_entities(
+            ctx.session_id, user_id, extracted_entities
+        )
+        logger.info(f"Entities extracted and saved for session {ctx.session_id}")
+        return {"entity_count": counts["entities"], "tag_count": counts["tags"]}
+
+    async def _record_billing(self, ctx: PipelineContext) -> Dict[str, Any]:
+        """Record usage for billing. Failures don't fail the pipeline."""
+        try:
+            session_data = await db.session.find_unique(where={"id": ctx.session_id})
+            metadata = ctx.state["transcript"].get("metadata") or {}
+            duration_minutes = (metadata.get("duration") or 0) / 60.0
+            if session_data and duration_minutes > 0:
+                await billing_service.record_usage(
+                    user_id=session_data.userId,
+                    session_id=ctx.session_id,
+                    duration_minutes=duration_minutes
+                )
+                logger.info(f"Recorded {duration_minutes:.2f} minutes of usage for session {ctx.session_id}")
+                return {"billed_minutes": duration_minutes}
+        except Exception as billing_error:
+            # Billing failure shouldn't fail the transcription
+            logger.error(f"Failed to record usage for session {ctx.session_id}: {billing_error}")
+        return {}
+
+    # Checkpoints
+
+    async def _load_checkpoints(self, session_id: str) -> Dict[str, Dict[str, Any]]:
+        """Load completed stage outputs for a session.
+
+        Returns:
+            Dict mapping stage name to its output
+        """
+        rows = await db.query_raw(
+            'SELECT stage, output FROM "PipelineCheckpoint" WHERE "sessionId" = $1',
+            session_id
+        )
+        checkpoints = {}
+        for row in rows:
+            output = row["output"]
+            checkpoints[row["stage"]] = json.loads(output) if isinstance(output, str) else (output or {})
+        return checkpoints
+
+    async def _save_checkpoint(
+        self,
+        session_id: str,
+        stage: str,
+        output: Dict[str, Any],
+        duration: float
+    ) -> None:
+        """Store a stage output and add its duration to the session timings."""
+        await db.execute_raw(
+            '''
+            INSERT INTO "PipelineCheckpoint" (id, "sessionId", stage, output, "durationMs", "createdAt")
+            VALUES ($1, $2, $3, $4::jsonb, $5, CURRENT_TIMESTAMP)
+            ON CONFLICT ("sessionId", stage)
+            DO UPDATE SET output = EXCLUDED.output, "durationMs" = EXCLUDED."durationMs",
+                          "createdAt" = EXCLUDED."createdAt"
+            ''',
+            uuid.uuid4().hex,
+            session_id,
+            stage,
+            json.dumps(output),
+            int(duration * 1000)
+        )
+        await db.execute_raw(
+            '''
+            UPDATE "Session"
+            SET "stageTimings" = COALESCE("stageTimings", '{}'::jsonb) || jsonb_build_object($2::text, $3::float8)
+            WHERE id = $1
+            ''',
+            session_id,
+            stage,
+            round(duration, 3)
+        )
+
+    async def _set_current_stage(self, session_id: str, stage: Optional[str]) -> None:
+        """Record the running stage on the session (for status streaming)."""
+        await db.execute_raw(
+            'UPDATE "Session" SET "currentStage" = $2 WHERE id = $1',
+            session_id,
+            stage
+        )
+
+    async def _clear_checkpoints(self, session_id: str) -> None:
+        """Delete a completed session's checkpoints (timings stay on the session)."""
+        await db.execute_raw('DELETE FROM "PipelineCheckpoint" WHERE "sessionId" = $1', session_id)
+
+
+# Singleton instance
+transcription_pipeline = TranscriptionPipeline()
+
+
+def get_provider_api_key(provider: str) -> str:
+    """Get the API key for a transcription provider.
+
+    Args:
+        provider: Transcription provider name
+
+    Returns:
+        API key from settings
+    """
+    # TODO: Get API key from user settings in database
+    # For now, use the API key from environment variable based on provider
+    if provider.lower() == "ivrit":
+        return settings.IVRIT_API_KEY or settings.SECRET_KEY
+    return settings.OPENAI_API_KEY or settings.SECRET_KEY
+
+
+async def run_transcription_job(payload: Dict[str, Any]) -> None:
+    """Run (or resume) a queued transcription job.
+
+    API keys are resolved here rather than stored in the job payload.
+
+    Args:
+        payload: Job payload written by the transcribe endpoint
+    """
+    await transcription_pipeline.run(
+        PipelineContext(
+            session_id=payload["session_id"],
+            audio_path=Path(payload["audio_path"]),
+            context=payload["context"],
+            participants=payload.get("participants"),
+            provider=payload["provider"],
+            model=payload["model"],
+            summary_model=payload["summary_model"],
+            api_key=get_provider_api_key(payload["provider"]),
+            auto_detect_language=payload.get("auto_detect_language", True)
+        )
+    )
@@ -0,0 +1,32 @@
+"""Shared provider scheduler for the backend.
+
+All OpenAI and RunPod calls go through ``lib.utils.provider_scheduler``,
+which applies per-account request/token rate limits and retries 429s,
+server errors and network errors with Retry-After-aware backoff. Limits and
+the retry policy come from the OPENAI_*_PER_MINUTE, RUNPOD_REQUESTS_PER_MINUTE
+and PROVIDER_* settings; the API and the standalone worker call
+``configure_provider_scheduler`` at startup.
+"""
+
+from app.core.config import settings
+from lib.utils.provider_scheduler import ProviderScheduler, provider_scheduler
+
+
+def configure_provider_scheduler() -> ProviderScheduler:
+    """Apply the rate limit and retry settings to the shared scheduler.
+
+    Returns:
+        The shared provider scheduler
+    """
+    provider_scheduler.configure_retries(
+        max_retries=settings.PROVIDER_MAX_RETRIES,
+        base_delay=settings.PROVIDER_BACKOFF_BASE,
+        max_delay=settings.PROVIDER_BACKOFF_MAX
+    )
+    provider_scheduler.set_limits(
+        "openai",
+        requests_per_minute=settings.OPENAI_REQUESTS_PER_MINUTE,
+        tokens_per_minute=settings.OPENAI_TOKENS_PER_MINUTE
+    )
+    provider_scheduler.set_limits("runpod", requests_per_minute=settings.RUNPOD_REQUESTS_PER_MINUTE)
+    return provider_scheduler
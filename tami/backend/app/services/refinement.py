@@ -9,7 +9,13 @@ from openai import AsyncOpenAI
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent.parent.parent))
 
+from lib.utils.llm_cache import cached_completion
+from lib.utils.openai_clients import get_openai_client
 from lib.utils.models import TranscriptResult, TranscriptSegment
+from app.services.llm_cache import get_llm_cache
+
+# Bump when the refinement prompt changes so cached responses are not reused
+REFINEMENT_PROMPT_VERSION = "1"
 
 
 class TranscriptRefinementService:
@@ -54,7 +60,7 @@ class TranscriptRefinementService:
         logger.info(f"Refining transcript with {model} using context: {context[:100]}...")
 
         try:
-            client = AsyncOpenAI(api_key=api_key)
+            client = get_openai_client(api_key)
 
             # Build the full transcript text for refinement
             full_transcript = self._format_transcript_for_refinement(transcript)
@@ -146,7 +152,11 @@ Speaker Name: corrected text here
 Corrected transcript:"""
 
         try:
-            response = await client.chat.completions.create(
+            refined_text = await cached_completion(
+                client,
+                get_llm_cache(),
+                "refinement",
+                REFINEMENT_PROMPT_VERSION,
                 model=model,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -156,8 +166,7 @@ Corrected transcript:"""
                 max_tokens=4000  # Allow for longer transcripts
             )
 
-            refined_text = response.choices[0].message.content.strip()
-            return refined_text
+            return refined_text.strip()
 
         except Exception as e:
             logger.error(f"Failed to refine transcript: {e}")
@@ -0,0 +1,123 @@
+"""Full-text search over sessions and transcript segments.
+
+Both tables carry a generated ``searchVector`` tsvector column with a GIN
+index (see tami/shared/prisma/sql/001_search_vectors.sql). Queries are
+parsed with ``websearch_to_tsquery``, so users can write quoted phrases,
+``or`` and ``-excluded`` terms; plain words must all match.
+"""
+
+from typing import Any, Dict, List
+
+from app.db import db
+
+
+# One ranked pass over session metadata and transcript segments. Each
+# session appears once, ranked by its best hit, together with its
+# best-matching segment (if any segment matched).
+SESSION_SEARCH_SQL = '''
+WITH query AS (
+    SELECT websearch_to_tsquery('simple', $1) AS q
+),
+session_hits AS (
+    SELECT s.id AS session_id, ts_rank(s."searchVector", query.q) AS rank
+    FROM "Session" s, query
+    WHERE s."userId" = $2 AND s."searchVector" @@ query.q
+),
+segment_hits AS (
+    SELECT DISTINCT ON (t."sessionId")
+        t."sessionId" AS session_id,
+        seg.id AS segment_id,
+        seg.text,
+        seg."startTime",
+        ts_rank(seg."searchVector", query.q) AS rank
+    FROM "TranscriptSegment" seg
+    JOIN "Transcript" t ON t.id = seg."transcriptId"
+    JOIN "Session" s ON s.id = t."sessionId"
+    CROSS JOIN query
+    WHERE s."userId" = $2 AND seg."searchVector" @@ query.q
+    ORDER BY t."sessionId", rank DESC
+),
+hits AS (
+    SELECT session_id, rank, 'session' AS match_type FROM session_hits
+    UNION ALL
+    SELECT session_id, rank, 'transcript' AS match_type FROM segment_hits
+),
+best AS (
+    SELECT DISTINCT ON (session_id) session_id, rank, match_type
+    FROM hits
+    ORDER BY session_id, rank DESC
+)
+SELECT
+    s.id,
+    s.title,
+    s.context,
+    s.status,
+    s."createdAt",
+    b.rank,
+    b.match_type,
+    sh.segment_id,
+    sh.text AS matched_text,
+    sh."startTime" AS matched_start_time,
+    COUNT(*) OVER () AS total
+FROM best b
+JOIN "Session" s ON s.id = b.session_id
+LEFT JOIN segment_hits sh ON sh.session_id = b.session_id
+ORDER BY b.rank DESC, s."createdAt" DESC
+LIMIT $3
+'''
+
+SEGMENT_SEARCH_SQL = '''
+SELECT
+    ts.id,
+    ts."transcriptId",
+    ts."speakerId",
+    ts."speakerName",
+    ts.text,
+    ts."startTime",
+    ts."endTime",
+    ts."order",
+    ts_rank(ts."searchVector", websearch_to_tsquery('simple', $1)) AS rank
+FROM "TranscriptSegment" ts
+WHERE ts."transcriptId" = $2
+  AND ts."searchVector" @@ websearch_to_tsquery('simple', $1)
+ORDER BY ts."order"
+LIMIT $3
+'''
+
+
+class SearchService:
+    """Run full-text queries against the generated search columns."""
+
+    async def search_sessions(self, user_id: str, query: str, limit: int) -> List[Dict[str, Any]]:
+        """Find a user's sessions matching a query.
+
+        Args:
+            user_id: User ID
+            query: Web-search style query
+            limit: Maximum sessions to return
+
+        Returns:
+            Rows ordered by rank. Each row has the session fields, ``rank``,
+            ``match_type`` ("session" or "transcript"), the best-matching
+            segment (``segment_id``, ``matched_text``, ``matched_start_time``;
+            None if only the title/context matched) and ``total`` (all
+            matching sessions, before the limit).
+        """
+        return await db.query_raw(SESSION_SEARCH_SQL, query, user_id, limit)
+
+    async def search_segments(self, transcript_id: str, query: str, limit: int) -> List[Dict[str, Any]]:
+        """Find matching segments of one transcript, in transcript order.
+
+        Args:
+            transcript_id: Transcript ID
+            query: Web-search style query
+            limit: Maximum segments to return
+
+        Returns:
+            Segment rows with ``rank``
+        """
+        return await db.query_raw(SEGMENT_SEARCH_SQL, query, transcript_id, limit)
+
+
+# Singleton instance
+search_service = SearchService()
@@ -0,0 +1,64 @@
+"""Per-user session counts kept on the User row.
+
+``User.sessionCount`` is adjusted in the same transaction that creates or
+deletes a session, so listing never has to count a user's sessions. NULL
+means "not known yet" (users created before the column existed): the first
+read counts once and stores the result, and increments leave NULL alone
+until then. The generated Prisma client predates the column, so access
+goes through raw SQL.
+"""
+
+from typing import Any, Optional
+
+from app.db import db
+
+
+class SessionCountService:
+    """Read and maintain cached session counts."""
+
+    async def get(self, user_id: str) -> int:
+        """Get a user's session count, backfilling the cache if needed.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Number of sessions owned by the user
+        """
+        row = await db.query_first('SELECT "sessionCount" FROM "User" WHERE id = $1', user_id)
+        if row and row["sessionCount"] is not None:
+            return row["sessionCount"]
+
+        row = await db.query_first(
+            '''
+            UPDATE "User"
+            SET "sessionCount" = (SELECT COUNT(*)::int FROM "Session" WHERE "userId" = $1)
+            WHERE id = $1
+            RETURNING "sessionCount"
+            ''',
+            user_id
+        )
+        if row:
+            return row["sessionCount"]
+        # No user row (e.g. dev mode): count directly
+        return await db.session.count(where={"userId": user_id})
+
+    async def adjust(self, user_id: Optional[str], delta: int, client: Optional[Any] = None) -> None:
+        """Add ``delta`` to a user's cached count.
+
+        Args:
+            user_id: User ID
+            delta: +1 after a create, -1 after a delete
+            client: Transaction to run in (default: the shared client)
+        """
+        if not user_id:
+            return
+        await (client or db).execute_raw(
+            'UPDATE "User" SET "sessionCount" = "sessionCount" + $2 WHERE id = $1',
+            user_id,
+            delta
+        )
+
+
+# Singleton instance
+session_count_service = SessionCountService()
@@ -0,0 +1,173 @@
+"""Push transcription status changes to clients.
+
+Each watched session has one polling task that reads a lightweight status
+snapshot (no transcript, no summary) every STATUS_STREAM_POLL_INTERVAL
+seconds and fans changes out to every subscriber, so the database load stays
+at one small query per session per interval however many clients listen.
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+from loguru import logger
+
+from app.db import db
+from app.core.config import settings
+from app.services.pipeline import transcription_pipeline
+
+
+TERMINAL_STATUSES = {"completed", "failed"}
+
+# Queued to subscribers when the session no longer exists
+_GONE = object()
+
+
+async def get_status_snapshot(session_id: str) -> Optional[Dict[str, Any]]:
+    """Read a session's status and pipeline progress without its content.
+
+    Args:
+        session_id: Session ID
+
+    Returns:
+        Status fields matching TranscriptionStatusResponse, or None if the
+        session does not exist
+    """
+    row = await db.query_first(
+        '''
+        SELECT id, status, "audioFileName", "detectedLanguage", "currentStage", "stageTimings"
+        FROM "Session"
+        WHERE id = $1
+        ''',
+        session_id
+    )
+    if not row:
+        return None
+
+    timings = row["stageTimings"]
+    if isinstance(timings, str):
+        timings = json.loads(timings)
+
+    return {
+        "sessionId": row["id"],
+        "status": row["status"],
+        "audioFileName": row["audioFileName"],
+        "audioFileUrl": f"/api/sessions/{row['id']}/audio",
+        "detectedLanguage": row["detectedLanguage"],
+        "stage": row["currentStage"],
+        "progress": transcription_pipeline.progress(row["status"], row["currentStage"]),
+        "stageTimings": timings
+    }
+
+
+@dataclass
+class _Watch:
+    """Polling task and subscriber queues for one session."""
+    subscribers: Set[asyncio.Queue] = field(default_factory=set)
+    latest: Optional[Dict[str, Any]] = None
+    task: Optional[asyncio.Task] = None
+
+
+class StatusBroadcaster:
+    """Share one status poll per session across all subscribers."""
+
+    def __init__(self, poll_interval: Optional[float] = None):
+        """Initialize broadcaster.
+
+        Args:
+            poll_interval: Seconds between status checks (default: STATUS_STREAM_POLL_INTERVAL)
+        """
+        self.poll_interval = poll_interval or settings.STATUS_STREAM_POLL_INTERVAL
+        self._watches: Dict[str, _Watch] = {}
+
+    async def subscribe(
+        self,
+        session_id: str,
+        heartbeat: Optional[float] = None
+    ) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """Yield status snapshots for a session as they change.
+
+        The current snapshot is yielded first. Iteration ends after a
+        terminal status (completed/failed) or if the session disappears.
+
+        Args:
+            session_id: Session ID
+            heartbeat: If set, yield None after this many idle seconds so
+                callers can keep the connection alive
+
+        Yields:
+            Status snapshots (see get_status_snapshot), or None for heartbeats
+        """
+        watch = self._watches.get(session_id)
+        if watch is None:
+            watch = self._watches[session_id] = _Watch()
+            watch.task = asyncio.create_task(self._poll(session_id, watch))
+
+        queue: asyncio.Queue = asyncio.Queue()
+        watch.subscribers.add(queue)
+        if watch.latest is not None:
+            queue.put_nowait(watch.latest)
+
+        try:
+            while True:
+                try:
+                    snapshot = await asyncio.wait_for(queue.get(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+
+                if snapshot is _GONE:
+                    return
+                yield snapshot
+                if snapshot["status"] in TERMINAL_STATUSES:
+                    return
+
+        finally:
+            watch.subscribers.discard(queue)
+            if not watch.subscribers:
+                watch.task.cancel()
+                if self._watches.get(session_id) is watch:
+                    del self._watches[session_id]
+
+    def stats(self) -> Dict[str, int]:
+        """Get watched session and subscriber counts."""
+        return {
+            "sessions": len(self._watches),
+            "subscribers": sum(len(w.subscribers) for w in self._watches.values())
+        }
+
+    async def _poll(self, session_id: str, watch: _Watch) -> None:
+        """Poll a session until it finishes, publishing each change."""
+        while True:
+            try:
+                snapshot = await get_status_snapshot(session_id)
+            except Exception as e:
+                logger.error(f"Status poll failed for session {session_id}: {e}")
+                await asyncio.sleep(self.poll_interval)
+                continue
+
+            if snapshot is None:
+                self._publish(watch, _GONE)
+                break
+
+            if snapshot != watch.latest:
+                watch.latest = snapshot
+                self._publish(watch, snapshot)
+            if snapshot["status"] in TERMINAL_STATUSES:
+                break
+
+            await asyncio.sleep(self.poll_interval)
+
+        # Later subscribers start a fresh poll
+        if self._watches.get(session_id) is watch:
+            del self._watches[session_id]
+
+    @staticmethod
+    def _publish(watch: _Watch, item: Any) -> None:
+        for queue in watch.subscribers:
+            queue.put_nowait(item)
+
+
+# Singleton instance
+status_broadcaster = StatusBroadcaster()
@@ -0,0 +1,218 @@
+"""Typeahead suggestions from entity values and session titles.
+
+Suggestions come from a per-user in-memory prefix index when
+SUGGESTION_CACHE_ENABLED is set, and from the database otherwise. The index
+is built from one query per table on a user's first keystroke, then answers
+every prefix from memory. It is dropped when the user's entities or session
+titles change in this process, and expires after SUGGESTION_CACHE_TTL
+seconds to pick up changes made by other processes (e.g. a separate job
+worker). The database path relies on the pg_trgm GIN indexes on
+``Entity.value`` and ``Session.title``, which serve ``ILIKE`` patterns.
+"""
+
+import bisect
+import heapq
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from app.db import db
+from app.core.config import settings
+
+
+@dataclass(frozen=True)
+class Suggestion:
+    """A typeahead suggestion."""
+    text: str
+    type: str  # "entity" or "session"
+    entity_type: Optional[str] = None
+    weight: int = 0  # Entity mention count; session titles rank after entities
+
+    def to_dict(self) -> Dict[str, str]:
+        """Convert to the API response format."""
+        data = {"text": self.text, "type": self.type}
+        if self.entity_type:
+            data["entityType"] = self.entity_type
+        return data
+
+
+class PrefixIndex:
+    """Sorted-key prefix index (a flattened trie) over suggestions.
+
+    Entity values are kept sorted by text, so a lookup is a binary search for
+    the first key plus a scan over the matching range. Session titles match
+    when the query appears anywhere in them, the same rule as the database
+    path's substring ``ILIKE``, so they are kept in ranking order and scanned
+    only when the entities don't fill the limit.
+    """
+
+    def __init__(self, suggestions: List[Suggestion]):
+        """Build the index.
+
+        Args:
+            suggestions: Suggestions to index
+        """
+        entities = sorted(
+            (s.text.lower(), idx) for idx, s in enumerate(suggestions) if s.type == "entity"
+        )
+        self._keys = [key for key, _ in entities]
+        self._items = [idx for _, idx in entities]
+        titles = sorted(
+            (s for s in suggestions if s.type == "session"),
+            key=lambda s: (-s.weight, s.text)
+        )
+        self._titles = [(s.text.lower(), s) for s in titles]
+        self._suggestions = suggestions
+
+    def search(self, prefix: str, limit: int) -> List[Suggestion]:
+        """Find the highest-weighted suggestions matching ``prefix``.
+
+        Entities match when they start with it, session titles when they
+        contain it.
+
+        Args:
+            prefix: Typed text (case-insensitive)
+            limit: Maximum suggestions
+
+        Returns:
+            Entities first (by mention count), then session titles
+        """
+        prefix = prefix.lower()
+        start = bisect.bisect_left(self._keys, prefix)
+        end = start
+        while end < len(self._keys) and self._keys[end].startswith(prefix):
+            end += 1
+
+        results = heapq.nsmallest(
+            limit,
+            (self._suggestions[idx] for idx in self._items[start:end]),
+            key=lambda s: (-s.weight, s.text)
+        )
+        for text, suggestion in self._titles:
+            if len(results) >= limit:
+                break
+            if prefix in text:
+                results.append(suggestion)
+        return results
+
+
+def _like_pattern(text: str, contains: bool) -> str:
+    """Escape LIKE wildcards and build a prefix or substring pattern."""
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%" if contains else f"{escaped}%"
+
+
+class SuggestionService:
+    """Serve typeahead suggestions for a user."""
+
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        max_users: Optional[int] = None,
+        ttl: Optional[float] = None
+    ):
+        """Initialize suggestion service.
+
+        Args:
+            enabled: Use the in-memory index (default: SUGGESTION_CACHE_ENABLED)
+            max_users: Users kept in memory, least recently used evicted first
+                (default: SUGGESTION_CACHE_MAX_USERS)
+            ttl: Seconds before an index is rebuilt (default: SUGGESTION_CACHE_TTL)
+        """
+        self.enabled = settings.SUGGESTION_CACHE_ENABLED if enabled is None else enabled
+        self.max_users = max_users or settings.SUGGESTION_CACHE_MAX_USERS
+        self.ttl = ttl or settings.SUGGESTION_CACHE_TTL
+        self._indexes: "OrderedDict[str, Tuple[float, PrefixIndex]]" = OrderedDict()
+
+    async def suggest(self, user_id: str, query: str, limit: int) -> List[Suggestion]:
+        """Get suggestions for a partial query.
+
+        Args:
+            user_id: User ID
+            query: Typed text
+            limit: Maximum suggestions
+
+        Returns:
+            Matching entities (by mention count), then session titles
+        """
+        query = query.strip()
+        if not query:
+            return []
+        if not self.enabled:
+            return await self._query_database(user_id, query, limit)
+
+        index = await self._get_index(user_id)
+        return index.search(query, limit)
+
+    def invalidate(self, user_id: Optional[str]) -> None:
+        """Drop a user's index after their entities or session titles change.
+
+        Args:
+            user_id: User ID
+        """
+        if user_id:
+            self._indexes.pop(user_id, None)
+
+    async def _get_index(self, user_id: str) -> PrefixIndex:
+        """Get a user's index, building it on first use or after expiry."""
+        cached = self._indexes.get(user_id)
+        if cached and time.monotonic() - cached[0] < self.ttl:
+            self._indexes.move_to_end(user_id)
+            return cached[1]
+
+        index = PrefixIndex(await self._load_suggestions(user_id))
+        self._indexes[user_id] = (time.monotonic(), index)
+        self._indexes.move_to_end(user_id)
+        while len(self._indexes) > self.max_users:
+            self._indexes.popitem(last=False)
+        return index
+
+    @staticmethod
+    async def _load_suggestions(user_id: str) -> List[Suggestion]:
+        """Load every entity value and session title for a user."""
+        entities = await db.query_raw(
+            'SELECT value, type, "mentionCount" FROM "Entity" WHERE "userId" = $1',
+            user_id
+        )
+        titles = await db.query_raw(
+            'SELECT DISTINCT title FROM "Session" WHERE "userId" = $1 AND title IS NOT NULL',
+            user_id
+        )
+        return [
+            Suggestion(text=row["value"], type="entity", entity_type=row["type"], weight=row["mentionCount"])
+            for row in entities
+        ] + [
+            Suggestion(text=row["title"], type="session")
+            for row in titles
+        ]
+
+    @staticmethod
+    async def _query_database(user_id: str, query: str, limit: int) -> List[Suggestion]:
+        """Prefix-match entities and substring-match titles (trigram indexes)."""
+        rows = await db.query_raw(
+            '''
+            (SELECT value AS text, 'entity' AS kind, type AS entity_type, "mentionCount" AS weight
+             FROM "Entity"
+             WHERE "userId" = $1 AND value ILIKE $2
+             ORDER BY "mentionCount" DESC
+             LIMIT $4)
+            UNION ALL
+            (SELECT DISTINCT title, 'session', NULL, 0
+             FROM "Session"
+             WHERE "userId" = $1 AND title ILIKE $3
+             LIMIT $4)
+            ''',
+            user_id,
+            _like_pattern(query, contains=False),
+            _like_pattern(query, contains=True),
+            limit
+        )
+        return [
+            Suggestion(text=row["text"], type=row["kind"], entity_type=row["entity_type"], weight=row["weight"])
+            for row in rows
+        ][:limit]
+
+
+# Singleton instance
+suggestion_service = SuggestionService()
@@ -10,6 +10,8 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent.parent.pare
 
 from lib.summarization.summarizer import Summarizer
 from lib.utils.models import TranscriptResult, Summary
+from app.core.config import settings
+from app.services.llm_cache import get_llm_cache
 
 
 class SummarizationService:
@@ -38,7 +40,14 @@ class SummarizationService:
         logger.info(f"Generating summary with {model}")
 
         try:
-            summarizer = Summarizer(api_key=api_key, model=model)
+            summarizer = Summarizer(
+                api_key=api_key,
+                model=model,
+                window_tokens=settings.SUMMARY_WINDOW_TOKENS,
+                max_concurrency=settings.SUMMARY_MAX_CONCURRENCY,
+                reduce_fanout=settings.SUMMARY_REDUCE_FANOUT,
+                cache=get_llm_cache()
+            )
             summary = await summarizer.generate_summary(
                 transcript=transcript,
                 context=context,
@@ -10,10 +10,15 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent.parent.pare
 
 from src.transcription.whisper import WhisperTranscriber
 from src.transcription.ivrit import IvritTranscriber
+from src.audio.cache import ProcessedAudioCache
 from src.audio.processor import AudioProcessor
 from src.diarization.speaker_labeler import SpeakerLabeler
-from lib.utils.models import TranscriptResult
+from lib.utils.models import LanguageDetectionResult, TranscriptResult
+from lib.utils.openai_clients import get_openai_client
+from lib.utils.provider_scheduler import provider_scheduler
 from src.utils.exceptions import AudioFileError, APIError
+from app.core.config import settings
+from app.services.audio_executor import audio_executor
 
 
 class TranscriptionService:
@@ -28,44 +33,57 @@ class TranscriptionService:
 
     def __init__(self):
         """Initialize transcription service."""
-        self.audio_processor = AudioProcessor(normalize=True, sample_rate=16000)
+        # Processed files are cached by content so detection and transcription
+        # of the same upload (or a retried job) share a single decode
+        self.audio_cache = ProcessedAudioCache(max_bytes=settings.AUDIO_CACHE_MAX_BYTES)
+        self.audio_processor = AudioProcessor(normalize=True, sample_rate=16000, cache=self.audio_cache)
 
     async def detect_language(
         self,
         audio_path: Path,
         api_key: str
-    ) -> Tuple[str, float]:
-        """Detect the dominant language in an audio file.
+    ) -> LanguageDetectionResult:
+        """Detect the dominant language from short excerpts of an audio file.
 
         Args:
             audio_path: Path to audio file
             api_key: OpenAI API key for Whisper
 
         Returns:
-            Tuple of (language_code, confidence) e.g. ("en", 0.95)
+            LanguageDetectionResult; ``transcript`` is set when the recording
+            was short enough to be transcribed whole
         """
         logger.info(f"Detecting language for: {audio_path}")
 
         try:
             # Process audio first
-            processed_audio = self.audio_processor.process(audio_path)
-
-            # Use Whisper to detect language
-            transcriber = WhisperTranscriber(api_key=api_key)
-            language, confidence = await transcriber.detect_language(processed_audio)
-
-            # Clean up processed audio if different from original
+            processed_audio = await self.audio_processor.process_async(audio_path, executor=audio_executor)
+
+            # Use Whisper to detect language on sampled excerpts
+            transcriber = WhisperTranscriber(
+                api_key=api_key,
+                max_concurrency=settings.WHISPER_MAX_CONCURRENCY,
+                client=get_openai_client(api_key),
+                scheduler=provider_scheduler
+            )
+            detection = await transcriber.detect_language_from_excerpts(
+                processed_audio,
+                excerpt_duration=settings.LANGUAGE_DETECTION_EXCERPT_SECONDS,
+                excerpt_count=settings.LANGUAGE_DETECTION_EXCERPTS
+            )
+
+            # Release processed audio if different from original
             if processed_audio != audio_path:
-                self.audio_processor.cleanup(processed_audio)
+                self.audio_processor.release(processed_audio)
 
-            logger.info(f"Detected language: {language} (confidence: {confidence})")
-            return language, confidence
+            logger.info(f"Detected language: {detection.language} (confidence: {detection.confidence:.2f})")
+            return detection
 
         except Exception as e:
             logger.error(f"Language detection failed: {e}")
             # Clean up on error
             if 'processed_audio' in locals() and processed_audio != audio_path:
-                self.audio_processor.cleanup(processed_audio)
+                self.audio_processor.release(processed_audio)
             raise
 
     def get_provider_for_language(self, language: str) -> str:
@@ -119,11 +137,41 @@ class TranscriptionService:
         """
         logger.info(f"Starting auto-routed transcription for: {audio_path}")
 
-        # Step 1: Detect language
-        language, confidence = await self.detect_language(audio_path, openai_api_key)
+        # Pin the processed file for the whole job so detection and
+        # transcription both hit the cache instead of decoding twice
+        pinned_audio = await self.audio_processor.process_async(audio_path, executor=audio_executor)
+        try:
+            return await self._transcribe_with_auto_routing(
+                audio_path, openai_api_key, ivrit_api_key, ivrit_endpoint_id, participants
+            )
+        finally:
+            if pinned_audio != audio_path:
+                self.audio_processor.release(pinned_audio)
+
+    async def _transcribe_with_auto_routing(
+        self,
+        audio_path: Path,
+        openai_api_key: str,
+        ivrit_api_key: Optional[str],
+        ivrit_endpoint_id: Optional[str],
+        participants: Optional[List[str]]
+    ) -> Tuple[TranscriptResult, str]:
+        """Detect language and transcribe (see ``transcribe_with_auto_routing``)."""
+        # Step 1: Detect language from short excerpts
+        detection = await self.detect_language(audio_path, openai_api_key)
+        language: Optional[str] = detection.language
 
         # Step 2: Get provider and model
-        provider = self.get_provider_for_language(language)
+        if detection.confidence < settings.LANGUAGE_DETECTION_MIN_CONFIDENCE:
+            # Too uncertain to route or pin a language: let Whisper auto-detect
+            logger.warning(
+                f"Low language detection confidence ({detection.confidence:.2f} for '{language}'), "
+                "using Whisper with auto-detect"
+            )
+            language = None
+            provider = "whisper"
+        else:
+            provider = self.get_provider_for_language(language)
         model = self.get_model_for_provider(provider)
 
         # Step 3: Route to appropriate provider
@@ -141,7 +189,16 @@ class TranscriptionService:
             api_key = openai_api_key
             endpoint_id = None
 
-        # Step 4: Transcribe
+        # Step 4: Reuse the detection transcript if it already covers the recording
+        if provider == "whisper" and detection.transcript is not None:
+            logger.info("Reusing language detection transcript, skipping second Whisper call")
+            transcript_result = detection.transcript
+            if participants:
+                transcript_result = SpeakerLabeler(participants).label_speakers(transcript_result)
+                logger.info(f"Speakers labeled: {participants}")
+            return transcript_result, language or transcript_result.language
+
+        # Step 5: Transcribe
         transcript_result = await self.transcribe_audio(
             audio_path=audio_path,
             provider=provider,
@@ -152,7 +209,7 @@ class TranscriptionService:
             language=language
         )
 
-        return transcript_result, language
+        return transcript_result, language or transcript_result.language
 
     async def transcribe_audio(
         self,
@@ -186,16 +243,30 @@ class TranscriptionService:
 
         try:
             # Process audio
-            processed_audio = self.audio_processor.process(audio_path)
+            processed_audio = await self.audio_processor.process_async(audio_path, executor=audio_executor)
             logger.info(f"Audio processed: {processed_audio}")
 
             # Create transcriber based on provider
             if provider.lower() == "whisper":
-                transcriber = WhisperTranscriber(api_key=api_key, model=model, language=language)
+                transcriber = WhisperTranscriber(
+                    api_key=api_key,
+                    model=model,
+                    language=language,
+                    chunk_duration=settings.WHISPER_CHUNK_DURATION,
+                    max_concurrency=settings.WHISPER_MAX_CONCURRENCY,
+                    client=get_openai_client(api_key),
+                    scheduler=provider_scheduler
+                )
             elif provider.lower() == "ivrit":
                 if not endpoint_id:
                     raise ValueError("endpoint_id is required for Ivrit provider")
-                transcriber = IvritTranscriber(api_key=api_key, endpoint_id=endpoint_id, model=model, language=language)
+                transcriber = IvritTranscriber(
+                    api_key=api_key,
+                    endpoint_id=endpoint_id,
+                    model=model,
+                    language=language,
+                    scheduler=provider_scheduler
+                )
             else:
                 raise ValueError(f"Unsupported transcription provider: {provider}. Supported providers: 'whisper', 'ivrit'")
 
@@ -212,9 +283,9 @@ class TranscriptionService:
                 transcript_result = labeler.label_speakers(transcript_result)
                 logger.info(f"Speakers labeled: {participants}")
 
-            # Clean up processed audio if it's different from original
+            # Release processed audio if it's different from original
             if processed_audio != audio_path:
-                self.audio_processor.cleanup(processed_audio)
+                self.audio_processor.release(processed_audio)
 
             return transcript_result
 
@@ -222,7 +293,7 @@ class TranscriptionService:
             logger.error(f"Transcription failed: {e}")
             # Clean up on error
             if 'processed_audio' in locals() and processed_audio != audio_path:
-                self.audio_processor.cleanup(processed_audio)
+                self.audio_processor.release(processed_audio)
             raise
 
     def get_supported_formats(self, provider: str) -> List[str]:
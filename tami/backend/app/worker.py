@@ -0,0 +1,46 @@
+"""Standalone job worker entry point.
+
+Run one or more of these next to (or instead of) the API's in-process worker:
+
+    python -m app.worker
+
+Set JOB_RUN_IN_PROCESS=false on the API when all jobs should run here.
+"""
+
+import asyncio
+import signal
+
+from loguru import logger
+
+from app.core.config import settings
+from app.db import connect_db, disconnect_db
+from app.services.audio_executor import audio_executor
+from app.services.job_worker import JobWorker
+from app.services.openai_clients import configure_openai_clients, openai_clients
+from app.services.provider_scheduler import configure_provider_scheduler
+
+
+async def main() -> None:
+    """Connect to the database and process jobs until SIGINT/SIGTERM."""
+    await connect_db()
+    logger.info("Database connected")
+    configure_openai_clients()
+    configure_provider_scheduler()
+
+    worker = JobWorker()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+
+    try:
+        await worker.run()
+    finally:
+        audio_executor.shutdown(wait=False, cancel_futures=True)
+        await openai_clients.aclose()
+        await disconnect_db()
+        logger.info("Database disconnected")
+
+
+if __name__ == "__main__":
+    logger.info(f"Starting {settings.APP_NAME} job worker")
+    asyncio.run(main())
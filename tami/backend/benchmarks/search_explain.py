@@ -0,0 +1,162 @@
+"""Benchmark global search with EXPLAIN ANALYZE on a seeded database.
+
+Seeds a throwaway user with sessions and transcripts (100k segments by
+default) in the configured database (DATABASE_URL), then runs EXPLAIN
+(ANALYZE, BUFFERS) for the single ranked search query and for the previous
+two-query approach, reporting execution time and whether the GIN indexes
+were used. Everything is deleted afterwards.
+
+Requires tami/shared/prisma/sql/001_search_vectors.sql to have been applied.
+
+Usage (from tami/backend):
+    python -m benchmarks.search_explain
+    python -m benchmarks.search_explain --segments 100000 --sessions 500 --plans
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import uuid
+
+from app.db import db, connect_db, disconnect_db
+from app.services.pipeline import build_segment_rows
+from app.services.search import SESSION_SEARCH_SQL
+from benchmarks.segment_insert import make_segments
+
+# Previous implementation: two queries, merged and re-sorted in Python
+LEGACY_SESSION_SQL = '''
+SELECT DISTINCT ON (s.id) s.id, ts_rank(s."searchVector", to_tsquery('simple', $1)) AS rank
+FROM "Session" s
+WHERE s."userId" = $2 AND s."searchVector" @@ to_tsquery('simple', $1)
+ORDER BY s.id, rank DESC
+LIMIT $3
+'''
+
+LEGACY_SEGMENT_SQL = '''
+SELECT DISTINCT ON (s.id) s.id, ts."text", ts_rank(ts."searchVector", to_tsquery('simple', $1)) AS rank
+FROM "TranscriptSegment" ts
+JOIN "Transcript" t ON ts."transcriptId" = t.id
+JOIN "Session" s ON t."sessionId" = s.id
+WHERE s."userId" = $2 AND ts."searchVector" @@ to_tsquery('simple', $1)
+ORDER BY s.id, rank DESC
+LIMIT $3
+'''
+
+VOCABULARY = (
+    "budget roadmap launch hiring customer pricing contract deadline design review "
+    "release migration database security onboarding marketing revenue forecast "
+    "partner integration feedback retention churn quarter milestone prototype"
+).split()
+
+# (label, query) pairs: common term, rare term, multi-term, phrase
+QUERIES = [
+    ("common", "budget"),
+    ("rare", "zebracorn"),
+    ("two terms", "pricing contract"),
+    ("phrase", '"release migration"'),
+]
+
+
+def random_text(rng: random.Random, words: int = 12) -> str:
+    """Build a sentence from the benchmark vocabulary."""
+    return " ".join(rng.choice(VOCABULARY) for _ in range(words))
+
+
+async def seed(user_id: str, session_count: int, segment_count: int) -> None:
+    """Create sessions with transcripts totalling ``segment_count`` segments."""
+    rng = random.Random(42)
+    per_session = max(1, segment_count // session_count)
+
+    for idx in range(session_count):
+        session = await db.session.create(
+            data={
+                "userId": user_id,
+                "title": f"Meeting {idx}: {random_text(rng, 3)}",
+                "audioFileName": "benchmark.wav",
+                "audioFileUrl": "benchmark.wav",
+                "context": random_text(rng, 8),
+                "status": "completed"
+            }
+        )
+        transcript = await db.transcript.create(data={"sessionId": session.id, "language": "en"})
+
+        segments = make_segments(per_session)
+        for segment in segments:
+            segment.text = random_text(rng)
+        # Sprinkle a rare term so selective queries have a few hits
+        if idx % 50 == 0:
+            segments[0].text += " zebracorn"
+        await db.transcriptsegment.create_many(data=build_segment_rows(transcript.id, segments))
+
+    await db.execute_raw('ANALYZE "Session"')
+    await db.execute_raw('ANALYZE "TranscriptSegment"')
+
+
+def plan_nodes(plan: dict) -> list[str]:
+    """Flatten a JSON plan into node descriptions."""
+    label = plan["Node Type"]
+    if "Index Name" in plan:
+        label += f" on {plan['Index Name']}"
+    nodes = [label]
+    for child in plan.get("Plans", []):
+        nodes.extend(plan_nodes(child))
+    return nodes
+
+
+async def explain(sql: str, *args) -> dict:
+    """Run EXPLAIN ANALYZE and return the top-level JSON plan."""
+    rows = await db.query_raw(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}", *args)
+    plan = rows[0]["QUERY PLAN"]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]
+
+
+async def run(session_count: int, segment_count: int, limit: int, show_plans: bool) -> None:
+    """Seed, explain each query, clean up."""
+    await connect_db()
+    user = await db.user.create(data={"email": f"bench-{uuid.uuid4().hex}@example.invalid"})
+
+    try:
+        print(f"Seeding {session_count} sessions / {segment_count} segments...")
+        await seed(user.id, session_count, segment_count)
+
+        print(f"{'query':>10} {'method':>8} {'ms':>9} {'GIN used':>9}")
+        for label, query in QUERIES:
+            current = await explain(SESSION_SEARCH_SQL, query, user.id, limit)
+
+            # The old code joined raw tokens with "|"
+            legacy_query = " | ".join(query.strip('"').split())
+            legacy = [
+                await explain(LEGACY_SESSION_SQL, legacy_query, user.id, limit),
+                await explain(LEGACY_SEGMENT_SQL, legacy_query, user.id, limit)
+            ]
+
+            for method, plans in (("single", [current]), ("legacy", legacy)):
+                elapsed = sum(p["Execution Time"] for p in plans)
+                nodes = [node for p in plans for node in plan_nodes(p["Plan"])]
+                gin = any("searchVector_idx" in node for node in nodes)
+                print(f"{label:>10} {method:>8} {elapsed:>9.2f} {str(gin):>9}")
+                if show_plans:
+                    for node in nodes:
+                        print(f"{'':>12}{node}")
+
+    finally:
+        # Cascades to sessions, transcripts and segments
+        await db.user.delete(where={"id": user.id})
+        await disconnect_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=500)
+    parser.add_argument("--segments", type=int, default=100_000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--plans", action="store_true", help="Print plan nodes")
+    args = parser.parse_args()
+    asyncio.run(run(args.sessions, args.segments, args.limit, args.plans))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Benchmark transcript segment persistence: per-row creates vs. bulk insert.
+
+Creates a throwaway user and session in the configured database
+(DATABASE_URL), writes a synthetic transcript with each method, and deletes
+everything afterwards.
+
+Usage (from tami/backend):
+    python -m benchmarks.segment_insert
+    python -m benchmarks.segment_insert --segments 5000 --methods bulk
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import timedelta
+
+from app.db import db, connect_db, disconnect_db
+from app.core.config import settings
+from app.services.pipeline import build_segment_rows
+from lib.utils.models import TranscriptSegment
+
+METHODS = ("per_row", "bulk")
+
+
+def make_segments(count: int) -> list[TranscriptSegment]:
+    """Build a synthetic transcript alternating between two speakers."""
+    return [
+        TranscriptSegment(
+            speaker=f"Speaker {idx % 2 + 1}",
+            text=f"Segment {idx}: some representative sentence of meeting speech.",
+            start_time=idx * 3.0,
+            end_time=idx * 3.0 + 2.5
+        )
+        for idx in range(count)
+    ]
+
+
+async def write_per_row(session_id: str, segments: list[TranscriptSegment]) -> None:
+    """Previous behaviour: one create per segment."""
+    transcript = await db.transcript.create(data={"sessionId": session_id, "language": "en"})
+    for row in build_segment_rows(transcript.id, segments):
+        await db.transcriptsegment.create(data=row)
+
+
+async def write_bulk(session_id: str, segments: list[TranscriptSegment]) -> None:
+    """Current behaviour: transcript and segments in one transaction with create_many."""
+    async with db.tx(timeout=timedelta(seconds=settings.DB_TRANSACTION_TIMEOUT)) as tx:
+        transcript = await tx.transcript.create(data={"sessionId": session_id, "language": "en"})
+        await tx.transcriptsegment.create_many(data=build_segment_rows(transcript.id, segments))
+
+
+WRITERS = {"per_row": write_per_row, "bulk": write_bulk}
+
+
+async def run(segment_count: int, methods: list[str]) -> None:
+    """Time each method against a fresh session."""
+    await connect_db()
+    user = await db.user.create(data={"email": f"bench-{uuid.uuid4().hex}@example.invalid"})
+    segments = make_segments(segment_count)
+
+    try:
+        print(f"{'method':>10} {'segments':>9} {'seconds':>9} {'rows/s':>10}")
+        for method in methods:
+            session = await db.session.create(
+                data={
+                    "userId": user.id,
+                    "audioFileName": "benchmark.wav",
+                    "audioFileUrl": "benchmark.wav",
+                    "context": "benchmark",
+                    "status": "completed"
+                }
+            )
+
+            start = time.perf_counter()
+            await WRITERS[method](session.id, segments)
+            elapsed = time.perf_counter() - start
+
+            stored = await db.transcriptsegment.count(where={"transcript": {"sessionId": session.id}})
+            assert stored == segment_count, f"{method} stored {stored} segments"
+            print(f"{method:>10} {segment_count:>9} {elapsed:>9.2f} {segment_count / elapsed:>10.0f}")
+
+    finally:
+        # Cascades to sessions, transcripts and segments
+        await db.user.delete(where={"id": user.id})
+        await disconnect_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--segments", type=int, default=5000)
+    parser.add_argument("--methods", nargs="+", default=list(METHODS), choices=METHODS)
+    args = parser.parse_args()
+    asyncio.run(run(args.segments, args.methods))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""Content-addressed cache for processed audio files."""
+
+import hashlib
+import shutil
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from loguru import logger
+
+
+HASH_BLOCK_SIZE = 1024 * 1024
+KEY_MEMO_SIZE = 256  # Content hashes remembered per cache (LRU)
+
+
+@dataclass
+class CacheEntry:
+    """A processed file held by the cache."""
+    key: str
+    path: Path
+    size: int
+    refs: int = 0
+
+
+class ProcessedAudioCache:
+    """LRU cache of processed WAV files keyed by input content and parameters.
+
+    Entries are reference counted: ``acquire``/``commit`` hand out a reference
+    and ``release`` returns it. Eviction only removes entries nobody holds, so
+    concurrent jobs can share a file safely. If every entry is in use the cache
+    may temporarily exceed ``max_bytes``.
+
+    Each instance owns a private directory, so separate processes never evict
+    each other's files.
+    """
+
+    def __init__(self, max_bytes: int = 2 * 1024 ** 3, base_dir: Optional[Path] = None):
+        """Initialize processed audio cache.
+
+        Args:
+            max_bytes: Size budget for cached files
+            base_dir: Parent directory for the cache directory (default: system temp)
+        """
+        base_dir = base_dir or Path(tempfile.gettempdir()) / "meeting-transcriber"
+        base_dir.mkdir(parents=True, exist_ok=True)
+
+        self.max_bytes = max_bytes
+        self.cache_dir = Path(tempfile.mkdtemp(prefix="audio-cache-", dir=base_dir))
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._paths: Dict[Path, str] = {}
+        self._key_memo: "OrderedDict[Tuple, str]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, input_path: Path, **params: Any) -> str:
+        """Build a cache key from file content and processing parameters.
+
+        The content hash is memoized per (path, size, mtime) for the last
+        KEY_MEMO_SIZE inputs, so repeated lookups for the same upload don't
+        re-read it.
+
+        Args:
+            input_path: Input audio file
+            **params: Processing parameters that affect the output
+
+        Returns:
+            Hex digest key
+        """
+        stat = input_path.stat()
+        param_items = tuple(sorted(params.items()))
+        memo_key = (str(input_path.resolve()), stat.st_size, stat.st_mtime_ns, param_items)
+
+        with self._lock:
+            key = self._key_memo.get(memo_key)
+            if key:
+                self._key_memo.move_to_end(memo_key)
+        if key:
+            return key
+
+        digest = hashlib.sha256()
+        with open(input_path, 'rb') as f:
+            for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+                digest.update(block)
+        for name, value in param_items:
+            digest.update(f"|{name}={value}".encode())
+        key = digest.hexdigest()
+
+        with self._lock:
+            self._key_memo[memo_key] = key
+            while len(self._key_memo) > KEY_MEMO_SIZE:
+                self._key_memo.popitem(last=False)
+        return key
+
+    def acquire(self, key: str) -> Optional[Path]:
+        """Take a reference to a cached file.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Path to the cached file, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not entry.path.exists():
+                if entry is not None:
+                    self._drop(entry)
+                self.misses += 1
+                return None
+
+            entry.refs += 1
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.path
+
+    def reserve_path(self, key: str) -> Path:
+        """Get a unique path to render a new entry into.
+
+        Args:
+            key: Cache key the file will be committed under
+
+        Returns:
+            Temporary path inside the cache directory
+        """
+        return self.cache_dir / f"{key}.{uuid.uuid4().hex}.partial.wav"
+
+    def commit(self, key: str, rendered_path: Path) -> Path:
+        """Add a rendered file to the cache and take a reference to it.
+
+        If another job committed the same key first, the new file is discarded
+        and the existing entry is shared instead.
+
+        Args:
+            key: Cache key
+            rendered_path: File produced at a ``reserve_path`` location
+
+        Returns:
+            Path to the cached file
+        """
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None and existing.path.exists():
+                existing.refs += 1
+                self._entries.move_to_end(key)
+                rendered_path.unlink(missing_ok=True)
+                return existing.path
+            if existing is not None:
+                # File vanished; forget the stale entry before replacing it
+                self._drop(existing)
+
+            final_path = self.cache_dir / f"{key}.wav"
+            rendered_path.replace(final_path)
+
+            entry = CacheEntry(key=key, path=final_path, size=final_path.stat().st_size, refs=1)
+            self._entries[key] = entry
+            self._paths[final_path] = key
+            self._total_bytes += entry.size
+            self._evict()
+            return final_path
+
+    def release(self, path: Path) -> bool:
+        """Return a reference taken by ``acquire`` or ``commit``.
+
+        Args:
+            path: Path returned by the cache
+
+        Returns:
+            True if the path belongs to the cache, False otherwise
+        """
+        with self._lock:
+            key = self._paths.get(path)
+            if key is None:
+                return False
+
+            entry = self._entries[key]
+            entry.refs = max(0, entry.refs - 1)
+            self._evict()
+            return True
+
+    def discard(self, path: Path) -> None:
+        """Remove a reserved path after a failed render.
+
+        Args:
+            path: Path returned by ``reserve_path``
+        """
+        path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Delete every cached file and the cache directory."""
+        with self._lock:
+            self._entries.clear()
+            self._paths.clear()
+            self._key_memo.clear()
+            self._total_bytes = 0
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache statistics.
+
+        Returns:
+            Dict with entry count, size and hit/miss counters
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "in_use": sum(1 for entry in self._entries.values() if entry.refs),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _evict(self) -> None:
+        """Evict least recently used unreferenced entries until under budget.
+
+        Caller must hold the lock.
+        """
+        if self._total_bytes <= self.max_bytes:
+            return
+
+        for entry in list(self._entries.values()):
+            if self._total_bytes <= self.max_bytes:
+                break
+            if entry.refs == 0:
+                logger.debug(f"Evicting cached audio {entry.path} ({entry.size} bytes)")
+                self._drop(entry)
+                entry.path.unlink(missing_ok=True)
+
+    def _drop(self, entry: CacheEntry) -> None:
+        """Forget an entry. Caller must hold the lock."""
+        self._entries.pop(entry.key, None)
+        self._paths.pop(entry.path, None)
+        self._total_bytes -= entry.size
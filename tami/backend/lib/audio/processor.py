@@ -1,11 +1,15 @@
 """Audio file processing and format conversion."""
 
+import asyncio
 import tempfile
+from concurrent.futures import Executor
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional, Tuple
 
 from loguru import logger
 
+from lib.audio.cache import ProcessedAudioCache
+from lib.audio.streaming import StreamingAudioProcessor
 from lib.audio.validator import AudioValidator
 from lib.utils.exceptions import AudioFileError
 
@@ -22,22 +26,34 @@ except (ImportError, ModuleNotFoundError):
 class AudioProcessor:
     """Process audio files for transcription."""
 
-    def __init__(self, normalize: bool = True, sample_rate: int = 16000):
+    def __init__(
+        self,
+        normalize: bool = True,
+        sample_rate: int = 16000,
+        streaming: bool = True,
+        cache: Optional[ProcessedAudioCache] = None
+    ):
         """Initialize audio processor.
 
         Args:
             normalize: Whether to normalize audio levels
             sample_rate: Target sample rate in Hz
+            streaming: Use the constant-memory ffmpeg pipe instead of loading
+                the whole file with pydub
+            cache: Optional shared cache of processed files. When set, files
+                returned by ``process`` must be handed back with ``release``.
         """
         self.normalize = normalize
         self.sample_rate = sample_rate
+        self.streaming = streaming
+        self.cache = cache
 
     def process(self, input_path: Path) -> Path:
         """Process audio file for optimal transcription.
 
         Steps:
         1. Validate format
-        2. Load audio
+        2. Look up the processed file in the cache (if configured)
         3. Normalize volume (if enabled)
         4. Convert to mono
         5. Resample to target sample rate
@@ -47,7 +63,7 @@ class AudioProcessor:
             input_path: Path to input audio file
 
         Returns:
-            Path to processed WAV file in temp directory (or original if pydub unavailable)
+            Path to processed WAV file (or original if no decoder is available)
 
         Raises:
             AudioFileError: If processing fails
@@ -56,58 +72,199 @@ class AudioProcessor:
             # Validate input file
             AudioValidator.validate(input_path)
 
-            # If pydub is not available, just validate and return original file
-            if not PYDUB_AVAILABLE:
-                logger.info(f"Skipping audio processing (pydub unavailable), using original file: {input_path}")
-                return input_path
+            key, cached_path = self._lookup(input_path)
+            if cached_path:
+                return cached_path
 
-            AudioValidator.check_ffmpeg()
+            output_path = self._target_path(input_path, key)
+            try:
+                rendered_path = self.render(input_path, output_path)
+            except Exception:
+                self._discard(key, output_path)
+                raise
 
-            logger.info(f"Processing audio file: {input_path}")
+            return self._store(key, input_path, rendered_path)
 
-            # Load audio
-            audio = AudioSegment.from_file(str(input_path))
-            logger.debug(f"Loaded audio: {len(audio)}ms, {audio.frame_rate}Hz, {audio.channels} channels")
+        except Exception as e:
+            if isinstance(e, AudioFileError):
+                raise
+            raise AudioFileError(f"Audio processing failed: {e}")
+
+    async def process_async(self, input_path: Path, executor: Optional[Executor] = None) -> Path:
+        """Process audio file without blocking the event loop.
 
-            # Normalize volume to -20 dBFS
-            if self.normalize:
-                audio = self._normalize_loudness(audio)
-                logger.debug("Normalized audio levels")
+        Validation and cache hashing run in a thread; decoding runs in
+        ``executor`` (a process pool keeps it off the interpreter running the
+        event loop). Cache bookkeeping stays in the calling process.
 
-            # Convert to mono if stereo
-            if audio.channels > 1:
-                audio = audio.set_channels(1)
-                logger.debug("Converted to mono")
+        Args:
+            input_path: Path to input audio file
+            executor: Executor for decoding (default: the loop's thread pool)
 
-            # Resample to target sample rate
-            if audio.frame_rate != self.sample_rate:
-                audio = audio.set_frame_rate(self.sample_rate)
-                logger.debug(f"Resampled to {self.sample_rate}Hz")
+        Returns:
+            Path to processed WAV file (or original if no decoder is available)
 
-            # Create temp output file
-            temp_dir = Path(tempfile.gettempdir()) / "meeting-transcriber"
-            temp_dir.mkdir(exist_ok=True)
+        Raises:
+            AudioFileError: If processing fails
+        """
+        try:
+            await asyncio.to_thread(AudioValidator.validate, input_path)
 
-            output_path = temp_dir / f"{input_path.stem}_processed.wav"
+            key, cached_path = await asyncio.to_thread(self._lookup, input_path)
+            if cached_path:
+                return cached_path
 
-            # Export as WAV
-            audio.export(
-                str(output_path),
-                format='wav',
-                parameters=[
-                    '-ac', '1',  # Mono
-                    '-ar', str(self.sample_rate)  # Sample rate
-                ]
-            )
+            output_path = self._target_path(input_path, key)
+            try:
+                rendered_path = await asyncio.get_running_loop().run_in_executor(
+                    executor,
+                    render_file,
+                    input_path,
+                    output_path,
+                    self.normalize,
+                    self.sample_rate,
+                    self.streaming
+                )
+            except Exception:
+                self._discard(key, output_path)
+                raise
 
-            logger.info(f"Processed audio saved to: {output_path}")
-            return output_path
+            return self._store(key, input_path, rendered_path)
 
         except Exception as e:
             if isinstance(e, AudioFileError):
                 raise
             raise AudioFileError(f"Audio processing failed: {e}")
 
+    def _lookup(self, input_path: Path) -> Tuple[Optional[str], Optional[Path]]:
+        """Look up a processed copy of the input in the cache.
+
+        Args:
+            input_path: Validated input audio file
+
+        Returns:
+            Tuple of (cache key, cached path); both None without a cache
+        """
+        if self.cache is None:
+            return None, None
+
+        key = self.cache.make_key(input_path, normalize=self.normalize, sample_rate=self.sample_rate)
+        cached_path = self.cache.acquire(key)
+        if cached_path:
+            logger.info(f"Using cached processed audio for {input_path}: {cached_path}")
+        return key, cached_path
+
+    def _target_path(self, input_path: Path, key: Optional[str]) -> Path:
+        """Get the path to render a processed copy into."""
+        if key is None:
+            return self._output_path(input_path)
+        return self.cache.reserve_path(key)
+
+    def _discard(self, key: Optional[str], output_path: Path) -> None:
+        """Remove a partial render after a failure."""
+        if key is not None:
+            self.cache.discard(output_path)
+
+    def _store(self, key: Optional[str], input_path: Path, rendered_path: Path) -> Path:
+        """Commit a rendered file to the cache (if any) and return its final path."""
+        if key is None or rendered_path == input_path:
+            return rendered_path
+        return self.cache.commit(key, rendered_path)
+
+    def render(self, input_path: Path, output_path: Path) -> Path:
+        """Decode, normalize and resample a validated file into ``output_path``.
+
+        Args:
+            input_path: Validated input audio file
+            output_path: Where to write the processed WAV
+
+        Returns:
+            ``output_path``, or ``input_path`` if no decoder is available
+        """
+        if self.streaming:
+            return self._process_streaming(input_path, output_path)
+
+        # If pydub is not available, just validate and return original file
+        if not PYDUB_AVAILABLE:
+            logger.info(f"Skipping audio processing (pydub unavailable), using original file: {input_path}")
+            return input_path
+
+        AudioValidator.check_ffmpeg()
+
+        logger.info(f"Processing audio file: {input_path}")
+
+        # Load audio
+        audio = AudioSegment.from_file(str(input_path))
+        logger.debug(f"Loaded audio: {len(audio)}ms, {audio.frame_rate}Hz, {audio.channels} channels")
+
+        # Normalize volume to -20 dBFS
+        if self.normalize:
+            audio = self._normalize_loudness(audio)
+            logger.debug("Normalized audio levels")
+
+        # Convert to mono if stereo
+        if audio.channels > 1:
+            audio = audio.set_channels(1)
+            logger.debug("Converted to mono")
+
+        # Resample to target sample rate
+        if audio.frame_rate != self.sample_rate:
+            audio = audio.set_frame_rate(self.sample_rate)
+            logger.debug(f"Resampled to {self.sample_rate}Hz")
+
+        # Export as WAV
+        audio.export(
+            str(output_path),
+            format='wav',
+            parameters=[
+                '-ac', '1',  # Mono
+                '-ar', str(self.sample_rate)  # Sample rate
+            ]
+        )
+
+        logger.info(f"Processed audio saved to: {output_path}")
+        return output_path
+
+    def _process_streaming(self, input_path: Path, output_path: Path) -> Path:
+        """Process audio through the streaming ffmpeg pipe.
+
+        Args:
+            input_path: Validated input audio file
+            output_path: Where to write the processed WAV
+
+        Returns:
+            Path to processed WAV file (or original if ffmpeg unavailable)
+        """
+        try:
+            AudioValidator.check_ffmpeg()
+        except AudioFileError:
+            logger.warning(f"Skipping audio processing (ffmpeg unavailable), using original file: {input_path}")
+            return input_path
+
+        logger.info(f"Processing audio file (streaming): {input_path}")
+
+        StreamingAudioProcessor(
+            normalize=self.normalize,
+            sample_rate=self.sample_rate
+        ).process(input_path, output_path)
+
+        logger.info(f"Processed audio saved to: {output_path}")
+        return output_path
+
+    @staticmethod
+    def _output_path(input_path: Path) -> Path:
+        """Get the temp path for a processed copy of the input file.
+
+        Args:
+            input_path: Path to input audio file
+
+        Returns:
+            Path in the shared temp directory
+        """
+        temp_dir = Path(tempfile.gettempdir()) / "meeting-transcriber"
+        temp_dir.mkdir(exist_ok=True)
+        return temp_dir / f"{input_path.stem}_processed.wav"
+
     def _normalize_loudness(self, audio: AudioSegment) -> AudioSegment:
         """Normalize audio to target loudness.
 
@@ -134,3 +291,41 @@ class AudioProcessor:
                 logger.debug(f"Cleaned up temp file: {processed_path}")
         except Exception as e:
             logger.warning(f"Could not clean up temp file: {e}")
+
+    def release(self, processed_path: Path) -> None:
+        """Hand back a file returned by ``process``.
+
+        Cached files are unpinned so the cache can evict them later; anything
+        else is deleted. Never pass the original input file here.
+
+        Args:
+            processed_path: Path returned by ``process``
+        """
+        if self.cache is not None and self.cache.release(processed_path):
+            return
+        self.cleanup(processed_path)
+
+
+def render_file(
+    input_path: Path,
+    output_path: Path,
+    normalize: bool = True,
+    sample_rate: int = 16000,
+    streaming: bool = True
+) -> Path:
+    """Render a processed copy of a validated file.
+
+    Module-level so it can be submitted to a process pool.
+
+    Args:
+        input_path: Validated input audio file
+        output_path: Where to write the processed WAV
+        normalize: Whether to normalize audio levels
+        sample_rate: Target sample rate in Hz
+        streaming: Use the streaming ffmpeg pipe
+
+    Returns:
+        ``output_path``, or ``input_path`` if no decoder is available
+    """
+    processor = AudioProcessor(normalize=normalize, sample_rate=sample_rate, streaming=streaming)
+    return processor.render(input_path, output_path)
@@ -0,0 +1,207 @@
+"""Streaming audio preprocessing through an ffmpeg pipe."""
+
+import math
+import subprocess
+import sys
+import tempfile
+import wave
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+from loguru import logger
+
+from lib.utils.exceptions import AudioFileError
+
+# numpy makes block math much faster, but is not required
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except (ImportError, ModuleNotFoundError):
+    NUMPY_AVAILABLE = False
+    np = None  # type: ignore
+
+
+SAMPLE_WIDTH = 2  # 16-bit PCM
+MAX_AMPLITUDE = float(2 ** 15)
+DEFAULT_BLOCK_SIZE = 64 * 1024  # Bytes per pipe read (32k samples)
+TARGET_DBFS = -20.0
+
+
+def sum_of_squares(block: bytes) -> float:
+    """Sum the squared samples of a little-endian 16-bit PCM block.
+
+    Args:
+        block: Raw s16le PCM bytes
+
+    Returns:
+        Sum of squared sample values
+    """
+    if NUMPY_AVAILABLE:
+        samples = np.frombuffer(block, dtype='<i2').astype(np.float64)
+        return float(np.dot(samples, samples))
+
+    samples = array('h')
+    samples.frombytes(block[:len(block) - len(block) % SAMPLE_WIDTH])
+    if sys.byteorder == 'big':
+        samples.byteswap()
+    return float(sum(s * s for s in samples))
+
+
+@dataclass
+class LoudnessStats:
+    """Running loudness measurement over a PCM stream."""
+    sample_count: int = 0
+    sum_squares: float = 0.0
+
+    def add_block(self, block: bytes) -> None:
+        """Accumulate one PCM block."""
+        self.sample_count += len(block) // SAMPLE_WIDTH
+        self.sum_squares += sum_of_squares(block)
+
+    @property
+    def dbfs(self) -> float:
+        """RMS loudness in dBFS (same scale as pydub's ``AudioSegment.dBFS``)."""
+        if not self.sample_count or not self.sum_squares:
+            return -math.inf
+        rms = math.sqrt(self.sum_squares / self.sample_count)
+        return 20 * math.log10(rms / MAX_AMPLITUDE)
+
+
+class StreamingAudioProcessor:
+    """Decode, downmix and resample audio in fixed-size blocks.
+
+    ffmpeg does the decoding, mono downmix and resampling and writes raw PCM
+    to a pipe. We read that pipe block by block, so memory use stays constant
+    regardless of recording length. Normalization takes two passes over the
+    input: one to measure loudness, one to render with the gain applied.
+    """
+
+    def __init__(
+        self,
+        normalize: bool = True,
+        sample_rate: int = 16000,
+        block_size: int = DEFAULT_BLOCK_SIZE
+    ):
+        """Initialize streaming processor.
+
+        Args:
+            normalize: Whether to normalize audio levels
+            sample_rate: Target sample rate in Hz
+            block_size: Bytes read from the ffmpeg pipe per iteration
+        """
+        self.normalize = normalize
+        self.sample_rate = sample_rate
+        self.block_size = block_size - block_size % SAMPLE_WIDTH
+
+    def process(self, input_path: Path, output_path: Path) -> Path:
+        """Convert input audio to a normalized mono WAV at the target rate.
+
+        Args:
+            input_path: Path to input audio file
+            output_path: Path of the WAV file to write
+
+        Returns:
+            Path to the written WAV file
+
+        Raises:
+            AudioFileError: If ffmpeg fails or the input has no audio
+        """
+        gain_db = 0.0
+        if self.normalize:
+            stats = self.measure_loudness(input_path)
+            if stats.sample_count == 0:
+                raise AudioFileError(f"No audio samples decoded from {input_path}")
+            if math.isfinite(stats.dbfs):
+                gain_db = TARGET_DBFS - stats.dbfs
+            logger.debug(f"Measured loudness {stats.dbfs:.2f} dBFS, applying {gain_db:+.2f} dB gain")
+
+        frames = self.render(input_path, output_path, gain_db)
+        logger.debug(f"Rendered {frames / self.sample_rate:.1f}s of audio to {output_path}")
+        return output_path
+
+    def measure_loudness(self, input_path: Path) -> LoudnessStats:
+        """Measure RMS loudness of the downmixed, resampled stream.
+
+        Args:
+            input_path: Path to input audio file
+
+        Returns:
+            Loudness statistics
+        """
+        stats = LoudnessStats()
+        for block in self.decode(input_path):
+            stats.add_block(block)
+        return stats
+
+    def render(self, input_path: Path, output_path: Path, gain_db: float = 0.0) -> int:
+        """Stream decoded PCM into a WAV file.
+
+        Args:
+            input_path: Path to input audio file
+            output_path: Path of the WAV file to write
+            gain_db: Gain applied by ffmpeg while decoding
+
+        Returns:
+            Number of frames written
+        """
+        frames = 0
+        with wave.open(str(output_path), 'wb') as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(SAMPLE_WIDTH)
+            wav_file.setframerate(self.sample_rate)
+            for block in self.decode(input_path, gain_db):
+                wav_file.writeframesraw(block)
+                frames += len(block) // SAMPLE_WIDTH
+        return frames
+
+    def decode(self, input_path: Path, gain_db: float = 0.0) -> Iterator[bytes]:
+        """Yield mono s16le PCM blocks at the target sample rate.
+
+        Args:
+            input_path: Path to input audio file
+            gain_db: Optional gain to apply while decoding
+
+        Yields:
+            Raw PCM blocks of at most ``block_size`` bytes
+
+        Raises:
+            AudioFileError: If ffmpeg exits with an error
+        """
+        command = [
+            'ffmpeg', '-nostdin', '-hide_banner', '-loglevel', 'error',
+            '-i', str(input_path),
+            '-vn',
+        ]
+        if gain_db:
+            command += ['-af', f'volume={gain_db:.4f}dB']
+        command += [
+            '-ac', '1',
+            '-ar', str(self.sample_rate),
+            '-f', 's16le',
+            '-acodec', 'pcm_s16le',
+            'pipe:1',
+        ]
+
+        # stderr goes to a temp file so a chatty ffmpeg can never block the pipe
+        with tempfile.TemporaryFile() as stderr:
+            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=stderr)
+            completed = False
+            try:
+                while True:
+                    block = process.stdout.read(self.block_size)
+                    if not block:
+                        break
+                    yield block
+                completed = True
+            finally:
+                if not completed and process.poll() is None:
+                    process.kill()
+                process.stdout.close()
+                returncode = process.wait()
+
+            if completed and returncode != 0:
+                stderr.seek(0)
+                message = stderr.read().decode(errors='replace').strip()
+                raise AudioFileError(f"ffmpeg failed to decode {input_path}: {message}")
@@ -13,6 +13,9 @@ class AudioValidator:
     SUPPORTED_FORMATS = ['.m4a', '.wav', '.mp3', '.flac', '.ogg', '.webm', '.mpga', '.mpeg']
     MAX_DURATION = 7200  # 2 hours in seconds
 
+    # Set once ffmpeg has been found so later checks skip the subprocess
+    _ffmpeg_available = False
+
     @staticmethod
     def validate(file_path: Path) -> None:
         """Validate audio file.
@@ -51,12 +54,16 @@ class AudioValidator:
         Raises:
             AudioFileError: If ffmpeg is not installed
         """
+        if AudioValidator._ffmpeg_available:
+            return True
+
         try:
             subprocess.run(
                 ['ffmpeg', '-version'],
                 capture_output=True,
                 check=True
             )
+            AudioValidator._ffmpeg_available = True
             return True
         except (subprocess.CalledProcessError, FileNotFoundError):
             raise AudioFileError(
@@ -0,0 +1,148 @@
+"""Bounded conversation memory for chat.
+
+Recent turns of a conversation are sent verbatim until a few turns beyond
+``recent_turns`` accumulate, then the older ones are folded into a running
+summary. The summary plus unsummarized turns must fit a token budget, so
+each request stays roughly the same size however long the conversation
+gets.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from lib.chat.retrieval import estimate_tokens
+from lib.utils.provider_scheduler import estimate_request_tokens, provider_scheduler
+
+Message = Dict[str, str]
+
+MESSAGE_OVERHEAD_TOKENS = 4  # Role and framing per chat message
+
+SUMMARY_PROMPT = """You maintain a running summary of a conversation between a user and an assistant about a meeting.
+
+Current summary:
+{summary}
+
+New messages:
+{messages}
+
+Rewrite the summary so it also covers the new messages. Keep the questions asked, the facts and answers given, names, numbers and decisions, and anything the user may refer back to. Write in the language of the conversation. Reply with the summary only."""
+
+
+def message_tokens(message: Message) -> int:
+    """Estimate the tokens a chat message costs in a request."""
+    return estimate_tokens(message["content"]) + MESSAGE_OVERHEAD_TOKENS
+
+
+class ConversationMemory:
+    """Recent turns verbatim plus a rolling summary of older ones."""
+
+    def __init__(
+        self,
+        recent_turns: int = 6,
+        token_budget: int = 2000,
+        compact_batch_turns: int = 4,
+        summary_max_tokens: int = 300,
+        summary: str = ""
+    ):
+        """Initialize memory.
+
+        Args:
+            recent_turns: Newest user/assistant turns kept out of compaction
+            token_budget: Maximum estimated tokens for summary plus history per request
+            compact_batch_turns: Extra turns allowed to accumulate before folding,
+                so the summary is rewritten every few turns rather than every turn
+            summary_max_tokens: Maximum tokens of the generated summary
+            summary: Summary of earlier turns (e.g. loaded from storage)
+        """
+        self.recent_turns = recent_turns
+        self.token_budget = token_budget
+        self.compact_batch_turns = compact_batch_turns
+        self.summary_max_tokens = summary_max_tokens
+        self.summary = summary
+
+    def window(self, messages: List[Message]) -> List[Message]:
+        """Select the messages to send with a request.
+
+        Keeps every unsummarized message, dropping the oldest ones only when
+        the summary and history would exceed ``token_budget``. The last
+        message (the current question) is always kept.
+
+        Args:
+            messages: Unsummarized user/assistant messages, oldest first
+
+        Returns:
+            Summary note (if any) followed by the selected messages
+        """
+        note = self.summary_message()
+        used = message_tokens(note) if note else 0
+
+        selected: List[Message] = []
+        for message in reversed(messages):
+            cost = message_tokens(message)
+            if selected and used + cost > self.token_budget:
+                break
+            selected.append(message)
+            used += cost
+        selected.reverse()
+
+        dropped = len(messages) - len(selected)
+        if dropped:
+            logger.debug(f"Conversation memory dropped {dropped} unsummarized messages to fit the token budget")
+
+        return ([note] if note else []) + selected
+
+    def summary_message(self) -> Optional[Message]:
+        """System message carrying the summary of earlier turns."""
+        if not self.summary:
+            return None
+        return {"role": "system", "content": f"Summary of the earlier conversation:\n{self.summary}"}
+
+    def split_for_compaction(self, messages: List[Message]) -> Tuple[List[Message], List[Message]]:
+        """Split messages into turns to fold into the summary and turns to keep.
+
+        Nothing is folded until ``compact_batch_turns`` turns beyond
+        ``recent_turns`` have accumulated.
+
+        Args:
+            messages: Unsummarized user/assistant messages, oldest first
+
+        Returns:
+            (messages to fold, messages to keep verbatim)
+        """
+        keep = self.recent_turns * 2
+        if len(messages) <= keep + self.compact_batch_turns * 2:
+            return [], messages
+        return messages[:-keep], messages[-keep:]
+
+    async def fold(self, client, model: str, messages: List[Message]) -> str:
+        """Fold messages into the running summary.
+
+        Args:
+            client: AsyncOpenAI client
+            model: Model used for summarization
+            messages: Messages to fold, oldest first
+
+        Returns:
+            Updated summary
+        """
+        transcript = "\n".join(f"{m['role']}: {m['content']}" for m in messages)
+        request_messages = [{
+            "role": "user",
+            "content": SUMMARY_PROMPT.format(summary=self.summary or "(none)", messages=transcript)
+        }]
+        response = await provider_scheduler.call(
+            "openai",
+            lambda: client.chat.completions.create(
+                model=model,
+                messages=request_messages,
+                temperature=0.2,
+                max_tokens=self.summary_max_tokens
+            ),
+            tokens=estimate_request_tokens(request_messages, self.summary_max_tokens),
+            key=client.api_key
+        )
+        self.summary = (response.choices[0].message.content or "").strip()
+
+        logger.debug(f"Folded {len(messages)} chat messages into the conversation summary")
+        return self.summary
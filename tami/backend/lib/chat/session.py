@@ -75,6 +75,12 @@ class ChatSession:
                     # Add to history
                     self.history_manager.add_assistant_message(response)
 
+                    # Keep the context sent to the model bounded
+                    try:
+                        await self.chatbot.compact_memory()
+                    except Exception as e:
+                        logger.warning(f"Chat memory compaction failed: {e}")
+
                     # Display response
                     self.console.print(f"\n[bold green][Assistant][/bold green]\n")
                     self.console.print(Markdown(response))
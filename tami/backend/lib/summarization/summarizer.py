@@ -1,29 +1,115 @@
-"""GPT-4o mini summarizer for meeting transcripts."""
+"""GPT-4o mini summarizer for meeting transcripts.
 
+Transcripts that fit one window are summarized in a single request. Longer
+ones are summarized map-reduce style: the transcript is split into
+token-bounded windows along speaker-turn boundaries, the windows are
+summarized concurrently, and the partial overviews and key points are
+merged in rounds of ``reduce_fanout``, so latency grows with the log of
+the meeting length. Action items from all windows are merged and
+deduplicated locally rather than by the model, so none are dropped.
+"""
+
+import asyncio
 import json
-from typing import List
+import re
+from typing import Any, Dict, List, Optional
 
 from loguru import logger
-from openai import AsyncOpenAI
 
-from lib.summarization.prompts import SUMMARY_SYSTEM_PROMPT, create_summary_prompt
+from lib.chat.retrieval import estimate_tokens
+from lib.summarization.prompts import (
+    SUMMARY_PROMPT_VERSION,
+    SUMMARY_SYSTEM_PROMPT,
+    REDUCE_SYSTEM_PROMPT,
+    create_summary_prompt,
+    create_window_summary_prompt,
+    create_reduce_prompt
+)
 from lib.utils.exceptions import APIError, APIAuthenticationError
-from lib.utils.models import Summary, ActionItem, TranscriptResult
+from lib.utils.llm_cache import LLMCache, cached_completion
+from lib.utils.models import Summary, ActionItem, TranscriptResult, TranscriptSegment
+from lib.utils.openai_clients import get_openai_client
+
+
+def _dedupe_key(text: str) -> str:
+    """Normalize text for duplicate detection (case, punctuation, whitespace)."""
+    return " ".join(re.sub(r"[^\w\s]", " ", text.casefold()).split())
+
+
+def dedupe_key_points(points: List[str]) -> List[str]:
+    """Remove duplicate key points, keeping the first occurrence.
+
+    Args:
+        points: Key points in meeting order
+
+    Returns:
+        Unique key points
+    """
+    seen = set()
+    unique = []
+    for point in points:
+        key = _dedupe_key(point)
+        if key and key not in seen:
+            seen.add(key)
+            unique.append(point)
+    return unique
+
+
+def dedupe_action_items(items: List[ActionItem]) -> List[ActionItem]:
+    """Merge action items with the same description.
+
+    A duplicate fills in the assignee or deadline when the first
+    occurrence lacks them.
+
+    Args:
+        items: Action items in meeting order
+
+    Returns:
+        Unique action items
+    """
+    merged: Dict[str, ActionItem] = {}
+    for item in items:
+        key = _dedupe_key(item.description)
+        if not key:
+            continue
+        existing = merged.get(key)
+        if existing is None:
+            merged[key] = ActionItem(description=item.description, assignee=item.assignee, deadline=item.deadline)
+        else:
+            existing.assignee = existing.assignee or item.assignee
+            existing.deadline = existing.deadline or item.deadline
+    return list(merged.values())
 
 
 class Summarizer:
     """Generate meeting summaries using GPT-4o mini."""
 
-    def __init__(self, api_key: str, model: str = "gpt-4o-mini"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o-mini",
+        window_tokens: int = 6000,
+        max_concurrency: int = 4,
+        reduce_fanout: int = 6,
+        cache: Optional[LLMCache] = None
+    ):
         """Initialize summarizer.
 
         Args:
             api_key: OpenAI API key
             model: Model name (default: gpt-4o-mini)
+            window_tokens: Maximum estimated transcript tokens per request
+            max_concurrency: Window requests in flight
+            reduce_fanout: Partial summaries merged per reduce request
+            cache: LLM response cache (None: always call the API)
         """
         self.api_key = api_key
         self.model = model
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.window_tokens = window_tokens
+        self.max_concurrency = max_concurrency
+        self.reduce_fanout = max(2, reduce_fanout)
+        self.cache = cache
+        self.client = get_openai_client(api_key)
 
     async def generate_summary(
         self,
@@ -44,44 +130,26 @@ class Summarizer:
         Raises:
             APIError: If summary generation fails
         """
-        logger.info("Generating meeting summary with GPT-4o mini")
-
-        # Convert transcript to text
-        transcript_text = self._format_transcript(transcript)
+        windows = self._split_windows(transcript)
+        logger.info(f"Generating meeting summary with GPT-4o mini ({len(windows)} window(s))")
 
         try:
-            # Create prompt
-            user_prompt = create_summary_prompt(transcript_text, context, participants)
-
-            # Call GPT-4o mini
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.7
-            )
-
-            # Parse response
-            content = response.choices[0].message.content
-            summary_data = json.loads(content)
-
-            # Convert to Summary object
-            action_items = [
-                ActionItem(
-                    description=item.get('description', ''),
-                    assignee=item.get('assignee'),
-                    deadline=item.get('deadline')
+            if len(windows) <= 1:
+                summary_data = await self._complete_json(
+                    "summary",
+                    SUMMARY_SYSTEM_PROMPT,
+                    create_summary_prompt("\n".join(windows), context, participants)
                 )
-                for item in summary_data.get('action_items', [])
-            ]
+                overview = summary_data.get('overview', '')
+                key_points = summary_data.get('key_points', [])
+                action_items = self._parse_action_items(summary_data)
+            else:
+                overview, key_points, action_items = await self._map_reduce(windows, context, participants)
 
             summary = Summary(
-                overview=summary_data.get('overview', ''),
-                key_points=summary_data.get('key_points', []),
-                action_items=action_items,
+                overview=overview,
+                key_points=dedupe_key_points(key_points),
+                action_items=dedupe_action_items(action_items),
                 participants=participants
             )
 
@@ -106,24 +174,131 @@ class Summarizer:
                 raise APIAuthenticationError(f"OpenAI API authentication failed: {e}")
             raise APIError(f"Summary generation error: {e}")
 
-    def _format_transcript(self, transcript: TranscriptResult) -> str:
-        """Format transcript for summary generation.
+    async def _map_reduce(
+        self,
+        windows: List[str],
+        context: str,
+        participants: List[str]
+    ) -> tuple[str, List[str], List[ActionItem]]:
+        """Summarize windows concurrently, then merge the partial summaries.
+
+        Returns:
+            (overview, key points, action items)
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def limited(template: str, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._complete_json(template, system_prompt, user_prompt)
+
+        # Map: one partial summary per window
+        partials = await asyncio.gather(*(
+            limited(
+                "summary",
+                SUMMARY_SYSTEM_PROMPT,
+                create_window_summary_prompt(text, context, participants, idx, len(windows))
+            )
+            for idx, text in enumerate(windows, start=1)
+        ))
+        action_items = [item for partial in partials for item in self._parse_action_items(partial)]
+
+        # Reduce: merge groups of partials until one remains
+        rounds = 0
+        while len(partials) > 1:
+            groups = [partials[i:i + self.reduce_fanout] for i in range(0, len(partials), self.reduce_fanout)]
+            partials = await asyncio.gather(*(
+                limited("summary-reduce", REDUCE_SYSTEM_PROMPT, create_reduce_prompt(group, context)) if len(group) > 1
+                else asyncio.sleep(0, result=group[0])
+                for group in groups
+            ))
+            rounds += 1
+
+        logger.debug(f"Merged {len(windows)} window summaries in {rounds} reduce round(s)")
+        return partials[0].get('overview', ''), partials[0].get('key_points', []), action_items
+
+    async def _complete_json(self, template: str, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
+        """Run a JSON-mode completion (through the cache) and parse the response.
+
+        Raises:
+            json.JSONDecodeError: If the response is not valid JSON (not cached)
+        """
+        content = await cached_completion(
+            self.client,
+            self.cache,
+            template,
+            SUMMARY_PROMPT_VERSION,
+            validate=json.loads,
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            response_format={"type": "json_object"},
+            temperature=0.7
+        )
+        return json.loads(content)
+
+    @staticmethod
+    def _parse_action_items(summary_data: Dict[str, Any]) -> List[ActionItem]:
+        """Convert action items from a JSON summary."""
+        return [
+            ActionItem(
+                description=item.get('description', ''),
+                assignee=item.get('assignee'),
+                deadline=item.get('deadline')
+            )
+            for item in summary_data.get('action_items', [])
+        ]
+
+    def _split_windows(self, transcript: TranscriptResult) -> List[str]:
+        """Split the formatted transcript into windows of whole speaker turns.
+
+        A turn is a run of consecutive segments by the same speaker. Turns
+        longer than a window are split between segments.
 
         Args:
             transcript: Transcript result
 
         Returns:
-            Formatted transcript text
+            Formatted transcript windows, in order
         """
-        lines = []
+        turns: List[List[TranscriptSegment]] = []
         for segment in transcript.segments:
-            if segment.start_time > 0:
-                timestamp = f"[{self._format_time(segment.start_time)}]"
-                lines.append(f"{timestamp} {segment.speaker}: {segment.text}")
+            if turns and turns[-1][-1].speaker == segment.speaker:
+                turns[-1].append(segment)
             else:
-                lines.append(f"{segment.speaker}: {segment.text}")
+                turns.append([segment])
+
+        windows: List[str] = []
+        current: List[str] = []
+        used = 0
+
+        def flush() -> None:
+            nonlocal current, used
+            if current:
+                windows.append("\n".join(current))
+            current, used = [], 0
+
+        for turn in turns:
+            lines = [self._format_segment(segment) for segment in turn]
+            costs = [estimate_tokens(line) + 1 for line in lines]
+            if current and used + sum(costs) > self.window_tokens:
+                flush()
+            for line, cost in zip(lines, costs):
+                if current and used + cost > self.window_tokens:
+                    flush()
+                current.append(line)
+                used += cost
+        flush()
+
+        return windows
 
-        return "\n".join(lines)
+    def _format_segment(self, segment: TranscriptSegment) -> str:
+        """Format one segment as a transcript line (timestamped when known)."""
+        if segment.start_time > 0:
+            timestamp = f"[{self._format_time(segment.start_time)}]"
+            return f"{timestamp} {segment.speaker}: {segment.text}"
+        return f"{segment.speaker}: {segment.text}"
 
     @staticmethod
     def _format_time(seconds: float) -> str:
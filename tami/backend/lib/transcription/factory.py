@@ -1,6 +1,6 @@
 """Factory for creating transcription providers."""
 
-from typing import Optional
+from typing import Any, Optional
 
 from lib.transcription.base import BaseTranscriber
 from lib.transcription.whisper import WhisperTranscriber
@@ -18,7 +18,8 @@ class TranscriberFactory:
     def create(
         provider: str,
         api_key: str,
-        model: Optional[str] = None
+        model: Optional[str] = None,
+        **options: Any
     ) -> BaseTranscriber:
         """Create a transcriber instance.
 
@@ -26,6 +27,7 @@ class TranscriberFactory:
             provider: Provider name ('whisper', 'ivrit', etc.)
             api_key: API key for the provider
             model: Optional model name
+            **options: Provider-specific options passed to the constructor
 
         Returns:
             Transcriber instance
@@ -41,7 +43,7 @@ class TranscriberFactory:
             )
 
         transcriber_class = TranscriberFactory.PROVIDERS[provider]
-        return transcriber_class(api_key=api_key, model=model)
+        return transcriber_class(api_key=api_key, model=model, **options)
 
     @staticmethod
     def register_provider(name: str, transcriber_class: type) -> None:
@@ -1,5 +1,6 @@
 """Ivrit transcription provider using RunPod serverless."""
 
+import asyncio
 from pathlib import Path
 from typing import List, Optional
 from loguru import logger
@@ -8,6 +9,7 @@ import ivrit
 from lib.transcription.base import BaseTranscriber
 from lib.utils.exceptions import APIError, APIAuthenticationError, ConfigurationError
 from lib.utils.models import TranscriptResult, TranscriptSegment
+from lib.utils.provider_scheduler import ProviderScheduler, is_retryable_submission, provider_scheduler
 
 
 class IvritTranscriber(BaseTranscriber):
@@ -17,7 +19,9 @@ class IvritTranscriber(BaseTranscriber):
         self,
         api_key: str,
         endpoint_id: str,
-        model: Optional[str] = "ivrit-ai/whisper-large-v3-turbo-ct2"
+        model: Optional[str] = "ivrit-ai/whisper-large-v3-turbo-ct2",
+        language: Optional[str] = "he",
+        scheduler: Optional[ProviderScheduler] = None
     ):
         """Initialize Ivrit transcriber.
 
@@ -25,11 +29,15 @@ class IvritTranscriber(BaseTranscriber):
             api_key: RunPod API key
             endpoint_id: RunPod endpoint ID
             model: Ivrit model name (default: whisper-large-v3-turbo-ct2)
+            language: Language code for transcription (default: "he" for Hebrew)
+            scheduler: Rate limiter and retry policy (default: the shared scheduler)
         """
         super().__init__(api_key, model)
         self.endpoint_id = endpoint_id
+        self.language = language or "he"  # Default to Hebrew if None
         self.ivrit_model = None
-        logger.info(f"Initialized Ivrit transcriber with model {model}")
+        self.scheduler = scheduler or provider_scheduler
+        logger.info(f"Initialized Ivrit transcriber with model {model}, language {self.language}")
 
     def _initialize_model(self):
         """Lazy-load the Ivrit model."""
@@ -71,13 +79,20 @@ class IvritTranscriber(BaseTranscriber):
         try:
             logger.info(f"Starting Ivrit transcription for {audio_path.name}")
 
-            # Transcribe with diarization enabled
-            result = self.ivrit_model.transcribe(
-                path=str(audio_path),
-                language="he",  # Hebrew
-                diarize=True,   # Enable speaker diarization
-                word_timestamps=False,  # Disable to reduce payload
-                extra_data=False  # Disable to reduce payload
+            # Transcribe with diarization enabled; the RunPod client blocks, so run it in a thread.
+            # Timeouts are not retried: the GPU job may still be running (and billed).
+            result = await self.scheduler.call(
+                "runpod",
+                lambda: asyncio.to_thread(
+                    self.ivrit_model.transcribe,
+                    path=str(audio_path),
+                    language=self.language,  # Use configured language
+                    diarize=True,   # Enable speaker diarization
+                    word_timestamps=False,  # Disable to reduce payload
+                    extra_data=False  # Disable to reduce payload
+                ),
+                key=self.api_key,
+                retryable=is_retryable_submission
             )
 
             logger.info(f"Transcription complete. Processing {len(result.get('segments', []))} segments")
@@ -98,8 +113,8 @@ class IvritTranscriber(BaseTranscriber):
                 )
                 segments.append(segment)
 
-            # Get detected language (should be Hebrew)
-            detected_language = result.get('language', 'he')
+            # Get detected language from result or use configured language
+            detected_language = result.get('language', self.language)
 
             logger.info(f"Successfully transcribed with {len(segments)} segments")
 
@@ -0,0 +1,320 @@
+"""Cache for deterministic-enough LLM calls (summaries, extraction, refinement).
+
+Responses are stored under a key built from the model, the prompt template
+name and version, and a hash of the full request (messages and sampling
+parameters), so bumping a template version or changing any input misses
+the cache. Storage is pluggable: ``MemoryCacheBackend`` (LRU in process),
+``DiskCacheBackend`` (one file per entry, shared by processes on a host),
+or any other ``CacheBackend`` such as the backend's Postgres table. Entries
+expire after a TTL and backends evict least recently used entries over a
+size budget.
+
+With ``deterministic=True`` every cached call runs at temperature 0 with a
+fixed seed, so a cached answer is also the answer a fresh call would give.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from loguru import logger
+
+from lib.utils.provider_scheduler import estimate_request_tokens, provider_scheduler
+
+
+DETERMINISTIC_SEED = 1234
+
+
+class CacheBackend:
+    """Storage for cached LLM responses."""
+
+    async def get(self, key: str) -> Optional[str]:
+        """Get a cached value, or None on a miss or after expiry."""
+        raise NotImplementedError
+
+    async def set(self, key: str, value: str, ttl: Optional[float]) -> None:
+        """Store a value for ``ttl`` seconds (None: until evicted)."""
+        raise NotImplementedError
+
+    async def delete(self, key: str) -> None:
+        """Remove a value if present."""
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU bounded by total value size."""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """Initialize memory backend.
+
+        Args:
+            max_bytes: Size budget for cached values (UTF-8 bytes)
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[str, Optional[float], int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    async def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at, _ = entry
+            if expires_at is not None and expires_at <= time.time():
+                self._pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    async def set(self, key: str, value: str, ttl: Optional[float]) -> None:
+        size = len(value.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (value, time.time() + ttl if ttl else None, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+
+    async def delete(self, key: str) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def _pop(self, key: str) -> None:
+        """Forget an entry. Caller must hold the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+
+class DiskCacheBackend(CacheBackend):
+    """One JSON file per entry; least recently read files are evicted first.
+
+    Reads refresh the file's modification time, which serves as the LRU
+    clock, so several processes can share the directory.
+    """
+
+    def __init__(self, directory: Optional[Path] = None, max_bytes: int = 512 * 1024 * 1024):
+        """Initialize disk backend.
+
+        Args:
+            directory: Cache directory (default: <system temp>/meeting-transcriber/llm-cache)
+            max_bytes: Size budget for cache files
+        """
+        self.directory = Path(directory or Path(tempfile.gettempdir()) / "meeting-transcriber" / "llm-cache")
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._writes_since_evict = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    async def get(self, key: str) -> Optional[str]:
+        return await asyncio.to_thread(self._read, key)
+
+    async def set(self, key: str, value: str, ttl: Optional[float]) -> None:
+        await asyncio.to_thread(self._write, key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def _read(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+
+        expires_at = data.get("expires_at")
+        if expires_at is not None and expires_at <= time.time():
+            path.unlink(missing_ok=True)
+            return None
+
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return data["value"]
+
+    def _write(self, key: str, value: str, ttl: Optional[float]) -> None:
+        payload = json.dumps({"expires_at": time.time() + ttl if ttl else None, "value": value})
+        partial = self.directory / f"{key}.{os.getpid()}.{threading.get_ident()}.partial"
+        partial.write_text(payload, encoding="utf-8")
+        partial.replace(self._path(key))
+
+        # Scanning the directory is cheap but not free; do it every few writes
+        self._writes_since_evict += 1
+        if self._writes_since_evict >= 16:
+            self._writes_since_evict = 0
+            self._evict()
+
+    def _evict(self) -> None:
+        """Delete least recently used files until under budget."""
+        files = []
+        total = 0
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+class LLMCache:
+    """Look up or compute LLM responses through a cache backend."""
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        ttl: Optional[float] = 30 * 24 * 3600,
+        deterministic: bool = False
+    ):
+        """Initialize LLM cache.
+
+        Args:
+            backend: Storage backend
+            ttl: Seconds a response stays valid (None: until evicted)
+            deterministic: Force temperature 0 and a fixed seed on cached calls
+        """
+        self.backend = backend
+        self.ttl = ttl
+        self.deterministic = deterministic
+        self._inflight: Dict[str, "asyncio.Future[str]"] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(template: str, version: str, request: Dict[str, Any]) -> str:
+        """Build a cache key for a request.
+
+        Args:
+            template: Prompt template name
+            version: Prompt template version
+            request: Request parameters (model, messages, sampling options)
+
+        Returns:
+            Key of the form ``<template>-v<version>-<model>-<sha256>``
+        """
+        digest = hashlib.sha256(json.dumps(request, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+        model = str(request.get("model", "")).replace("/", "_")
+        return f"{template}-v{version}-{model}-{digest.hexdigest()}"
+
+    async def get_or_call(
+        self,
+        key: str,
+        call: Callable[[], Awaitable[str]],
+        validate: Optional[Callable[[str], Any]] = None
+    ) -> str:
+        """Return the cached value for ``key`` or compute and store it.
+
+        Concurrent calls for the same key share one computation. Backend
+        errors are logged and treated as misses.
+
+        Args:
+            key: Cache key (see make_key)
+            call: Computes the value on a miss
+            validate: Raises if a value must not be cached (e.g. invalid JSON);
+                the error propagates to the caller
+
+        Returns:
+            Cached or freshly computed value
+        """
+        try:
+            cached = await self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"LLM cache read failed: {e}")
+            cached = None
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        self.misses += 1
+        future: "asyncio.Future[str]" = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await call()
+            if validate is not None:
+                validate(value)
+            try:
+                await self.backend.set(key, value, self.ttl)
+            except Exception as e:
+                logger.warning(f"LLM cache write failed: {e}")
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited future doesn't log a warning
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Get hit/miss counters."""
+        return {"hits": self.hits, "misses": self.misses}
+
+
+async def cached_completion(
+    client,
+    cache: Optional[LLMCache],
+    template: str,
+    version: str,
+    validate: Optional[Callable[[str], Any]] = None,
+    **request: Any
+) -> str:
+    """Run a chat completion through the cache and return its message text.
+
+    Args:
+        client: AsyncOpenAI client
+        cache: LLM cache (None: call the API directly)
+        template: Prompt template name
+        version: Prompt template version
+        validate: Raises if a response must not be cached
+        **request: Arguments for ``client.chat.completions.create``
+
+    Returns:
+        Assistant message content
+    """
+    if cache is not None and cache.deterministic:
+        request["temperature"] = 0
+        request["seed"] = DETERMINISTIC_SEED
+
+    async def call() -> str:
+        response = await provider_scheduler.call(
+            "openai",
+            lambda: client.chat.completions.create(**request),
+            tokens=estimate_request_tokens(request.get("messages", []), request.get("max_tokens")),
+            key=client.api_key
+        )
+        return response.choices[0].message.content or ""
+
+    if cache is None:
+        content = await call()
+        if validate is not None:
+            validate(content)
+        return content
+
+    return await cache.get_or_call(cache.make_key(template, version, request), call, validate)
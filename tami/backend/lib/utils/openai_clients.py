@@ -0,0 +1,240 @@
+"""Process-wide pool of OpenAI clients.
+
+Creating ``AsyncOpenAI`` per request gives every call a fresh connection
+pool and TLS handshake. The registry keeps one client per (API key, base
+URL) on a shared, tuned ``httpx.AsyncClient`` with keep-alive connections
+and HTTP/2 when the ``h2`` package is installed. Connection reuse is
+tracked through httpcore trace events: ``stats()`` reports requests sent,
+connections opened and the share of requests served by an existing
+connection.
+
+Each distinct API key gets its own client and connection pool, so the
+registry is bounded: clients unused for ``idle_client_ttl`` seconds, and the
+least recently used ones beyond ``max_clients``, are evicted and closed.
+A client counts as used whenever it is fetched or sends a request.
+
+Call ``configure`` before the first client is created to change pool
+limits, and ``aclose`` on shutdown.
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import httpx
+from loguru import logger
+from openai import AsyncOpenAI
+
+try:
+    import h2  # noqa: F401  (enables httpx HTTP/2)
+    HTTP2_AVAILABLE = True
+except (ImportError, ModuleNotFoundError):
+    HTTP2_AVAILABLE = False
+
+
+class OpenAIClientRegistry:
+    """Shared AsyncOpenAI clients keyed by API key and base URL."""
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 60.0,
+        http2: bool = True,
+        timeout: float = 600.0,
+        max_clients: int = 256,
+        idle_client_ttl: float = 900.0
+    ):
+        """Initialize registry.
+
+        Args:
+            max_connections: Connections per client pool
+            max_keepalive_connections: Idle connections kept open per pool
+            keepalive_expiry: Seconds an idle connection stays open
+            http2: Use HTTP/2 when the h2 package is installed
+            timeout: Request timeout in seconds (long for audio uploads)
+            max_clients: Clients kept before the least recently used is evicted
+            idle_client_ttl: Seconds an unused client is kept (0: no limit)
+        """
+        # (api_key, base_url) -> (client, last used), least recently used first
+        self._clients: "OrderedDict[Tuple[str, Optional[str]], Tuple[AsyncOpenAI, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._closing: Set[asyncio.Task] = set()
+        self.requests = 0
+        self.connections_opened = 0
+        self.evictions = 0
+        self.configure(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            timeout=timeout,
+            max_clients=max_clients,
+            idle_client_ttl=idle_client_ttl
+        )
+
+    def configure(
+        self,
+        max_connections: int,
+        max_keepalive_connections: int,
+        keepalive_expiry: float,
+        http2: bool,
+        timeout: float = 600.0,
+        max_clients: int = 256,
+        idle_client_ttl: float = 900.0
+    ) -> None:
+        """Set pool options for clients created from now on.
+
+        Args:
+            max_connections: Connections per client pool
+            max_keepalive_connections: Idle connections kept open per pool
+            keepalive_expiry: Seconds an idle connection stays open
+            http2: Use HTTP/2 when the h2 package is installed
+            timeout: Request timeout in seconds
+            max_clients: Clients kept before the least recently used is evicted
+            idle_client_ttl: Seconds an unused client is kept (0: no limit)
+        """
+        if http2 and not HTTP2_AVAILABLE:
+            logger.debug("h2 not installed; OpenAI clients use HTTP/1.1 keep-alive")
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.timeout = timeout
+        self.max_clients = max(1, max_clients)
+        self.idle_client_ttl = idle_client_ttl
+
+    def get(self, api_key: str, base_url: Optional[str] = None) -> AsyncOpenAI:
+        """Get the shared client for an API key and base URL.
+
+        Args:
+            api_key: OpenAI API key
+            base_url: API base URL (None: OpenAI default)
+
+        Returns:
+            Shared AsyncOpenAI client
+        """
+        key = (api_key, base_url)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._clients.pop(key, None)
+            client = entry[0] if entry else None
+            if client is None:
+                client = AsyncOpenAI(
+                    api_key=api_key,
+                    base_url=base_url,
+                    max_retries=0,  # Retries go through the provider scheduler
+                    http_client=httpx.AsyncClient(
+                        http2=self.http2,
+                        limits=self.limits,
+                        timeout=self.timeout,
+                        event_hooks={"request": [functools.partial(self._on_request, key)]}
+                    )
+                )
+            self._clients[key] = (client, now)
+            evicted = self._evict_locked(now)
+
+        if evicted:
+            self._close_evicted(evicted)
+        return client
+
+    def _evict_locked(self, now: float) -> List[AsyncOpenAI]:
+        """Remove idle clients and the least recently used beyond max_clients.
+
+        Must be called with the lock held.
+
+        Returns:
+            Removed clients, to be closed
+        """
+        evicted = []
+        while self._clients:
+            key, (client, last_used) = next(iter(self._clients.items()))
+            expired = self.idle_client_ttl > 0 and now - last_used > self.idle_client_ttl
+            if not expired and len(self._clients) <= self.max_clients:
+                break
+            del self._clients[key]
+            evicted.append(client)
+        self.evictions += len(evicted)
+        return evicted
+
+    def _close_evicted(self, clients: List[AsyncOpenAI]) -> None:
+        """Close evicted clients in the background on the running event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.debug(f"No event loop to close {len(clients)} evicted OpenAI client(s)")
+            return
+
+        for client in clients:
+            task = loop.create_task(self._close_client(client))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+        logger.debug(f"Evicted {len(clients)} OpenAI client(s)")
+
+    @staticmethod
+    async def _close_client(client: AsyncOpenAI) -> None:
+        """Close a client and its connection pool, logging failures."""
+        try:
+            await client.close()
+        except Exception as e:
+            logger.warning(f"Failed to close OpenAI client: {e}")
+
+    async def aclose(self) -> None:
+        """Close every client and its connection pool."""
+        with self._lock:
+            clients = [client for client, _ in self._clients.values()]
+            self._clients.clear()
+
+        for client in clients:
+            await self._close_client(client)
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+
+        if clients:
+            logger.info(f"Closed {len(clients)} OpenAI client(s); {self.stats()}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get pool statistics.
+
+        Returns:
+            Client count, evictions, requests sent, connections opened and
+            reuse ratio
+        """
+        reused = max(0, self.requests - self.connections_opened)
+        return {
+            "clients": len(self._clients),
+            "evictions": self.evictions,
+            "http2": self.http2,
+            "requests": self.requests,
+            "connections_opened": self.connections_opened,
+            "connection_reuse_ratio": round(reused / self.requests, 3) if self.requests else 0.0
+        }
+
+    async def _on_request(self, key: Tuple[str, Optional[str]], request: httpx.Request) -> None:
+        """Count the request, mark its client used and trace new connections."""
+        self.requests += 1
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry is not None:
+                self._clients[key] = (entry[0], time.monotonic())
+                self._clients.move_to_end(key)
+        request.extensions["trace"] = self._trace
+
+    async def _trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        """httpcore trace callback: count new TCP connections."""
+        if event_name == "connection.connect_tcp.complete":
+            self.connections_opened += 1
+
+
+# Singleton instance
+openai_clients = OpenAIClientRegistry()
+
+
+def get_openai_client(api_key: str, base_url: Optional[str] = None) -> AsyncOpenAI:
+    """Get the process-wide client for an API key (see OpenAIClientRegistry.get)."""
+    return openai_clients.get(api_key, base_url)
@@ -0,0 +1,389 @@
+"""Rate limiting and retries for provider API calls (OpenAI, RunPod).
+
+Every call goes through ``ProviderScheduler.call``, which
+
+- waits for the provider's token buckets: requests per minute and, for LLM
+  calls, estimated tokens per minute (one pair of buckets per provider and
+  API key, since limits apply per account);
+- retries rate limits (429), server errors and transport errors with
+  exponential backoff and jitter, honouring ``Retry-After`` /
+  ``retry-after-ms`` when the provider sends one. A 429 also pauses every
+  queued call for the same account until the retry time, so a burst of
+  concurrent requests backs off together instead of each hitting the limit.
+  Calls that must not run twice (RunPod jobs) retry only 429s and
+  connection failures, never timeouts;
+- records per-provider metrics: calls, retries, rate limits, failures and
+  time spent queued (see ``stats``).
+
+Limits are per process. With several API processes or workers sharing one
+account, give each a share of the account's limits.
+"""
+
+import asyncio
+import email.utils
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+
+CHARS_PER_TOKEN = 3  # Same rough estimate as src.chat.retrieval.estimate_tokens
+
+# Statuses worth retrying; 429 is retried unless the account is out of quota
+RETRYABLE_STATUSES = {408, 409, 429, 500, 502, 503, 504}
+
+
+def _transient_error_types() -> Tuple[type, ...]:
+    """Connection and timeout errors of the HTTP libraries in use."""
+    types = [ConnectionError, TimeoutError, asyncio.TimeoutError]
+    try:
+        import httpx
+        types.append(httpx.TransportError)
+    except ImportError:
+        pass
+    try:
+        import openai
+        types.append(openai.APIConnectionError)  # Includes APITimeoutError
+    except ImportError:
+        pass
+    try:
+        import requests  # Used by the RunPod client
+        types.extend([requests.ConnectionError, requests.Timeout])
+    except ImportError:
+        pass
+    return tuple(types)
+
+
+TRANSIENT_ERRORS = _transient_error_types()
+
+
+def _connect_error_types() -> Tuple[type, ...]:
+    """Errors raised before a request reached the provider (no read timeouts)."""
+    types = [ConnectionError]
+    try:
+        import httpx
+        types.extend([httpx.ConnectError, httpx.ConnectTimeout])
+    except ImportError:
+        pass
+    try:
+        import requests
+        types.append(requests.ConnectionError)
+    except ImportError:
+        pass
+    return tuple(types)
+
+
+CONNECT_ERRORS = _connect_error_types()
+
+
+def error_status(error: BaseException) -> Optional[int]:
+    """HTTP status of a provider error, if any (OpenAI and requests errors)."""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """Seconds to wait according to the error response's headers, if given.
+
+    Args:
+        error: Provider error
+
+    Returns:
+        Delay from ``retry-after-ms`` or ``retry-after`` (seconds or HTTP date)
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+
+    try:
+        value = headers.get("retry-after-ms")
+        if value is not None:
+            return max(0.0, float(value) / 1000)
+
+        value = headers.get("retry-after")
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            retry_at = email.utils.parsedate_to_datetime(value)
+            return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether a failed provider call may succeed if repeated."""
+    if getattr(error, "code", None) == "insufficient_quota":
+        return False
+    status = error_status(error)
+    if status is not None:
+        return status in RETRYABLE_STATUSES
+    return isinstance(error, TRANSIENT_ERRORS)
+
+
+def is_retryable_submission(error: BaseException) -> bool:
+    """Whether a failed call certainly started no work and may be resubmitted.
+
+    For long-running jobs (e.g. a RunPod transcription), a timeout can mean
+    the job is still running and billed, so only rate limits and connection
+    failures are retried.
+    """
+    if getattr(error, "code", None) == "insufficient_quota":
+        return False
+    if error_status(error) is not None:
+        return error_status(error) == 429
+    return isinstance(error, CONNECT_ERRORS)
+
+
+def estimate_request_tokens(messages: Iterable[Dict[str, Any]], max_tokens: Optional[int] = None) -> int:
+    """Estimate the tokens a chat completion counts against a TPM limit.
+
+    Providers count the prompt plus the requested completion budget.
+
+    Args:
+        messages: Chat messages
+        max_tokens: Completion token limit of the request
+
+    Returns:
+        Estimated token count
+    """
+    chars = sum(len(str(message.get("content") or "")) for message in messages)
+    return chars // CHARS_PER_TOKEN + (max_tokens or 0)
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a per-minute rate.
+
+    Callers reserve tokens up front and sleep until the balance covers them,
+    so waiters are served in arrival order and a request larger than the
+    burst size still goes through, just later.
+    """
+
+    def __init__(self, per_minute: float, burst_seconds: float = 10.0):
+        """Initialize token bucket.
+
+        Args:
+            per_minute: Tokens added per minute
+            burst_seconds: Seconds of refill the bucket holds when idle
+        """
+        self.rate = per_minute / 60
+        self.capacity = max(1.0, self.rate * burst_seconds)
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+
+    async def acquire(self, amount: float = 1) -> None:
+        """Take tokens, waiting until they are available."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self.tokens -= amount
+        if self.tokens >= 0:
+            return
+
+        try:
+            await asyncio.sleep(-self.tokens / self.rate)
+        except asyncio.CancelledError:
+            self.tokens += amount
+            raise
+
+
+@dataclass
+class ProviderLimits:
+    """Rate limits of one provider account (None: unlimited)."""
+    requests_per_minute: Optional[float] = None
+    tokens_per_minute: Optional[float] = None
+
+
+@dataclass
+class _Account:
+    """Buckets and backoff state of one provider account."""
+    requests: Optional[TokenBucket]
+    tokens: Optional[TokenBucket]
+    paused_until: float = 0.0
+
+
+@dataclass
+class ProviderStats:
+    """Counters for one provider."""
+    calls: int = 0
+    retries: int = 0
+    rate_limited: int = 0
+    failures: int = 0
+    queued: int = 0
+    queue_wait_total: float = 0.0
+    queue_wait_max: float = 0.0
+    accounts: Dict[str, _Account] = field(default_factory=dict)
+
+
+class ProviderScheduler:
+    """Shared rate limiter and retry policy for provider calls."""
+
+    def __init__(self, max_retries: int = 4, base_delay: float = 1.0, max_delay: float = 60.0):
+        """Initialize scheduler.
+
+        Args:
+            max_retries: Retries after the first attempt
+            base_delay: First backoff delay in seconds, doubled per retry
+            max_delay: Longest backoff; a longer Retry-After gives up instead
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.limits: Dict[str, ProviderLimits] = {}
+        self._providers: Dict[str, ProviderStats] = {}
+
+    def configure_retries(self, max_retries: int, base_delay: float, max_delay: float) -> None:
+        """Set the retry policy (see __init__)."""
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def set_limits(
+        self,
+        provider: str,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None
+    ) -> None:
+        """Set a provider's per-account limits (None or 0: unlimited).
+
+        Args:
+            provider: Provider name (e.g. "openai", "runpod")
+            requests_per_minute: Requests per minute
+            tokens_per_minute: Estimated tokens per minute
+        """
+        self.limits[provider] = ProviderLimits(requests_per_minute or None, tokens_per_minute or None)
+        self._stats(provider).accounts.clear()
+
+    async def call(
+        self,
+        provider: str,
+        fn: Callable[[], Awaitable[T]],
+        tokens: int = 0,
+        key: Optional[str] = None,
+        retryable: Callable[[BaseException], bool] = is_retryable
+    ) -> T:
+        """Run a provider call under the provider's limits, retrying transient failures.
+
+        Args:
+            provider: Provider name (e.g. "openai", "runpod")
+            fn: Makes the call; invoked again on each retry
+            tokens: Estimated tokens the call counts against the TPM limit
+            key: Account the limits apply to, usually the API key
+            retryable: Decides which errors are retried (default: ``is_retryable``;
+                use ``is_retryable_submission`` for calls that must not run twice)
+
+        Returns:
+            Result of ``fn``
+
+        Raises:
+            Exception: The last error, once it is not retryable or retries are exhausted
+        """
+        stats = self._stats(provider)
+        account = self._account(provider, key)
+        attempt = 0
+
+        while True:
+            await self._wait_turn(stats, account, tokens)
+            stats.calls += 1
+            try:
+                return await fn()
+            except Exception as e:
+                delay = self._retry_delay(e, attempt, retryable)
+                if error_status(e) == 429:
+                    stats.rate_limited += 1
+                    if delay is not None:
+                        account.paused_until = max(account.paused_until, time.monotonic() + delay)
+
+                if delay is None:
+                    stats.failures += 1
+                    raise
+
+                attempt += 1
+                stats.retries += 1
+                logger.warning(
+                    f"{provider} call failed ({e.__class__.__name__}: {e}); "
+                    f"retry {attempt}/{self.max_retries} in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-provider call, retry and queue wait metrics.
+
+        Returns:
+            Metrics keyed by provider name
+        """
+        return {
+            provider: {
+                "calls": stats.calls,
+                "retries": stats.retries,
+                "rate_limited": stats.rate_limited,
+                "failures": stats.failures,
+                "queued": stats.queued,
+                "queue_wait_avg": round(stats.queue_wait_total / stats.calls, 3) if stats.calls else 0.0,
+                "queue_wait_max": round(stats.queue_wait_max, 3)
+            }
+            for provider, stats in self._providers.items()
+        }
+
+    async def _wait_turn(self, stats: ProviderStats, account: _Account, tokens: int) -> None:
+        """Wait out any 429 pause and the account's buckets, recording the wait."""
+        started = time.monotonic()
+        stats.queued += 1
+        try:
+            while account.paused_until > time.monotonic():
+                await asyncio.sleep(account.paused_until - time.monotonic())
+            if account.requests is not None:
+                await account.requests.acquire(1)
+            if account.tokens is not None and tokens:
+                await account.tokens.acquire(tokens)
+        finally:
+            stats.queued -= 1
+
+        waited = time.monotonic() - started
+        stats.queue_wait_total += waited
+        stats.queue_wait_max = max(stats.queue_wait_max, waited)
+
+    def _retry_delay(
+        self,
+        error: Exception,
+        attempt: int,
+        retryable: Callable[[BaseException], bool]
+    ) -> Optional[float]:
+        """Seconds to wait before retrying, or None to give up."""
+        if attempt >= self.max_retries or not retryable(error):
+            return None
+
+        delay = retry_after(error)
+        if delay is not None:
+            return delay if delay <= self.max_delay else None
+
+        # Exponential backoff with jitter so concurrent retries spread out
+        backoff = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(backoff / 2, backoff)
+
+    def _stats(self, provider: str) -> ProviderStats:
+        if provider not in self._providers:
+            self._providers[provider] = ProviderStats()
+        return self._providers[provider]
+
+    def _account(self, provider: str, key: Optional[str]) -> _Account:
+        accounts = self._stats(provider).accounts
+        account = accounts.get(key or "")
+        if account is None:
+            limits = self.limits.get(provider, ProviderLimits())
+            account = _Account(
+                requests=TokenBucket(limits.requests_per_minute) if limits.requests_per_minute else None,
+                tokens=TokenBucket(limits.tokens_per_minute) if limits.tokens_per_minute else None
+            )
+            accounts[key or ""] = account
+        return account
+
+
+# Singleton instance
+provider_scheduler = ProviderScheduler()
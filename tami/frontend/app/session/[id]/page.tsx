@@ -12,11 +12,13 @@ import { Tabs, TabsContent, TabsList, TabsTrigger } from "@/components/ui/tabs";
 import { Slider } from "@/components/ui/slider";
 import {
   getTranscriptionStatus,
+  getTranscriptSegments,
+  subscribeTranscriptionStatus,
   updateSummary,
   createActionItem,
   updateActionItem,
   deleteActionItem,
-  sendChatMessage,
+  streamChatMessage,
   getSessionEntities,
   getSessionTags,
   type Entity,
@@ -57,6 +59,8 @@ interface SessionStatus {
   context?: string;
   title?: string;
   error?: string;
+  stage?: string;
+  progress?: number;
   transcript?: {
     segments: Array<{
       speakerId: string;
@@ -106,6 +110,8 @@ const SPEAKER_COLORS = [
   "bg-pink-50 border-pink-200",
 ];
 
+const SEGMENT_PAGE_SIZE = 500;
+
 export default function SessionPage() {
   return (
     <Suspense fallback={<SessionLoading />}>
@@ -173,15 +179,75 @@ function SessionContent() {
   useEffect(() => {
     if (!sessionId) return;
 
+    let cancelled = false;
+    let unsubscribe: (() => void) | undefined;
+    let pollTimer: ReturnType<typeof setTimeout> | undefined;
+
+    const isRunning = (status: string) => status === "processing" || status === "pending";
+
+    // Fallback when the event stream is unavailable: lightweight polling
+    const pollStatus = async () => {
+      try {
+        const status = await getTranscriptionStatus(sessionId, { lightweight: true });
+        if (cancelled) return;
+        if (isRunning(status.status)) {
+          setSession((prev) => (prev ? { ...prev, ...status } : status));
+          pollTimer = setTimeout(pollStatus, 3000);
+        } else {
+          fetchStatus();
+        }
+      } catch {
+        if (!cancelled) pollTimer = setTimeout(pollStatus, 3000);
+      }
+    };
+
+    const watchStatus = () => {
+      unsubscribe = subscribeTranscriptionStatus(
+        sessionId,
+        (status) => {
+          if (cancelled) return;
+          if (isRunning(status.status)) {
+            setSession((prev) => (prev ? { ...prev, ...status } : status));
+          } else {
+            // Finished: load the full transcript and summary once
+            unsubscribe?.();
+            fetchStatus();
+          }
+        },
+        () => {
+          if (!cancelled) pollStatus();
+        }
+      );
+    };
+
+    // Load the transcript page by page so long meetings render progressively
+    const loadSegments = async () => {
+      let cursor: number | undefined;
+      do {
+        const page = await getTranscriptSegments(sessionId, { cursor, limit: SEGMENT_PAGE_SIZE });
+        if (cancelled) return;
+        setSession((prev) =>
+          prev?.transcript
+            ? { ...prev, transcript: { ...prev.transcript, segments: [...prev.transcript.segments, ...page.segments] } }
+            : prev
+        );
+        cursor = page.nextCursor ?? undefined;
+      } while (cursor !== undefined);
+    };
+
     const fetchStatus = async () => {
       try {
-        const status = await getTranscriptionStatus(sessionId);
+        const status = await getTranscriptionStatus(sessionId, { includeSegments: false });
+        if (cancelled) return;
         setSession(status);
         setLoading(false);
 
-        if (status.status === "processing" || status.status === "pending") {
-          setTimeout(fetchStatus, 3000);
+        if (isRunning(status.status)) {
+          watchStatus();
         } else if (status.status === "completed") {
+          if (status.transcript) {
+            loadSegments().catch((err) => console.error("Failed to load transcript segments:", err));
+          }
           // Fetch entities and tags
           try {
             const [entitiesData, tagsData] = await Promise.all([
@@ -201,6 +267,12 @@ function SessionContent() {
     };
 
     fetchStatus();
+
+    return () => {
+      cancelled = true;
+      unsubscribe?.();
+      if (pollTimer) clearTimeout(pollTimer);
+    };
   }, [sessionId]);
 
   // Scroll chat to bottom
@@ -369,14 +441,20 @@ function SessionContent() {
     setChatMessages((prev) => [...prev, { role: "user", content: userMessage }]);
     setIsSending(true);
 
+    // Append the assistant message as it streams in (the last message is the reply)
+    const setReply = (content: string) =>
+      setChatMessages((prev) => [...prev.slice(0, -1), { role: "assistant", content }]);
+    setChatMessages((prev) => [...prev, { role: "assistant", content: "" }]);
+
     try {
-      const response = await sendChatMessage(sessionId, userMessage);
-      setChatMessages((prev) => [...prev, { role: "assistant", content: response.content }]);
+      let reply = "";
+      const response = await streamChatMessage(sessionId, userMessage, (text) => {
+        reply += text;
+        setReply(reply);
+      });
+      setReply(response.content);
     } catch (error) {
-      setChatMessages((prev) => [
-        ...prev,
-        { role: "assistant", content: "שגיאה בקבלת תשובה. נסה שוב." },
-      ]);
+      setReply("שגיאה בקבלת תשובה. נסה שוב.");
     } finally {
       setIsSending(false);
     }
@@ -426,6 +504,9 @@ function SessionContent() {
           <h2 className="text-lg font-semibold mb-2">מעבד את השיחה...</h2>
           <p className="text-muted-foreground mb-2">התמלול והסיכום יהיו מוכנים בקרוב</p>
           <p className="text-xs text-muted-foreground">זה עשוי לקחת מספר דקות</p>
+          {session.progress !== undefined && session.progress > 0 && (
+            <p className="text-xs text-muted-foreground mt-2">{Math.round(session.progress * 100)}%</p>
+          )}
         </Card>
       </AppLayout>
     );
@@ -783,7 +864,7 @@ function SessionContent() {
                       </p>
                     </div>
                   )}
-                  {chatMessages.map((msg, idx) => (
+                  {chatMessages.map((msg, idx) => msg.content && (
                     <div
                       key={idx}
                       className={cn(
@@ -796,7 +877,7 @@ function SessionContent() {
                       <p className="text-sm leading-relaxed">{msg.content}</p>
                     </div>
                   ))}
-                  {isSending && (
+                  {isSending && !chatMessages[chatMessages.length - 1]?.content && (
                     <div className="bg-muted rounded-lg p-3 max-w-[85%] ml-auto">
                       <div className="flex gap-1">
                         <div className="w-2 h-2 bg-muted-foreground rounded-full animate-bounce" />
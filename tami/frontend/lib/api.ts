@@ -67,6 +67,10 @@ export interface TranscriptionStatusResponse {
   status: "pending" | "processing" | "completed" | "failed";
   audioFileName?: string;
   audioFileUrl?: string;
+  detectedLanguage?: string;
+  stage?: string;  // Pipeline stage currently running
+  progress?: number;  // 0-1, fraction of pipeline stages completed
+  stageTimings?: Record<string, number>;  // Seconds per completed stage
   transcript?: Transcript;
   summary?: Summary;
   error?: string;
@@ -235,24 +239,71 @@ export async function startTranscription(
 
 /**
  * Get transcription status
+ * lightweight: only status and progress, without transcript and summary
+ * includeSegments: false returns the transcript without segments (use getTranscriptSegments)
  */
 export async function getTranscriptionStatus(
-  sessionId: string
+  sessionId: string,
+  options?: { lightweight?: boolean; includeSegments?: boolean }
 ): Promise<TranscriptionStatusResponse> {
+  const params: Record<string, boolean> = {};
+  if (options?.lightweight) params.lightweight = true;
+  if (options?.includeSegments === false) params.includeSegments = false;
+
   const response = await apiClient.get<TranscriptionStatusResponse>(
-    `/api/transcribe/${sessionId}/status`
+    `/api/transcribe/${sessionId}/status`,
+    { params }
   );
   return response.data;
 }
 
 /**
- * List sessions
+ * Get one page of transcript segments, in order
+ * Pass the returned nextCursor as cursor to get the next page (null on the last page).
+ */
+export async function getTranscriptSegments(
+  sessionId: string,
+  params?: { cursor?: number; limit?: number; startTime?: number; endTime?: number }
+): Promise<{ segments: TranscriptSegment[]; nextCursor: number | null }> {
+  const response = await apiClient.get(`/api/sessions/${sessionId}/segments`, { params });
+  return response.data;
+}
+
+/**
+ * Subscribe to transcription status changes (Server-Sent Events)
+ * The stream closes by itself once the session completes or fails.
+ * Returns an unsubscribe function.
+ */
+export function subscribeTranscriptionStatus(
+  sessionId: string,
+  onUpdate: (status: TranscriptionStatusResponse) => void,
+  onError?: () => void
+): () => void {
+  const source = new EventSource(`${API_BASE_URL}/api/transcribe/${sessionId}/events`);
+
+  source.addEventListener("status", (event) => {
+    onUpdate(JSON.parse((event as MessageEvent).data));
+  });
+  source.addEventListener("end", () => source.close());
+  source.onerror = () => {
+    // Don't let EventSource reconnect forever; the caller falls back to polling
+    source.close();
+    onError?.();
+  };
+
+  return () => source.close();
+}
+
+/**
+ * List sessions (newest first)
+ * Pass the returned nextCursor as cursor to get the next page (null on the last page).
  */
 export async function listSessions(params?: {
   userId?: string;
   page?: number;
   pageSize?: number;
-}): Promise<{ sessions: Session[]; total: number; page: number; pageSize: number }> {
+  cursor?: string;
+}): Promise<{ sessions: Session[]; total: number; page: number; pageSize: number; nextCursor: string | null }> {
   // Add userId for dev mode if not provided
   const userId = params?.userId || await getCurrentUserId();
   const response = await apiClient.get("/api/sessions", { params: { ...params, userId } });
@@ -309,6 +360,67 @@ export async function sendChatMessage(
   return response.data;
 }
 
+/**
+ * Send chat message and stream the answer
+ * onToken receives text as the model generates it; resolves with the saved assistant message.
+ */
+export async function streamChatMessage(
+  sessionId: string,
+  message: string,
+  onToken: (text: string) => void
+): Promise<ChatMessage> {
+  const headers: Record<string, string> = { "Content-Type": "application/json" };
+  if (!IS_DEV) {
+    const { data: { session } } = await supabase.auth.getSession();
+    if (session?.access_token) {
+      headers.Authorization = `Bearer ${session.access_token}`;
+    }
+  }
+
+  const response = await fetch(`${API_BASE_URL}/api/chat/stream`, {
+    method: "POST",
+    headers,
+    body: JSON.stringify({ sessionId, message }),
+  });
+  if (!response.ok || !response.body) {
+    throw new Error(`Chat failed: ${response.status}`);
+  }
+
+  // Parse Server-Sent Events: "event: <name>\ndata: <json>\n\n"
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    let boundary;
+    while ((boundary = buffer.indexOf("\n\n")) !== -1) {
+      const rawEvent = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+
+      let event = "message";
+      let data = "";
+      for (const line of rawEvent.split("\n")) {
+        if (line.startsWith("event: ")) event = line.slice(7);
+        else if (line.startsWith("data: ")) data += line.slice(6);
+      }
+
+      if (event === "token") {
+        onToken(JSON.parse(data).content);
+      } else if (event === "message") {
+        return JSON.parse(data);
+      } else if (event === "error") {
+        throw new Error(JSON.parse(data).detail);
+      }
+    }
+  }
+
+  throw new Error("Chat stream ended unexpectedly");
+}
+
 /**
  * Get chat history
  */
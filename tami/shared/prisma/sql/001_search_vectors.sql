@@ -0,0 +1,33 @@
+-- Full-text search columns for Session and TranscriptSegment.
+--
+-- Prisma cannot declare generated columns, so schema.prisma only declares
+-- "searchVector" as Unsupported("tsvector") with a GIN index (which keeps
+-- `prisma db push` from dropping it). Run this file after `prisma db push`
+-- to turn both columns into generated ones; it is safe to re-run.
+--
+--   psql "$DATABASE_URL" -f ../shared/prisma/sql/001_search_vectors.sql   (from tami/backend)
+--
+-- The 'simple' configuration is used because Hebrew has no stemming
+-- dictionary in stock PostgreSQL; it lowercases and splits on word
+-- boundaries for every language.
+
+BEGIN;
+
+-- Session: title weighted above the meeting context
+DROP INDEX IF EXISTS "Session_searchVector_idx";
+ALTER TABLE "Session" DROP COLUMN IF EXISTS "searchVector";
+ALTER TABLE "Session" ADD COLUMN "searchVector" tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce("title", '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce("context", '')), 'B')
+    ) STORED;
+CREATE INDEX "Session_searchVector_idx" ON "Session" USING GIN ("searchVector");
+
+-- TranscriptSegment: segment text
+DROP INDEX IF EXISTS "TranscriptSegment_searchVector_idx";
+ALTER TABLE "TranscriptSegment" DROP COLUMN IF EXISTS "searchVector";
+ALTER TABLE "TranscriptSegment" ADD COLUMN "searchVector" tsvector
+    GENERATED ALWAYS AS (to_tsvector('simple', coalesce("text", ''))) STORED;
+CREATE INDEX "TranscriptSegment_searchVector_idx" ON "TranscriptSegment" USING GIN ("searchVector");
+
+COMMIT;
@@ -0,0 +1,40 @@
+"""Tests for bounded conversation memory."""
+
+from src.chat.memory import ConversationMemory
+
+
+def _conversation(turns):
+    messages = []
+    for i in range(1, turns + 1):
+        messages.append({"role": "user", "content": f"question {i}"})
+        messages.append({"role": "assistant", "content": f"answer {i}"})
+    return messages
+
+
+def test_first_message_is_sent_or_summarized_after_nine_turns():
+    memory = ConversationMemory()
+    messages = _conversation(9)
+    messages.append({"role": "user", "content": "question 10"})
+
+    older, recent = memory.split_for_compaction(messages)
+    request = memory.window(recent)
+
+    first = messages[0]
+    assert first in older or first in request
+
+
+def test_window_keeps_unsummarized_messages_within_budget():
+    memory = ConversationMemory()
+    messages = _conversation(9)
+
+    assert memory.window(messages) == messages
+
+
+def test_window_drops_oldest_messages_over_budget():
+    memory = ConversationMemory(token_budget=30)
+    messages = _conversation(9)
+
+    request = memory.window(messages)
+
+    assert request[-1] == messages[-1]
+    assert len(request) < len(messages)